@@ -10,7 +10,7 @@ from typing import Iterable, Sequence
 
 import pandas as pd
 from kitchen.lab_paths import data_path
-from playground.backend.app.services.data_store import data_store_context
+from playground.backend.app.services.data_store import data_store_context, iter_pages
 
 DEFAULT_COLUMN_ORDER = [
     "id",
@@ -21,7 +21,7 @@ DEFAULT_COLUMN_ORDER = [
     "latency_ms",
     "created_at",
 ]
-FALLBACK_DATASTORE_LIMIT = 250
+DATASTORE_PAGE_SIZE = 500
 
 
 def load_interactions(
@@ -57,23 +57,20 @@ def _load_interactions_from_sqlite(path: Path) -> pd.DataFrame:
 
 def _load_interactions_from_data_store(limit: int | None = None) -> pd.DataFrame:
     with data_store_context() as store:
-        target_limit = _resolve_limit(store, limit)
-        if target_limit <= 0:
-            return pd.DataFrame(columns=DEFAULT_COLUMN_ORDER)
-        records = store.list_interactions(limit=target_limit)
+        if limit is not None:
+            target_limit = max(int(limit), 0)
+            records = store.list_interactions(limit=target_limit) if target_limit else []
+        else:
+            # Walk keyset pages instead of sizing one query from a separate COUNT,
+            # which raced concurrent writes and truncated to a fallback on error.
+            records = [
+                record
+                for page in iter_pages(store.list_interactions, page_size=DATASTORE_PAGE_SIZE)
+                for record in page
+            ]
     return _records_to_frame(records)
 
 
-def _resolve_limit(store, limit: int | None) -> int:
-    if limit is not None:
-        return max(int(limit), 0)
-    try:
-        count = int(store.count_interactions())
-    except Exception:
-        return FALLBACK_DATASTORE_LIMIT
-    return max(count, 0)
-
-
 def _records_to_frame(records: Sequence) -> pd.DataFrame:
     rows = [
         {
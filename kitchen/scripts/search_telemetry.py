@@ -16,6 +16,7 @@ DEFAULT_SUMMARY_PATH = ledger.DEFAULT_SUMMARY_PATH
 DEFAULT_PRESET_TAGS_PATH = ledger.DEFAULT_PRESET_TAGS
 DEFAULT_RUNS_PARQUET_PATH = ledger.DEFAULT_RUNS_PARQUET_PATH
 DEFAULT_DAILY_PARQUET_PATH = ledger.DEFAULT_DAILY_PARQUET_PATH
+DEFAULT_DRIFT_WINDOWS = ledger.DEFAULT_DRIFT_WINDOWS
 
 
 @dataclass(slots=True)
@@ -60,6 +61,9 @@ def ingest_search_history(
 	runs_parquet_path: Path | str | None = None,
 	daily_parquet_path: Path | str | None = None,
 	emit_tail_log: bool = True,
+	incremental: bool = False,
+	drift_windows: Iterable[str | int] = DEFAULT_DRIFT_WINDOWS,
+	workers: int | None = None,
 ) -> IngestStats:
 	output = Path(db_path)
 	previous_summary = ledger.read_summary(output)
@@ -72,6 +76,9 @@ def ingest_search_history(
 		runs_parquet_path=runs_parquet_path,
 		daily_parquet_path=daily_parquet_path,
 		emit_tail_log=emit_tail_log,
+		incremental=incremental,
+		drift_windows=tuple(drift_windows),
+		workers=workers,
 	)
 	total_runs = int(summary.get("total_runs") or 0)
 	inserted = max(total_runs - previous_total, 0)
@@ -98,6 +105,7 @@ def migrate_from_sqlite(
 	runs_parquet_path: Path | str | None = None,
 	daily_parquet_path: Path | str | None = None,
 	emit_tail_log: bool = True,
+	resume: bool = False,
 ) -> dict[str, Any]:
 	return ledger.migrate_from_sqlite(
 		db_path,
@@ -107,6 +115,7 @@ def migrate_from_sqlite(
 		runs_parquet_path=runs_parquet_path,
 		daily_parquet_path=daily_parquet_path,
 		emit_tail_log=emit_tail_log,
+		resume=resume,
 	)
 
 
@@ -154,3 +163,16 @@ def compute_preset_drift(
 		lookback=lookback,
 		preset_tags_path=preset_tags_path,
 	)
+
+
+def compute_preset_drift_windows(
+	db_path: Path | str = DEFAULT_SUMMARY_PATH,
+	*,
+	windows: Iterable[str | int] = DEFAULT_DRIFT_WINDOWS,
+	preset_tags_path: Path | str | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+	return ledger.compute_preset_drift_windows(
+		db_path,
+		windows=tuple(windows),
+		preset_tags_path=preset_tags_path,
+	)
@@ -1,9 +1,12 @@
 """Telemetry helpers for Kitchen automations."""
 
 from .search_ledger import (
+    DEFAULT_DRIFT_WINDOWS,
     DEFAULT_LOG_PATH,
     DEFAULT_SUMMARY_PATH,
     compute_preset_drift_from_summary,
+    compute_preset_drift_windows,
+    flush_tail_log,
     ingest_search_history,
     load_daily_metrics,
     load_runs,
@@ -13,9 +16,12 @@ from .search_ledger import (
 )
 
 __all__ = [
+    "DEFAULT_DRIFT_WINDOWS",
     "DEFAULT_LOG_PATH",
     "DEFAULT_SUMMARY_PATH",
     "compute_preset_drift_from_summary",
+    "compute_preset_drift_windows",
+    "flush_tail_log",
     "ingest_search_history",
     "load_daily_metrics",
     "load_runs",
@@ -3,17 +3,35 @@ from __future__ import annotations
 """Search telemetry ingestion + ledger helpers (JSON-first, SQLite-free)."""
 
 import argparse
+import atexit
+import glob
+import gzip
+import hashlib
+import heapq
+from array import array
 import json
+import os
+import queue
+import re
+import shutil
 import sqlite3
 import sys
+import threading
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from kitchen.lab_paths import data_path, lab_path
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - columnar helpers fall back to pure Python
+    np = None
+
 LAB_ROOT = lab_path()
 if str(LAB_ROOT) not in sys.path:
     sys.path.insert(0, str(LAB_ROOT))
@@ -24,13 +42,28 @@ from playground.backend.app.services.data_store import data_store_context
 DEFAULT_LOG_PATH = lab_path("logs", "search-history.jsonl")
 DEFAULT_SUMMARY_PATH = data_path("search_telemetry.json")
 DEFAULT_PRESET_TAGS = lab_path("configs", "search_preset_tags.json")
-DEFAULT_RUNS_PARQUET_PATH = data_path("search_telemetry-runs.parquet")
+# A directory: each ingest rewrites only the days that gained runs (see ``_write_runs_dataset``).
+DEFAULT_RUNS_PARQUET_PATH = data_path("search_telemetry-runs-parquet")
 DEFAULT_DAILY_PARQUET_PATH = data_path("search_telemetry-daily.parquet")
 
+_STATE_VERSION = 1
+_FINGERPRINT_BYTES = 4096
+_RECENT_WINDOW = timedelta(hours=24)
+_MS_PER_DAY = 86_400_000
+_MAX_OPEN_PARTITIONS = 16
+_WINDOW_UNITS = {"m": 60_000, "h": 3_600_000, "d": _MS_PER_DAY}
+
+_ROTATION_SUFFIX = re.compile(r"\.(\d+)(?:\.gz)?$")
+
+DEFAULT_DRIFT_WINDOWS: tuple[str, ...] = ("20", "50", "200", "1h", "24h", "7d")
+
+DEFAULT_PARQUET_BATCH_SIZE = 50_000
+DEFAULT_SQLITE_CHUNK_ROWS = 50_000
+
 _RUN_PARQUET_SCHEMA = {
-    "timestamp": "string",
-    "pattern": "string",
-    "preset": "string",
+    "timestamp": "timestamp",
+    "pattern": "dictionary",
+    "preset": "dictionary",
     "files_scanned": "int64",
     "matches": "int64",
     "duration_ms": "int64",
@@ -47,17 +80,131 @@ _DAILY_PARQUET_SCHEMA = {
 }
 
 
+class _TailLogEmitter:
+    """Queue tail-log messages and write them from one background thread.
+
+    The worker drains up to ``batch_size`` messages at a time through one
+    data store that stays open until the queue has been idle for
+    ``idle_timeout`` seconds, so callers never wait on the backend. A full
+    queue drops messages rather than blocking; backend failures drop the
+    batch and reopen the store on the next one.
+    """
+
+    def __init__(self, *, batch_size: int = 100, max_pending: int = 1000, idle_timeout: float = 1.0) -> None:
+        self.batch_size = batch_size
+        self.idle_timeout = idle_timeout
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_pending)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stack: ExitStack | None = None
+        self._store: Any = None
+
+    def emit(self, message: str) -> None:
+        self._ensure_worker()
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self._done(1)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every queued message was written (or dropped)."""
+
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self.flush(timeout)
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return  # the backend is stuck; the daemon worker dies with the process
+        thread.join(timeout)
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="search-ledger-tail-log", daemon=True)
+                self._thread.start()
+
+    def _done(self, count: int) -> None:
+        with self._idle:
+            self._pending -= count
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    message = self._queue.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    self._close_store()
+                    continue
+                if message is None:
+                    return
+                batch = [message]
+                while len(batch) < self.batch_size:
+                    try:
+                        message = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if message is None:
+                        self._write(batch)
+                        return
+                    batch.append(message)
+                self._write(batch)
+        finally:
+            self._close_store()
+
+    def _write(self, batch: list[str]) -> None:
+        try:
+            if self._store is None:
+                self._stack = ExitStack()
+                self._store = self._stack.enter_context(data_store_context())
+            for message in batch:
+                self._store.create_tail_log_entry(TailLogEntryCreate(message=message, source="search-ledger"))
+        except Exception:
+            # Observability shouldn't break ingestion; drop the batch and
+            # start from a fresh store next time.
+            self._close_store()
+        finally:
+            self._done(len(batch))
+
+    def _close_store(self) -> None:
+        stack, self._stack, self._store = self._stack, None, None
+        if stack is not None:
+            try:
+                stack.close()
+            except Exception:
+                pass
+
+
+_tail_log_emitter = _TailLogEmitter()
+atexit.register(_tail_log_emitter.close)
+
+
 def _emit_tail_log(message: str) -> None:
-    """Best-effort tail log emission for search telemetry events."""
+    """Best-effort, non-blocking tail log emission for search telemetry events."""
 
-    try:
-        with data_store_context() as store:
-            store.create_tail_log_entry(
-                TailLogEntryCreate(message=message, source="search-ledger")
-            )
-    except Exception:
-        # Observability shouldn't break ingestion; ignore failures.
-        return
+    _tail_log_emitter.emit(message)
+
+
+def flush_tail_log(timeout: float | None = 5.0) -> bool:
+    """Block until queued search-ledger tail-log messages are written.
+
+    Returns ``False`` if ``timeout`` expired first. Pending messages are also
+    flushed at interpreter exit.
+    """
+
+    return _tail_log_emitter.flush(timeout)
 
 
 def _log_summary(summary: dict[str, Any], *, action: str) -> None:
@@ -70,6 +217,13 @@ def _log_summary(summary: dict[str, Any], *, action: str) -> None:
     _emit_tail_log(message)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_ms(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(milliseconds=1)
+
+
 @dataclass(slots=True)
 class RunRecord:
     """Normalized representation of a single search run."""
@@ -96,6 +250,111 @@ class RunRecord:
         }
 
 
+class RunTable:
+    """Columnar, array-backed run storage with the same row API as ``RunRecord`` lists.
+
+    Timestamps are epoch-ms int64, pattern/preset strings are interned into
+    int32 codes (``0`` is ``None``), and the counters are int64 arrays, so a
+    run costs ~40 bytes instead of a dataclass plus a ``datetime``. The arrays
+    expose the buffer protocol, which lets the aggregation helpers hand them
+    to NumPy without copying.
+    """
+
+    __slots__ = (
+        "timestamps_ms",
+        "pattern_codes",
+        "preset_codes",
+        "files_scanned",
+        "matches",
+        "duration_ms",
+        "patterns",
+        "presets",
+        "_pattern_index",
+        "_preset_index",
+    )
+
+    def __init__(self) -> None:
+        self.timestamps_ms = array("q")
+        self.pattern_codes = array("i")
+        self.preset_codes = array("i")
+        self.files_scanned = array("q")
+        self.matches = array("q")
+        self.duration_ms = array("q")
+        self.patterns: list[str | None] = [None]
+        self.presets: list[str | None] = [None]
+        self._pattern_index: dict[str | None, int] = {None: 0}
+        self._preset_index: dict[str | None, int] = {None: 0}
+
+    @staticmethod
+    def _intern(value: str | None, labels: list[str | None], index: dict[str | None, int]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(labels)
+            labels.append(value)
+        return code
+
+    def append(self, run: RunRecord) -> None:
+        self.append_values(
+            _to_epoch_ms(run.timestamp),
+            run.pattern,
+            run.preset,
+            run.files_scanned,
+            run.matches,
+            run.duration_ms,
+        )
+
+    def append_values(
+        self,
+        timestamp_ms: int,
+        pattern: str | None,
+        preset: str | None,
+        files_scanned: int,
+        matches: int,
+        duration_ms: int,
+    ) -> None:
+        self.timestamps_ms.append(timestamp_ms)
+        self.pattern_codes.append(self._intern(pattern, self.patterns, self._pattern_index))
+        self.preset_codes.append(self._intern(preset, self.presets, self._preset_index))
+        self.files_scanned.append(files_scanned)
+        self.matches.append(matches)
+        self.duration_ms.append(duration_ms)
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[RunRecord]) -> "RunTable":
+        table = cls()
+        for run in runs:
+            table.append(run)
+        return table
+
+    @classmethod
+    def from_dicts(cls, entries: Iterable[Any]) -> "RunTable":
+        table = cls()
+        for entry in entries:
+            if isinstance(entry, dict):
+                table.append(_record_from_summary(entry))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ms)
+
+    def row(self, index: int) -> RunRecord:
+        return RunRecord(
+            timestamp=_EPOCH + timedelta(milliseconds=self.timestamps_ms[index]),
+            pattern=self.patterns[self.pattern_codes[index]],
+            preset=self.presets[self.preset_codes[index]],
+            files_scanned=self.files_scanned[index],
+            matches=self.matches[index],
+            duration_ms=self.duration_ms[index],
+        )
+
+    def __iter__(self) -> Iterator[RunRecord]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return [run.to_dict() for run in self]
+
+
 def _normalize_timestamp(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
@@ -111,21 +370,39 @@ def _normalize_timestamp(value: str | None) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
-def _load_lines(log_path: Path) -> list[dict[str, Any]]:
-    if not log_path.exists():
-        return []
-    entries: list[dict[str, Any]] = []
-    with log_path.open("r", encoding="utf-8") as handle:
-        for raw in handle:
-            raw_line = raw.strip()
-            if not raw_line:
-                continue
-            try:
-                payload = json.loads(raw_line)
-            except json.JSONDecodeError:
-                continue
-            entries.append(payload)
-    return entries
+class _LogReader:
+    """Stream parsed JSON lines from ``log_path`` starting at a byte offset.
+
+    ``offset`` tracks the position just past the last consumed line so
+    incremental ingests can resume there. A trailing line without a newline
+    is only consumed when it already parses, so a writer caught mid-append is
+    picked up on the next pass. ``.gz`` files are decompressed transparently;
+    their offset counts decompressed bytes.
+    """
+
+    def __init__(self, log_path: Path, offset: int = 0) -> None:
+        self.log_path = log_path
+        self.offset = offset
+        self.entries = 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not self.log_path.exists():
+            return
+        opener = gzip.open if self.log_path.suffix == ".gz" else open
+        with opener(self.log_path, "rb") as handle:
+            handle.seek(self.offset)
+            for raw in handle:
+                raw_line = raw.strip()
+                try:
+                    payload = json.loads(raw_line) if raw_line else None
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    if not raw.endswith(b"\n"):
+                        return
+                    payload = None
+                self.offset += len(raw)
+                if payload is not None:
+                    self.entries += 1
+                    yield payload
 
 
 def _normalize_run(payload: dict[str, Any]) -> RunRecord:
@@ -139,8 +416,9 @@ def _normalize_run(payload: dict[str, Any]) -> RunRecord:
     )
 
 
-def _build_runs_from_log(log_path: Path) -> list[RunRecord]:
-    return [_normalize_run(payload) for payload in _load_lines(log_path)]
+def _iter_runs(payloads: Iterable[dict[str, Any]]) -> Iterator[RunRecord]:
+    for payload in payloads:
+        yield _normalize_run(payload)
 
 
 def _record_from_summary(payload: dict[str, Any]) -> RunRecord:
@@ -154,30 +432,64 @@ def _record_from_summary(payload: dict[str, Any]) -> RunRecord:
     )
 
 
-def _build_runs_from_sqlite(db_path: Path) -> list[RunRecord]:
-    if not db_path.exists():
-        return []
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
-        rows = conn.execute(
-            "SELECT timestamp, pattern, preset, files_scanned, matches, duration_ms FROM search_runs"
-        ).fetchall()
-    finally:
-        conn.close()
-    runs: list[RunRecord] = []
-    for row in rows:
-        runs.append(
-            RunRecord(
-                timestamp=_normalize_timestamp(row["timestamp"]),
-                pattern=row["pattern"],
-                preset=row["preset"],
-                files_scanned=int(row["files_scanned"] or 0),
-                matches=int(row["matches"] or 0),
-                duration_ms=int(row["duration_ms"] or 0),
-            )
-        )
-    return runs
+class _SqliteReader:
+    """Page through the legacy ``search_runs`` table by rowid.
+
+    Each page is one ``WHERE rowid > ? ORDER BY rowid LIMIT ?`` query, so
+    memory is bounded by ``chunk_size`` and ``last_rowid`` is a cursor a
+    later migration can resume from.
+    """
+
+    _QUERY = (
+        "SELECT rowid, timestamp, pattern, preset, files_scanned, matches, duration_ms "
+        "FROM search_runs WHERE rowid > ? ORDER BY rowid LIMIT ?"
+    )
+
+    def __init__(self, db_path: Path, after_rowid: int = 0, *, chunk_size: int = DEFAULT_SQLITE_CHUNK_ROWS) -> None:
+        self.db_path = db_path
+        self.last_rowid = after_rowid
+        self.chunk_size = chunk_size
+        self.entries = 0
+
+    def max_rowid(self) -> int:
+        if not self.db_path.exists():
+            return 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return int(conn.execute("SELECT MAX(rowid) FROM search_runs").fetchone()[0] or 0)
+        finally:
+            conn.close()
+
+    def pages(self) -> Iterator[list[RunRecord]]:
+        if not self.db_path.exists():
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            while True:
+                rows = conn.execute(self._QUERY, (self.last_rowid, self.chunk_size)).fetchall()
+                if not rows:
+                    return
+                page = [
+                    RunRecord(
+                        timestamp=_normalize_timestamp(row["timestamp"]),
+                        pattern=row["pattern"],
+                        preset=row["preset"],
+                        files_scanned=int(row["files_scanned"] or 0),
+                        matches=int(row["matches"] or 0),
+                        duration_ms=int(row["duration_ms"] or 0),
+                    )
+                    for row in rows
+                ]
+                self.last_rowid = int(rows[-1]["rowid"])
+                self.entries += len(page)
+                yield page
+        finally:
+            conn.close()
+
+    def __iter__(self) -> Iterator[RunRecord]:
+        for page in self.pages():
+            yield from page
 
 
 def _load_preset_tags(path: Path | None) -> dict[str, list[str]]:
@@ -213,17 +525,53 @@ def _load_preset_tags(path: Path | None) -> dict[str, list[str]]:
     return normalized
 
 
+def _new_pattern_bucket() -> dict[str, Any]:
+    return {"runs": 0, "total_matches": 0, "files": 0}
+
+
+def _new_daily_bucket() -> dict[str, Any]:
+    return {
+        "runs": 0,
+        "files_scanned": 0,
+        "matches": 0,
+        "runs_with_matches": 0,
+        "duration_sum": 0.0,
+        "density_sum": 0.0,
+    }
+
+
+def _fold_pattern(buckets: dict[str, dict[str, Any]], run: RunRecord) -> None:
+    key = run.pattern if run.pattern else "custom/adhoc"
+    bucket = buckets.get(key)
+    if bucket is None:
+        bucket = buckets[key] = _new_pattern_bucket()
+    bucket["runs"] += 1
+    bucket["total_matches"] += run.matches
+    bucket["files"] += run.files_scanned
+
+
+def _fold_daily(buckets: dict[str, dict[str, Any]], run: RunRecord) -> None:
+    key = run.timestamp.date().isoformat()
+    bucket = buckets.get(key)
+    if bucket is None:
+        bucket = buckets[key] = _new_daily_bucket()
+    bucket["runs"] += 1
+    bucket["files_scanned"] += run.files_scanned
+    bucket["matches"] += run.matches
+    if run.matches > 0:
+        bucket["runs_with_matches"] += 1
+    bucket["duration_sum"] += float(run.duration_ms)
+    bucket["density_sum"] += (run.matches / run.files_scanned) if run.files_scanned else 0.0
+
+
 def _compute_top_patterns(runs: Iterable[RunRecord], *, top_n: int = 5) -> list[dict[str, Any]]:
-    buckets: dict[str, dict[str, Any]] = defaultdict(lambda: {"runs": 0, "total_matches": 0, "files": 0})
+    buckets: dict[str, dict[str, Any]] = {}
     for run in runs:
-        if not run.pattern:
-            key = "custom/adhoc"
-        else:
-            key = run.pattern
-        bucket = buckets[key]
-        bucket["runs"] += 1
-        bucket["total_matches"] += run.matches
-        bucket["files"] += run.files_scanned
+        _fold_pattern(buckets, run)
+    return _rank_patterns(buckets, top_n=top_n)
+
+
+def _rank_patterns(buckets: dict[str, dict[str, Any]], *, top_n: int = 5) -> list[dict[str, Any]]:
     ranked = sorted(
         (
             {
@@ -240,26 +588,57 @@ def _compute_top_patterns(runs: Iterable[RunRecord], *, top_n: int = 5) -> list[
     return ranked[:top_n]
 
 
-def _aggregate_daily_metrics(runs: Iterable[RunRecord]) -> list[dict[str, Any]]:
-    buckets: dict[str, dict[str, Any]] = defaultdict(lambda: {
-        "runs": 0,
-        "files_scanned": 0,
-        "matches": 0,
-        "runs_with_matches": 0,
-        "duration_sum": 0.0,
-        "density_sum": 0.0,
-    })
+def _aggregate_daily_metrics(runs: Iterable[RunRecord] | RunTable) -> list[dict[str, Any]]:
+    if isinstance(runs, RunTable) and np is not None:
+        return _render_daily_metrics(_daily_buckets_columnar(runs))
+    buckets: dict[str, dict[str, Any]] = {}
     for run in runs:
-        key = run.timestamp.date().isoformat()
-        bucket = buckets[key]
-        bucket["runs"] += 1
-        bucket["files_scanned"] += run.files_scanned
-        bucket["matches"] += run.matches
-        if run.matches > 0:
-            bucket["runs_with_matches"] += 1
-        bucket["duration_sum"] += float(run.duration_ms)
-        density = (run.matches / run.files_scanned) if run.files_scanned else 0.0
-        bucket["density_sum"] += density
+        _fold_daily(buckets, run)
+    return _render_daily_metrics(buckets)
+
+
+def _column(values: array, dtype: Any) -> Any:
+    return np.frombuffer(values, dtype=dtype) if len(values) else np.zeros(0, dtype=dtype)
+
+
+def _densities(matches: Any, files: Any) -> Any:
+    return np.divide(
+        matches.astype(np.float64),
+        files,
+        out=np.zeros(len(matches), dtype=np.float64),
+        where=files != 0,
+    )
+
+
+def _daily_buckets_columnar(table: RunTable) -> dict[str, dict[str, Any]]:
+    """Vectorized ``_fold_daily`` over a whole table (sums accumulate in row order)."""
+
+    timestamps = _column(table.timestamps_ms, np.int64)
+    files = _column(table.files_scanned, np.int64)
+    matches = _column(table.matches, np.int64)
+    duration = _column(table.duration_ms, np.int64)
+    days, inverse = np.unique(timestamps // _MS_PER_DAY, return_inverse=True)
+    size = len(days)
+    runs = np.bincount(inverse, minlength=size)
+    files_sum = np.bincount(inverse, weights=files, minlength=size)
+    matches_sum = np.bincount(inverse, weights=matches, minlength=size)
+    hits = np.bincount(inverse, weights=matches > 0, minlength=size)
+    duration_sum = np.bincount(inverse, weights=duration.astype(np.float64), minlength=size)
+    density_sum = np.bincount(inverse, weights=_densities(matches, files), minlength=size)
+    return {
+        (_EPOCH + timedelta(days=int(day))).date().isoformat(): {
+            "runs": int(runs[slot]),
+            "files_scanned": int(files_sum[slot]),
+            "matches": int(matches_sum[slot]),
+            "runs_with_matches": int(hits[slot]),
+            "duration_sum": float(duration_sum[slot]),
+            "density_sum": float(density_sum[slot]),
+        }
+        for slot, day in enumerate(days)
+    }
+
+
+def _render_daily_metrics(buckets: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
     return [
         {
             "event_date": day,
@@ -288,114 +667,659 @@ def _aggregate_runs(runs: Sequence[RunRecord]) -> tuple[int, int, float, float]:
     return total_runs, runs_with_matches, avg_duration, avg_density
 
 
+def _drift_entry(
+    preset: str,
+    lifetime: tuple[int, int, float, float],
+    recent: tuple[int, int, float, float],
+    *,
+    lookback: int,
+    preset_tags: dict[str, list[str]],
+) -> dict[str, Any] | None:
+    lifetime_total, lifetime_with_matches, lifetime_duration, lifetime_density = lifetime
+    if lifetime_total == 0:
+        return None
+    lifetime_match_rate = lifetime_with_matches / lifetime_total if lifetime_total else 0.0
+    recent_total, recent_with_matches, recent_duration, recent_density = recent
+    recent_match_rate = (
+        recent_with_matches / recent_total if recent_total else lifetime_match_rate
+    )
+    delta_match_rate = recent_match_rate - lifetime_match_rate
+    delta_duration = recent_duration - lifetime_duration
+    delta_density = recent_density - lifetime_density
+
+    status = "stable"
+    threshold = max(3, int(lookback * 0.2))
+    if recent_total >= threshold:
+        if delta_match_rate <= -0.15 or delta_density <= -0.15:
+            status = "regressing"
+        elif delta_match_rate >= 0.1 or delta_density >= 0.1:
+            status = "improving"
+
+    return {
+        "preset": preset,
+        "tags": preset_tags.get(preset, []),
+        "total_runs": lifetime_total,
+        "recent_runs": recent_total,
+        "match_rate_lifetime": round(lifetime_match_rate, 4),
+        "match_rate_recent": round(recent_match_rate, 4),
+        "avg_duration_lifetime": round(lifetime_duration, 2),
+        "avg_duration_recent": round(recent_duration, 2),
+        "avg_density_lifetime": round(lifetime_density, 4),
+        "avg_density_recent": round(recent_density, 4),
+        "delta_match_rate": round(delta_match_rate, 4),
+        "delta_duration_ms": round(delta_duration, 2),
+        "delta_density": round(delta_density, 4),
+        "status": status,
+    }
+
+
 def _compute_preset_drift(
-    runs: list[RunRecord],
+    runs: list[RunRecord] | RunTable,
     *,
     lookback: int,
     preset_tags: dict[str, list[str]],
 ) -> list[dict[str, Any]]:
+    if isinstance(runs, RunTable) and np is not None:
+        return _compute_preset_drift_columnar(runs, lookback=lookback, preset_tags=preset_tags)
     per_preset: dict[str, list[RunRecord]] = defaultdict(list)
     for run in runs:
         if not run.preset:
             continue
         per_preset[run.preset].append(run)
 
-    recent_samples: dict[str, list[RunRecord]] = {}
-    lifetime_stats: dict[str, tuple[int, int, float, float]] = {}
-
+    drift_entries: list[dict[str, Any]] = []
     for preset, bucket in per_preset.items():
         ordered = sorted(bucket, key=lambda run: run.timestamp, reverse=True)
-        lifetime_stats[preset] = _aggregate_runs(bucket)
-        recent_samples[preset] = ordered[:lookback]
-
-    drift_entries: list[dict[str, Any]] = []
-    for preset, lifetime in lifetime_stats.items():
-        lifetime_total, lifetime_with_matches, lifetime_duration, lifetime_density = lifetime
-        if lifetime_total == 0:
-            continue
-        lifetime_match_rate = lifetime_with_matches / lifetime_total if lifetime_total else 0.0
-        recent_total, recent_with_matches, recent_duration, recent_density = _aggregate_runs(
-            recent_samples.get(preset, [])
+        entry = _drift_entry(
+            preset,
+            _aggregate_runs(bucket),
+            _aggregate_runs(ordered[:lookback]),
+            lookback=lookback,
+            preset_tags=preset_tags,
         )
-        recent_match_rate = (
-            recent_with_matches / recent_total if recent_total else lifetime_match_rate
-        )
-        delta_match_rate = recent_match_rate - lifetime_match_rate
-        delta_duration = recent_duration - lifetime_duration
-        delta_density = recent_density - lifetime_density
-
-        status = "stable"
-        threshold = max(3, int(lookback * 0.2))
-        if recent_total >= threshold:
-            if delta_match_rate <= -0.15 or delta_density <= -0.15:
-                status = "regressing"
-            elif delta_match_rate >= 0.1 or delta_density >= 0.1:
-                status = "improving"
-
-        drift_entries.append(
-            {
-                "preset": preset,
-                "tags": preset_tags.get(preset, []),
-                "total_runs": lifetime_total,
-                "recent_runs": recent_total,
-                "match_rate_lifetime": round(lifetime_match_rate, 4),
-                "match_rate_recent": round(recent_match_rate, 4),
-                "avg_duration_lifetime": round(lifetime_duration, 2),
-                "avg_duration_recent": round(recent_duration, 2),
-                "avg_density_lifetime": round(lifetime_density, 4),
-                "avg_density_recent": round(recent_density, 4),
-                "delta_match_rate": round(delta_match_rate, 4),
-                "delta_duration_ms": round(delta_duration, 2),
-                "delta_density": round(delta_density, 4),
-                "status": status,
+        if entry is not None:
+            drift_entries.append(entry)
+
+    return sorted(drift_entries, key=lambda entry: entry["delta_match_rate"])
+
+
+@dataclass
+class LedgerAggregate:
+    """Running totals behind a ledger summary, folded one run at a time.
+
+    Per preset it keeps lifetime sums, a bounded min-heap of the newest runs
+    (sized for the largest run-count window) and the runs inside the largest
+    time window, so drift for every configured window comes out of one pass.
+    The state round-trips through :meth:`to_state`/:meth:`from_state` so an
+    incremental ingest can resume from the previous totals instead of
+    replaying the whole log.
+    """
+
+    lookback: int = 50
+    drift_windows: tuple[str, ...] = ()
+    total_runs: int = 0
+    runs_with_matches: int = 0
+    duration_sum: int = 0
+    density_sum: float = 0.0
+    last_ingest: datetime | None = None
+    recent_cutoff_ms: int | None = None
+    window_cutoff_ms: int | None = None
+    recent_timestamps: list[int] = field(default_factory=list)
+    patterns: dict[str, dict[str, Any]] = field(default_factory=dict)
+    daily: dict[str, dict[str, Any]] = field(default_factory=dict)
+    presets: dict[str, dict[str, Any]] = field(default_factory=dict)
+    sample_limit: int = field(init=False, default=0)
+    window_span_ms: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        windows = [_parse_drift_window(window) for window in self.drift_windows]
+        self.drift_windows = tuple(label for label, _, _ in windows)
+        self.sample_limit = max([self.lookback, *(count for _, count, _ in windows if count)])
+        self.window_span_ms = max([0, *(span for _, _, span in windows if span)])
+
+    def covers(self, windows: Iterable[str | int], *, now: datetime) -> bool:
+        """Whether the kept samples can answer every window in ``windows`` ending at ``now``."""
+
+        now_ms = _to_epoch_ms(now)
+        for _, count, span in map(_parse_drift_window, windows):
+            if count and count > self.sample_limit:
+                return False
+            if span and (span > self.window_span_ms or now_ms - span < (self.window_cutoff_ms or 0)):
+                return False
+        return True
+
+    def advance_window(self, now: datetime) -> None:
+        """Slide the 24h ``runs_last_24h`` window and the drift time windows up to ``now``."""
+
+        now_ms = _to_epoch_ms(now)
+        self.recent_cutoff_ms = _to_epoch_ms(now - _RECENT_WINDOW)
+        self.recent_timestamps = [ts for ts in self.recent_timestamps if ts >= self.recent_cutoff_ms]
+        if self.window_span_ms:
+            self.window_cutoff_ms = now_ms - self.window_span_ms
+            for bucket in self.presets.values():
+                bucket["window"] = [sample for sample in bucket["window"] if sample[0] >= self.window_cutoff_ms]
+
+    def add(self, run: RunRecord) -> None:
+        timestamp_ms = _to_epoch_ms(run.timestamp)
+        density = (run.matches / run.files_scanned) if run.files_scanned else 0.0
+        self.total_runs += 1
+        if run.matches > 0:
+            self.runs_with_matches += 1
+        self.duration_sum += run.duration_ms
+        self.density_sum += density
+        if self.last_ingest is None or run.timestamp > self.last_ingest:
+            self.last_ingest = run.timestamp
+        if self.recent_cutoff_ms is None or timestamp_ms >= self.recent_cutoff_ms:
+            self.recent_timestamps.append(timestamp_ms)
+        _fold_pattern(self.patterns, run)
+        _fold_daily(self.daily, run)
+
+        if not run.preset:
+            return
+        preset = self.presets.get(run.preset)
+        if preset is None:
+            preset = self.presets[run.preset] = {
+                "runs": 0,
+                "runs_with_matches": 0,
+                "duration_sum": 0,
+                "density_sum": 0.0,
+                "samples": [],
+                "window": [],
             }
+        preset["runs"] += 1
+        if run.matches > 0:
+            preset["runs_with_matches"] += 1
+        preset["duration_sum"] += run.duration_ms
+        if run.files_scanned:
+            preset["density_sum"] += density
+
+        # Heap entries order by (timestamp, -arrival): the root is the oldest
+        # sample and, on ties, the latest arrival, matching a stable newest-first sort.
+        sample = [timestamp_ms, -self.total_runs, run.matches, run.files_scanned, run.duration_ms]
+        heap = preset["samples"]
+        if len(heap) < self.sample_limit:
+            heapq.heappush(heap, sample)
+        elif heap and sample > heap[0]:
+            heapq.heapreplace(heap, sample)
+        if self.window_span_ms and (self.window_cutoff_ms is None or timestamp_ms >= self.window_cutoff_ms):
+            preset["window"].append([timestamp_ms, run.matches, run.files_scanned, run.duration_ms])
+
+    def runs_last_24h(self, now: datetime) -> int:
+        cutoff = _to_epoch_ms(now - _RECENT_WINDOW)
+        return sum(1 for ts in self.recent_timestamps if ts >= cutoff)
+
+    @staticmethod
+    def _newest(bucket: dict[str, Any], count: int) -> list[list[int]]:
+        return heapq.nlargest(count, bucket["samples"])
+
+    def _drift(
+        self,
+        preset_tags: dict[str, list[str]],
+        recent: Any,
+        *,
+        lookback: int,
+    ) -> list[dict[str, Any]]:
+        drift_entries: list[dict[str, Any]] = []
+        for preset, bucket in self.presets.items():
+            total = bucket["runs"]
+            lifetime = (
+                (total, bucket["runs_with_matches"], bucket["duration_sum"] / total, bucket["density_sum"] / total)
+                if total
+                else (0, 0, 0.0, 0.0)
+            )
+            entry = _drift_entry(
+                preset,
+                lifetime,
+                _aggregate_samples(recent(bucket)),
+                lookback=lookback,
+                preset_tags=preset_tags,
+            )
+            if entry is not None:
+                drift_entries.append(entry)
+        return sorted(drift_entries, key=lambda entry: entry["delta_match_rate"])
+
+    def preset_drift(self, preset_tags: dict[str, list[str]]) -> list[dict[str, Any]]:
+        return self._drift(preset_tags, lambda bucket: self._newest(bucket, self.lookback), lookback=self.lookback)
+
+    def preset_drift_windows(
+        self,
+        preset_tags: dict[str, list[str]],
+        *,
+        now: datetime,
+        windows: Iterable[str | int] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Drift per window label; run-count windows use their size as the lookback threshold."""
+
+        now_ms = _to_epoch_ms(now)
+        results: dict[str, list[dict[str, Any]]] = {}
+        for label, count, span in map(_parse_drift_window, self.drift_windows if windows is None else windows):
+            if count is not None:
+                results[label] = self._drift(
+                    preset_tags, lambda bucket, size=count: self._newest(bucket, size), lookback=count
+                )
+            else:
+                cutoff = now_ms - span
+                results[label] = self._drift(
+                    preset_tags,
+                    lambda bucket, start=cutoff: [sample for sample in bucket["window"] if sample[0] >= start],
+                    lookback=0,
+                )
+        return results
+
+    def merge(self, other: "LedgerAggregate") -> None:
+        """Fold ``other``, built from input that follows this aggregate's, into it.
+
+        Buckets are merged in ``other``'s insertion order and its arrival
+        sequence is shifted past ours, so merging shard aggregates in log
+        order ranks ties exactly as a serial fold would.
+        """
+
+        offset = self.total_runs
+        self.total_runs += other.total_runs
+        self.runs_with_matches += other.runs_with_matches
+        self.duration_sum += other.duration_sum
+        self.density_sum += other.density_sum
+        if other.last_ingest is not None and (self.last_ingest is None or other.last_ingest > self.last_ingest):
+            self.last_ingest = other.last_ingest
+        self.recent_timestamps.extend(other.recent_timestamps)
+        _merge_buckets(self.patterns, other.patterns)
+        _merge_buckets(self.daily, other.daily)
+        for preset, bucket in other.presets.items():
+            target = self.presets.get(preset)
+            if target is None:
+                target = self.presets[preset] = {
+                    "runs": 0,
+                    "runs_with_matches": 0,
+                    "duration_sum": 0,
+                    "density_sum": 0.0,
+                    "samples": [],
+                    "window": [],
+                }
+            for key in ("runs", "runs_with_matches", "duration_sum", "density_sum"):
+                target[key] += bucket[key]
+            shifted = [[sample[0], sample[1] - offset, *sample[2:]] for sample in bucket["samples"]]
+            samples = heapq.nlargest(self.sample_limit, target["samples"] + shifted)
+            heapq.heapify(samples)
+            target["samples"] = samples
+            target["window"].extend(bucket["window"])
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "lookback": self.lookback,
+            "drift_windows": list(self.drift_windows),
+            "total_runs": self.total_runs,
+            "runs_with_matches": self.runs_with_matches,
+            "duration_sum": self.duration_sum,
+            "density_sum": self.density_sum,
+            "last_ingest": self.last_ingest.isoformat() if self.last_ingest else None,
+            "recent_timestamps": self.recent_timestamps,
+            "window_cutoff_ms": self.window_cutoff_ms,
+            "patterns": self.patterns,
+            "daily": self.daily,
+            "presets": self.presets,
+        }
+
+    @classmethod
+    def from_state(cls, payload: dict[str, Any]) -> "LedgerAggregate":
+        last_ingest = payload.get("last_ingest")
+        presets = dict(payload.get("presets") or {})
+        for bucket in presets.values():
+            bucket.setdefault("window", [])
+            heapq.heapify(bucket.setdefault("samples", []))
+        window_cutoff = payload.get("window_cutoff_ms")
+        return cls(
+            lookback=int(payload.get("lookback") or 50),
+            drift_windows=tuple(payload.get("drift_windows") or ()),
+            total_runs=int(payload.get("total_runs") or 0),
+            runs_with_matches=int(payload.get("runs_with_matches") or 0),
+            duration_sum=int(payload.get("duration_sum") or 0),
+            density_sum=float(payload.get("density_sum") or 0.0),
+            last_ingest=_normalize_timestamp(last_ingest) if last_ingest else None,
+            recent_timestamps=[int(ts) for ts in payload.get("recent_timestamps") or []],
+            window_cutoff_ms=int(window_cutoff) if window_cutoff is not None else None,
+            patterns=dict(payload.get("patterns") or {}),
+            daily=dict(payload.get("daily") or {}),
+            presets=presets,
         )
 
-    return sorted(drift_entries, key=lambda entry: entry["delta_match_rate"])
 
+def _merge_buckets(target: dict[str, dict[str, Any]], source: dict[str, dict[str, Any]]) -> None:
+    for key, bucket in source.items():
+        merged = target.get(key)
+        if merged is None:
+            target[key] = dict(bucket)
+            continue
+        for name, value in bucket.items():
+            merged[name] += value
 
-def _build_summary(
-    runs: list[RunRecord],
+
+def _parse_drift_window(value: str | int) -> tuple[str, int | None, int | None]:
+    """Return ``(label, run_count, span_ms)`` for a run-count (``50``) or time (``24h``) window."""
+
+    text = str(value).strip().lower()
+    if text.isdigit() and int(text) > 0:
+        return str(int(text)), int(text), None
+    amount, unit = text[:-1], text[-1:]
+    if unit in _WINDOW_UNITS and amount.isdigit() and int(amount) > 0:
+        return text, None, int(amount) * _WINDOW_UNITS[unit]
+    raise ValueError(f"Unsupported drift window {value!r}; use a run count (50) or a span (30m, 24h, 7d)")
+
+
+def _compute_preset_drift_columnar(
+    table: RunTable,
+    *,
+    lookback: int,
+    preset_tags: dict[str, list[str]],
+) -> list[dict[str, Any]]:
+    """Vectorized ``_compute_preset_drift``."""
+
+    windows = _preset_drift_windows_columnar(
+        table, windows=[lookback], preset_tags=preset_tags, now=datetime.now(timezone.utc)
+    )
+    return windows[str(lookback)]
+
+
+def _preset_drift_windows_columnar(
+    table: RunTable,
+    *,
+    windows: Iterable[str | int],
+    preset_tags: dict[str, list[str]],
+    now: datetime,
+) -> dict[str, list[dict[str, Any]]]:
+    """Vectorized drift for several windows over one table.
+
+    Lifetime stats are computed once. Rows are lexsorted by (preset code,
+    newest first) so a row's rank inside its preset group decides whether it
+    falls in a run-count window; time windows are a timestamp mask. Every
+    per-preset statistic is then a single ``bincount``.
+    """
+
+    size = len(table.presets)
+    labelled = np.array([bool(label) for label in table.presets], dtype=bool)
+    codes = _column(table.preset_codes, np.int32)
+    selected = np.nonzero(labelled[codes])[0]
+    codes = codes[selected]
+    timestamps = _column(table.timestamps_ms, np.int64)[selected]
+    files = _column(table.files_scanned, np.int64)[selected]
+    matches = _column(table.matches, np.int64)[selected]
+    duration = _column(table.duration_ms, np.int64)[selected].astype(np.float64)
+    density = _densities(matches, files)
+
+    def _stats(rows: Any) -> tuple[Any, Any, Any, Any]:
+        group = codes[rows]
+        return (
+            np.bincount(group, minlength=size),
+            np.bincount(group, weights=matches[rows] > 0, minlength=size),
+            np.bincount(group, weights=duration[rows], minlength=size),
+            np.bincount(group, weights=density[rows], minlength=size),
+        )
+
+    def _tuple(stats: tuple[Any, Any, Any, Any], code: int) -> tuple[int, int, float, float]:
+        total = int(stats[0][code])
+        if total == 0:
+            return 0, 0, 0.0, 0.0
+        return total, int(stats[1][code]), float(stats[2][code]) / total, float(stats[3][code]) / total
+
+    lifetime = _stats(slice(None))
+    order = np.lexsort((-timestamps, codes))
+    ordered_codes = codes[order]
+    rank = np.arange(len(order)) - np.searchsorted(ordered_codes, ordered_codes, side="left")
+    now_ms = _to_epoch_ms(now)
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    for label, count, span in map(_parse_drift_window, windows):
+        if count is not None:
+            recent = _stats(order[rank < count])
+        else:
+            recent = _stats(np.nonzero(timestamps >= now_ms - span)[0])
+        drift_entries: list[dict[str, Any]] = []
+        for code, preset in enumerate(table.presets):
+            if not preset:
+                continue
+            entry = _drift_entry(
+                preset,
+                _tuple(lifetime, code),
+                _tuple(recent, code),
+                lookback=count or 0,
+                preset_tags=preset_tags,
+            )
+            if entry is not None:
+                drift_entries.append(entry)
+        results[label] = sorted(drift_entries, key=lambda entry: entry["delta_match_rate"])
+    return results
+
+
+def _aggregate_samples(samples: Iterable[Sequence[int]]) -> tuple[int, int, float, float]:
+    """``_aggregate_runs`` over drift samples ending in ``matches, files, duration``."""
+
+    total_runs = 0
+    runs_with_matches = 0
+    duration_sum = 0
+    density_sum = 0.0
+    for *_, matches, files, duration in samples:
+        total_runs += 1
+        if matches > 0:
+            runs_with_matches += 1
+        duration_sum += duration
+        if files:
+            density_sum += matches / files
+    if total_runs == 0:
+        return 0, 0, 0.0, 0.0
+    return total_runs, runs_with_matches, duration_sum / total_runs, density_sum / total_runs
+
+
+def _summary_from_aggregate(
+    aggregate: LedgerAggregate,
     *,
     log_path: Path,
     preset_tags_path: Path | None,
-    lookback: int,
-    now: datetime | None = None,
+    now: datetime,
+    run_store: RunStore | None = None,
 ) -> dict[str, Any]:
-    current_time = now or datetime.now(timezone.utc)
-    total_runs = len(runs)
-    runs_with_matches = sum(1 for run in runs if run.matches > 0)
-    runs_last_24h = sum(1 for run in runs if (current_time - run.timestamp) <= timedelta(hours=24))
-    avg_duration = (sum(run.duration_ms for run in runs) / total_runs) if total_runs else None
-    avg_density = (
-        sum((run.matches / run.files_scanned) if run.files_scanned else 0.0 for run in runs) / total_runs
-        if total_runs
-        else None
-    )
-    last_ingest = max((run.timestamp for run in runs), default=None)
+    total_runs = aggregate.total_runs
+    runs_with_matches = aggregate.runs_with_matches
+    avg_duration = (aggregate.duration_sum / total_runs) if total_runs else None
+    avg_density = (aggregate.density_sum / total_runs) if total_runs else None
+    last_ingest = aggregate.last_ingest
     preset_tags = _load_preset_tags(preset_tags_path)
 
-    summary = {
-        "generated_at": current_time.isoformat(),
+    return {
+        "generated_at": now.isoformat(),
         "source_log": str(log_path),
         "total_runs": total_runs,
         "runs_with_matches": runs_with_matches,
-        "runs_last_24h": runs_last_24h,
+        "runs_last_24h": aggregate.runs_last_24h(now),
         "avg_duration_ms": round(avg_duration, 2) if avg_duration is not None else None,
         "avg_match_density": round(avg_density, 4) if avg_density is not None else None,
         "last_ingest_at": last_ingest.isoformat() if last_ingest else None,
         "match_rate": (runs_with_matches / total_runs) if total_runs else 0.0,
-        "top_patterns": _compute_top_patterns(runs),
-        "daily_metrics": _aggregate_daily_metrics(runs),
-        "preset_drift": _compute_preset_drift(runs, lookback=lookback, preset_tags=preset_tags),
-        "runs": [run.to_dict() for run in runs],
+        "top_patterns": _rank_patterns(aggregate.patterns),
+        "daily_metrics": _render_daily_metrics(aggregate.daily),
+        "preset_drift": aggregate.preset_drift(preset_tags),
+        "preset_drift_windows": aggregate.preset_drift_windows(preset_tags, now=now),
         "metadata": {
             "log_entries": total_runs,
             "log_path": str(log_path),
             "preset_tags_path": str(preset_tags_path) if preset_tags_path else None,
+            "lookback": aggregate.lookback,
+            "drift_windows": list(aggregate.drift_windows),
+            "run_store": str(run_store.root) if run_store else None,
         },
     }
-    return summary
+
+
+def _build_summary(
+    runs: Iterable[RunRecord],
+    *,
+    log_path: Path,
+    preset_tags_path: Path | None,
+    lookback: int,
+    now: datetime | None = None,
+    aggregate: LedgerAggregate | None = None,
+    store_writer: _RunStoreWriter | None = None,
+    drift_windows: Sequence[str | int] = (),
+) -> dict[str, Any]:
+    """Fold ``runs`` into ``aggregate`` in a single pass and render the summary.
+
+    ``runs`` may be a lazy generator; only the bounded aggregate state is
+    kept while reading, and each run is handed to ``store_writer`` (when
+    given) for its day partition. Pass an existing ``aggregate`` to extend a
+    previous ingest. ``drift_windows`` only applies to a fresh aggregate.
+    """
+
+    current_time = now or datetime.now(timezone.utc)
+    if aggregate is None:
+        aggregate = LedgerAggregate(lookback=lookback, drift_windows=tuple(drift_windows))
+    aggregate.advance_window(current_time)
+    for run in runs:
+        aggregate.add(run)
+        if store_writer is not None:
+            store_writer.append(run)
+    return _summary_from_aggregate(
+        aggregate,
+        log_path=log_path,
+        preset_tags_path=preset_tags_path,
+        now=current_time,
+        run_store=store_writer.store if store_writer is not None else None,
+    )
+
+
+class RunStore:
+    """Day-partitioned JSONL run store kept next to the ledger summary.
+
+    Each UTC day lives in ``<root>/<YYYY-MM-DD>.jsonl`` so ingests only ever
+    append and readers open just the days they ask for.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @classmethod
+    def for_summary(cls, summary_path: Path | str) -> "RunStore":
+        target = Path(summary_path)
+        return cls(target.with_name(f"{target.stem}-runs"))
+
+    def partition_path(self, day: str) -> Path:
+        return self.root / f"{day}.jsonl"
+
+    def partitions(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(path.stem for path in self.root.glob("*.jsonl"))
+
+    def sizes(self) -> dict[str, int]:
+        return {day: self.partition_path(day).stat().st_size for day in self.partitions()}
+
+    def fingerprints(self) -> dict[str, list[int]]:
+        """``[size, mtime_ns]`` per day; a rebuilt partition of the same size still differs."""
+
+        fingerprints = {}
+        for day in self.partitions():
+            stat = self.partition_path(day).stat()
+            fingerprints[day] = [stat.st_size, stat.st_mtime_ns]
+        return fingerprints
+
+    def clear(self) -> None:
+        for day in self.partitions():
+            self.partition_path(day).unlink()
+
+    def restore(self, sizes: dict[str, int]) -> bool:
+        """Roll partitions back to a checkpoint from ``sizes``.
+
+        Appends made after the checkpoint (e.g. by an ingest that crashed
+        before saving its state) are truncated away. Returns ``False`` when a
+        partition is shorter than recorded and the store must be rebuilt.
+        """
+
+        existing = set(self.partitions())
+        if any(day not in existing for day in sizes):
+            return False
+        for day in existing:
+            path = self.partition_path(day)
+            recorded = sizes.get(day)
+            if recorded is None:
+                path.unlink()
+                continue
+            current = path.stat().st_size
+            if current < recorded:
+                return False
+            if current > recorded:
+                with path.open("r+b") as handle:
+                    handle.truncate(recorded)
+        return True
+
+    def writer(self) -> "_RunStoreWriter":
+        return _RunStoreWriter(self)
+
+    def iter_dicts(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield stored runs day by day, opening only partitions inside the range."""
+
+        first_day = since.astimezone(timezone.utc).date().isoformat() if since else None
+        last_day = until.astimezone(timezone.utc).date().isoformat() if until else None
+        for day in self.partitions():
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            for entry in self.iter_partition(day):
+                if _within(entry, since, until):
+                    yield entry
+
+    def iter_partition(self, day: str) -> Iterator[dict[str, Any]]:
+        with self.partition_path(day).open("r", encoding="utf-8") as handle:
+            for raw in handle:
+                raw_line = raw.strip()
+                if not raw_line:
+                    continue
+                try:
+                    entry = json.loads(raw_line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+
+
+class _RunStoreWriter:
+    """Append runs to their day partitions, keeping a few handles open."""
+
+    def __init__(self, store: RunStore) -> None:
+        self.store = store
+        self._handles: dict[str, Any] = {}
+
+    def append(self, run: RunRecord) -> None:
+        day = run.timestamp.date().isoformat()
+        handle = self._handles.get(day)
+        if handle is None:
+            if len(self._handles) >= _MAX_OPEN_PARTITIONS:
+                self.close()
+            self.store.root.mkdir(parents=True, exist_ok=True)
+            handle = self._handles[day] = self.store.partition_path(day).open("a", encoding="utf-8")
+        handle.write(json.dumps(run.to_dict()) + "\n")
+
+    def close(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def __enter__(self) -> "_RunStoreWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _within(entry: dict[str, Any], since: datetime | None, until: datetime | None) -> bool:
+    if since is None and until is None:
+        return True
+    timestamp = _normalize_timestamp(entry.get("timestamp"))
+    if since is not None and timestamp < since:
+        return False
+    if until is not None and timestamp > until:
+        return False
+    return True
 
 
 def write_summary(summary: dict[str, Any], path: Path | str = DEFAULT_SUMMARY_PATH) -> Path:
@@ -414,13 +1338,98 @@ def read_summary(path: Path | str = DEFAULT_SUMMARY_PATH) -> dict[str, Any]:
         return json.load(handle)
 
 
-def load_runs(summary_path: Path | str = DEFAULT_SUMMARY_PATH) -> list[dict[str, Any]]:
-    summary = read_summary(summary_path)
-    runs = summary.get("runs", [])
-    if not isinstance(runs, list):
-        return []
+def _state_path(summary_path: Path) -> Path:
+    """Incremental ingest cursor + aggregate state lives next to the summary."""
+
+    return summary_path.with_name(f"{summary_path.stem}.state.json")
+
+
+def _read_state(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_state(state: dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state), encoding="utf-8")
+    tmp_path.replace(path)
+    return path
+
+
+def _log_fingerprint(log_path: Path, length: int) -> str:
+    """Hash the head of the log so truncate-and-regrow rewrites are detected."""
+
+    with log_path.open("rb") as handle:
+        head = handle.read(min(length, _FINGERPRINT_BYTES))
+    return hashlib.sha1(head).hexdigest()
+
+
+def _resume_offset(
+    state: dict[str, Any],
+    previous_summary: dict[str, Any],
+    log_path: Path,
+    *,
+    lookback: int,
+    drift_windows: Sequence[str],
+) -> int | None:
+    """Return the byte offset to resume from, or ``None`` when a rebuild is required."""
+
+    if not state or state.get("version") != _STATE_VERSION:
+        return None
+    if state.get("log_path") != str(log_path) or state.get("lookback") != lookback:
+        return None
+    if state.get("drift_windows", []) != list(drift_windows):
+        return None  # the kept samples are sized for the old windows
+    # A summary rewritten by a full ingest (or a crash between the two writes)
+    # no longer matches the saved aggregates.
+    if not previous_summary or previous_summary.get("generated_at") != state.get("generated_at"):
+        return None
+    if not log_path.exists():
+        return None
+    stat = log_path.stat()
+    offset = int(state.get("offset") or 0)
+    if stat.st_ino != state.get("inode") or stat.st_size < offset:
+        return None  # rotated or truncated
+    if _log_fingerprint(log_path, offset) != state.get("fingerprint"):
+        return None
+    return offset
+
+
+def _iter_run_dicts(
+    summary_path: Path | str,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Iterator[dict[str, Any]]:
+    store = RunStore.for_summary(summary_path)
+    if store.partitions():
+        yield from store.iter_dicts(since=since, until=until)
+        return
+    # Ledgers written before the run store embedded every run in the summary.
+    runs = read_summary(summary_path).get("runs", [])
+    if isinstance(runs, list):
+        for entry in runs:
+            if isinstance(entry, dict) and _within(entry, since, until):
+                yield entry
+
+
+def load_runs(
+    summary_path: Path | str = DEFAULT_SUMMARY_PATH,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Return stored runs, reading only the day partitions overlapping ``since``/``until``."""
+
     normalized: list[dict[str, Any]] = []
-    for entry in runs:
+    for entry in _iter_run_dicts(summary_path, since=since, until=until):
         if isinstance(entry, dict):
             normalized.append(
                 {
@@ -446,6 +1455,10 @@ def load_daily_metrics(summary_path: Path | str = DEFAULT_SUMMARY_PATH) -> list[
 def _resolve_arrow_type(label: str, pa_module: Any):  # pragma: no cover - exercised via parquet helpers
     if label == "string":
         return pa_module.string()
+    if label == "dictionary":
+        return pa_module.dictionary(pa_module.int32(), pa_module.string())
+    if label == "timestamp":
+        return pa_module.timestamp("ms", tz="UTC")
     if label == "int64":
         return pa_module.int64()
     if label == "float64":
@@ -453,13 +1466,42 @@ def _resolve_arrow_type(label: str, pa_module: Any):  # pragma: no cover - exerc
     raise ValueError(f"Unsupported Arrow type label: {label}")
 
 
-def _normalize_records(records: Iterable[dict[str, Any]], schema: dict[str, str]) -> list[dict[str, Any]]:
-    normalized: list[dict[str, Any]] = []
+def _coerce_parquet_value(label: str, value: Any) -> Any:
+    if label == "timestamp" and value is not None:
+        return _normalize_timestamp(value)
+    return value
+
+
+def _iter_record_batches(
+    records: Iterable[dict[str, Any]],
+    schema: dict[str, str],
+    arrow_schema: Any,
+    pa_module: Any,
+    *,
+    batch_size: int,
+) -> Iterator[Any]:
+    """Group ``records`` into Arrow record batches of at most ``batch_size`` rows."""
+
+    columns: dict[str, list[Any]] = {column: [] for column in schema}
+    rows = 0
     for record in records:
         if not isinstance(record, dict):
             continue
-        normalized.append({key: record.get(key) for key in schema})
-    return normalized
+        for column, label in schema.items():
+            columns[column].append(_coerce_parquet_value(label, record.get(column)))
+        rows += 1
+        if rows >= batch_size:
+            yield pa_module.record_batch(
+                [pa_module.array(columns[name], type=arrow_schema.field(name).type) for name in schema],
+                schema=arrow_schema,
+            )
+            columns = {column: [] for column in schema}
+            rows = 0
+    if rows:
+        yield pa_module.record_batch(
+            [pa_module.array(columns[name], type=arrow_schema.field(name).type) for name in schema],
+            schema=arrow_schema,
+        )
 
 
 def _write_parquet_table(
@@ -468,25 +1510,82 @@ def _write_parquet_table(
     schema: dict[str, str],
     pa_module: Any,
     pq_module: Any,
+    *,
+    batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
 ) -> Path:
-    normalized = _normalize_records(records, schema)
-    columns: dict[str, Any] = {}
-    for column, label in schema.items():
-        column_type = _resolve_arrow_type(label, pa_module)
-        values = [entry.get(column) for entry in normalized]
-        columns[column] = pa_module.array(values, type=column_type)
-    table = pa_module.table(columns)
+    """Stream ``records`` into ``path`` one record batch at a time.
+
+    Only a single batch is held in memory; the file is written next to the
+    target and swapped in once complete.
+    """
+
+    arrow_schema = pa_module.schema(
+        [(column, _resolve_arrow_type(label, pa_module)) for column, label in schema.items()]
+    )
     path.parent.mkdir(parents=True, exist_ok=True)
-    pq_module.write_table(table, path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with pq_module.ParquetWriter(tmp_path, arrow_schema) as writer:
+        for batch in _iter_record_batches(records, schema, arrow_schema, pa_module, batch_size=batch_size):
+            writer.write_batch(batch)
+    os.replace(tmp_path, path)
     return path
 
 
+def _write_runs_dataset(
+    run_store: RunStore,
+    root: Path,
+    pa_module: Any,
+    pq_module: Any,
+    *,
+    batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
+) -> Path:
+    """Mirror the run store as a Hive-partitioned dataset (``event_date=<day>/runs.parquet``).
+
+    ``_partitions.json`` remembers the run-store partition size and mtime
+    behind each exported day, so a re-export only writes days whose runs
+    changed and leaves the rest of the history untouched.
+    """
+
+    manifest_path = root / "_partitions.json"
+    exported: dict[str, list[int]] = {}
+    if manifest_path.exists():
+        try:
+            exported = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            exported = {}
+    fingerprints = run_store.fingerprints()
+    for day, fingerprint in fingerprints.items():
+        target = root / f"event_date={day}" / "runs.parquet"
+        if exported.get(day) == fingerprint and target.exists():
+            continue
+        _write_parquet_table(
+            run_store.iter_partition(day), target, _RUN_PARQUET_SCHEMA, pa_module, pq_module, batch_size=batch_size
+        )
+    for day in set(exported) - set(fingerprints):
+        shutil.rmtree(root / f"event_date={day}", ignore_errors=True)
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_manifest = manifest_path.with_name(f"{manifest_path.name}.tmp")
+    tmp_manifest.write_text(json.dumps(fingerprints, indent=2), encoding="utf-8")
+    os.replace(tmp_manifest, manifest_path)
+    return root
+
+
 def _write_parquet_tables(
     summary: dict[str, Any],
     *,
     runs_path: Path | None,
     daily_path: Path | None,
+    run_store: RunStore | None = None,
+    batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
 ) -> list[Path]:
+    """Export runs and daily metrics to Parquet.
+
+    A ``runs_path`` without a ``.parquet`` suffix (the CLI default) is a
+    day-partitioned dataset directory updated in place. A ``.parquet`` path
+    gets one file, which a single file cannot grow, so every export
+    streams the whole run store into it again.
+    """
+
     targets: list[Path] = []
     if not runs_path and not daily_path:
         return targets
@@ -499,9 +1598,20 @@ def _write_parquet_tables(
         ) from exc
 
     if runs_path:
-        targets.append(
-            _write_parquet_table(summary.get("runs", []), Path(runs_path), _RUN_PARQUET_SCHEMA, pa, pq)
-        )
+        runs_target = Path(runs_path)
+        if runs_target.suffix == ".parquet":
+            targets.append(
+                _write_parquet_table(
+                    run_store.iter_dicts() if run_store else [],
+                    runs_target,
+                    _RUN_PARQUET_SCHEMA,
+                    pa,
+                    pq,
+                    batch_size=batch_size,
+                )
+            )
+        elif run_store is not None:
+            targets.append(_write_runs_dataset(run_store, runs_target, pa, pq, batch_size=batch_size))
     if daily_path:
         targets.append(
             _write_parquet_table(summary.get("daily_metrics", []), Path(daily_path), _DAILY_PARQUET_SCHEMA, pa, pq)
@@ -509,6 +1619,199 @@ def _write_parquet_tables(
     return targets
 
 
+def _ledger_state(
+    summary: dict[str, Any] | None,
+    aggregate: LedgerAggregate,
+    run_store: RunStore,
+    *,
+    source: Path,
+    **cursor: Any,
+) -> dict[str, Any]:
+    return {
+        "version": _STATE_VERSION,
+        "log_path": str(source),
+        "lookback": aggregate.lookback,
+        "drift_windows": list(aggregate.drift_windows),
+        **cursor,
+        "generated_at": summary["generated_at"] if summary else None,
+        "partitions": run_store.sizes(),
+        "aggregate": aggregate.to_state(),
+    }
+
+
+def _ingest_log(
+    log_path: Path,
+    output_path: Path,
+    *,
+    preset_tags_path: Path | None,
+    lookback: int,
+    drift_windows: Sequence[str | int],
+    incremental: bool,
+    now: datetime | None = None,
+) -> tuple[dict[str, Any], RunStore]:
+    """Ingest ``log_path`` into the summary, run store and saved aggregate state.
+
+    Incremental runs fold only the bytes appended since the saved offset;
+    anything that invalidates the checkpoint falls back to a rebuild.
+    """
+
+    current_time = now or datetime.now(timezone.utc)
+    windows = tuple(label for label, _, _ in map(_parse_drift_window, drift_windows))
+    state_path = _state_path(output_path)
+    run_store = RunStore.for_summary(output_path)
+    state = _read_state(state_path) if incremental else {}
+    previous_summary = read_summary(output_path) if state else {}
+    offset = _resume_offset(state, previous_summary, log_path, lookback=lookback, drift_windows=windows)
+    if offset is not None and not run_store.restore(state.get("partitions") or {}):
+        offset = None
+
+    if offset is None:
+        mode = "rebuild"
+        offset = 0
+        aggregate = LedgerAggregate(lookback=lookback, drift_windows=windows)
+        run_store.clear()
+    else:
+        mode = "incremental"
+        aggregate = LedgerAggregate.from_state(state.get("aggregate") or {})
+
+    reader = _LogReader(log_path, offset)
+    with run_store.writer() as writer:
+        summary = _build_summary(
+            _iter_runs(reader),
+            log_path=log_path,
+            preset_tags_path=preset_tags_path,
+            lookback=lookback,
+            now=current_time,
+            aggregate=aggregate,
+            store_writer=writer,
+        )
+    end_offset = reader.offset
+    summary["metadata"]["ingest"] = {
+        "mode": mode,
+        "appended_runs": reader.entries,
+        "offset": end_offset,
+    }
+    write_summary(summary, output_path)
+
+    stat = log_path.stat() if log_path.exists() else None
+    _write_state(
+        _ledger_state(
+            summary,
+            aggregate,
+            run_store,
+            source=log_path,
+            inode=stat.st_ino if stat else None,
+            offset=end_offset,
+            fingerprint=_log_fingerprint(log_path, end_offset) if stat else None,
+        ),
+        state_path,
+    )
+    return summary, run_store
+
+
+def _is_log_glob(log_path: Path | str) -> bool:
+    return any(char in str(log_path) for char in "*?[")
+
+
+def _rotation_key(path: Path) -> tuple[int, str]:
+    match = _ROTATION_SUFFIX.search(path.name)
+    # ``history.jsonl.2.gz`` is older than ``history.jsonl.1``, which is older
+    # than the live ``history.jsonl``.
+    return (-int(match.group(1)) if match else 0, path.name)
+
+
+def _resolve_log_shards(pattern: Path | str) -> list[Path]:
+    """Expand a log glob into files ordered oldest rotation first."""
+
+    shards = [Path(path) for path in glob.glob(str(pattern)) if Path(path).is_file()]
+    return sorted(shards, key=_rotation_key)
+
+
+def _ingest_shard(
+    log_path: str,
+    staging_root: str,
+    lookback: int,
+    drift_windows: tuple[str, ...],
+    now: str,
+) -> dict[str, Any]:
+    """Process-pool worker: fold one shard and stage its run partitions."""
+
+    aggregate = LedgerAggregate(lookback=lookback, drift_windows=drift_windows)
+    aggregate.advance_window(datetime.fromisoformat(now))
+    with RunStore(Path(staging_root)).writer() as writer:
+        for run in _iter_runs(_LogReader(Path(log_path))):
+            aggregate.add(run)
+            writer.append(run)
+    return aggregate.to_state()
+
+
+def _ingest_log_shards(
+    pattern: Path | str,
+    output_path: Path,
+    *,
+    preset_tags_path: Path | None,
+    lookback: int,
+    drift_windows: Sequence[str | int],
+    workers: int | None,
+    now: datetime | None = None,
+) -> tuple[dict[str, Any], RunStore]:
+    """Rebuild the ledger from every file matching ``pattern``.
+
+    Shards are parsed in a process pool into partial aggregates and staged
+    partitions, then merged in rotation order so the result does not depend
+    on which worker finished first.
+    """
+
+    current_time = now or datetime.now(timezone.utc)
+    windows = tuple(label for label, _, _ in map(_parse_drift_window, drift_windows))
+    shards = _resolve_log_shards(pattern)
+    run_store = RunStore.for_summary(output_path)
+    staging = run_store.root.with_name(f"{run_store.root.name}.shards")
+    shutil.rmtree(staging, ignore_errors=True)
+    tasks = [
+        (str(shard), str(staging / str(index)), lookback, windows, current_time.isoformat())
+        for index, shard in enumerate(shards)
+    ]
+    try:
+        max_workers = min(workers or os.cpu_count() or 1, len(tasks))
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                states = list(pool.map(_ingest_shard, *zip(*tasks)))
+        else:
+            states = [_ingest_shard(*task) for task in tasks]
+
+        aggregate = LedgerAggregate(lookback=lookback, drift_windows=windows)
+        aggregate.advance_window(current_time)
+        run_store.clear()
+        run_store.root.mkdir(parents=True, exist_ok=True)
+        for task, state in zip(tasks, states):
+            aggregate.merge(LedgerAggregate.from_state(state))
+            shard_store = RunStore(Path(task[1]))
+            for day in shard_store.partitions():
+                with shard_store.partition_path(day).open("rb") as source, run_store.partition_path(day).open(
+                    "ab"
+                ) as target:
+                    shutil.copyfileobj(source, target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    summary = _summary_from_aggregate(
+        aggregate,
+        log_path=Path(pattern),
+        preset_tags_path=preset_tags_path,
+        now=current_time,
+        run_store=run_store,
+    )
+    summary["metadata"]["ingest"] = {
+        "mode": "sharded",
+        "appended_runs": aggregate.total_runs,
+        "shards": [str(shard) for shard in shards],
+    }
+    write_summary(summary, output_path)
+    _write_state(_ledger_state(summary, aggregate, run_store, source=Path(pattern)), _state_path(output_path))
+    return summary, run_store
+
+
 def ingest_search_history(
     log_path: Path | str = DEFAULT_LOG_PATH,
     output_path: Path | str = DEFAULT_SUMMARY_PATH,
@@ -518,26 +1821,82 @@ def ingest_search_history(
     runs_parquet_path: Path | str | None = None,
     daily_parquet_path: Path | str | None = None,
     emit_tail_log: bool = True,
+    incremental: bool = False,
+    drift_windows: Sequence[str | int] = DEFAULT_DRIFT_WINDOWS,
+    workers: int | None = None,
+    parquet_batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
 ) -> dict[str, Any]:
-    log = Path(log_path)
-    runs = _build_runs_from_log(log)
-    summary = _build_summary(
-        runs,
-        log_path=log,
-        preset_tags_path=Path(preset_tags_path) if preset_tags_path else None,
-        lookback=lookback,
-    )
-    write_summary(summary, output_path)
+    """Recompute the ledger from ``log_path``.
+
+    The summary stays small; runs are written to the day-partitioned
+    :class:`RunStore` next to it. With ``incremental=True`` only lines
+    appended since the previous ingest are parsed and folded into the saved
+    aggregate state; rotated or truncated logs fall back to a rebuild.
+    ``drift_windows`` lists the run-count (``50``) and time (``24h``)
+    windows reported under ``preset_drift_windows``.
+
+    A glob ``log_path`` (``logs/search-history.jsonl*``) ingests the live log
+    and its rotations, gzip included, across up to ``workers`` processes.
+    A ``runs_parquet_path`` without a ``.parquet`` suffix is exported as a
+    day-partitioned dataset that only rewrites days with new runs.
+    """
+
+    if _is_log_glob(log_path):
+        if incremental:
+            raise ValueError("Incremental ingest needs a single log file, not a glob")
+        summary, run_store = _ingest_log_shards(
+            log_path,
+            Path(output_path),
+            preset_tags_path=Path(preset_tags_path) if preset_tags_path else None,
+            lookback=lookback,
+            drift_windows=drift_windows,
+            workers=workers,
+        )
+    else:
+        summary, run_store = _ingest_log(
+            Path(log_path),
+            Path(output_path),
+            preset_tags_path=Path(preset_tags_path) if preset_tags_path else None,
+            lookback=lookback,
+            drift_windows=drift_windows,
+            incremental=incremental,
+        )
     _write_parquet_tables(
         summary,
         runs_path=Path(runs_parquet_path) if runs_parquet_path else None,
         daily_path=Path(daily_parquet_path) if daily_parquet_path else None,
+        run_store=run_store,
+        batch_size=parquet_batch_size,
     )
     if emit_tail_log:
         _log_summary(summary, action="search-ledger ingest")
     return summary
 
 
+def _resume_rowid(
+    state: dict[str, Any],
+    previous_summary: dict[str, Any],
+    db_path: Path,
+    *,
+    lookback: int,
+    drift_windows: Sequence[str],
+) -> int | None:
+    """Return the rowid a migration can continue after, or ``None`` to start over."""
+
+    if not state or state.get("version") != _STATE_VERSION or "last_rowid" not in state:
+        return None
+    if state.get("log_path") != str(db_path) or state.get("lookback") != lookback:
+        return None
+    if state.get("drift_windows", []) != list(drift_windows):
+        return None
+    # Mid-migration checkpoints have no summary yet; a finished migration
+    # must still match the summary it wrote.
+    generated_at = state.get("generated_at")
+    if generated_at is not None and previous_summary.get("generated_at") != generated_at:
+        return None
+    return int(state["last_rowid"])
+
+
 def migrate_from_sqlite(
     db_path: Path | str,
     output_path: Path | str = DEFAULT_SUMMARY_PATH,
@@ -547,42 +1906,159 @@ def migrate_from_sqlite(
     runs_parquet_path: Path | str | None = None,
     daily_parquet_path: Path | str | None = None,
     emit_tail_log: bool = True,
+    drift_windows: Sequence[str | int] = DEFAULT_DRIFT_WINDOWS,
+    parquet_batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
+    chunk_size: int = DEFAULT_SQLITE_CHUNK_ROWS,
+    resume: bool = False,
+    progress: Callable[[int, int, int], None] | None = None,
 ) -> dict[str, Any]:
-    runs = _build_runs_from_sqlite(Path(db_path))
-    summary = _build_summary(
-        runs,
-        log_path=Path(db_path),
+    """Fold the legacy SQLite ``search_runs`` table into the ledger.
+
+    Rows are streamed ``chunk_size`` at a time into the aggregate and run
+    store, and the rowid cursor is checkpointed after every page. With
+    ``resume=True`` an interrupted migration continues after the last
+    checkpoint (and a finished one picks up rows added since). ``progress``
+    receives ``(rows_migrated, last_rowid, max_rowid)`` after each page.
+    """
+
+    source = Path(db_path)
+    output = Path(output_path)
+    current_time = datetime.now(timezone.utc)
+    windows = tuple(label for label, _, _ in map(_parse_drift_window, drift_windows))
+    state_path = _state_path(output)
+    run_store = RunStore.for_summary(output)
+    state = _read_state(state_path) if resume else {}
+    after_rowid = _resume_rowid(
+        state, read_summary(output) if state else {}, source, lookback=lookback, drift_windows=windows
+    )
+    if after_rowid is not None and not run_store.restore(state.get("partitions") or {}):
+        after_rowid = None
+
+    if after_rowid is None:
+        mode = "migrate"
+        after_rowid = 0
+        aggregate = LedgerAggregate(lookback=lookback, drift_windows=windows)
+        run_store.clear()
+    else:
+        mode = "resume"
+        aggregate = LedgerAggregate.from_state(state.get("aggregate") or {})
+    aggregate.advance_window(current_time)
+
+    reader = _SqliteReader(source, after_rowid, chunk_size=chunk_size)
+    max_rowid = reader.max_rowid() if progress else 0
+    with run_store.writer() as writer:
+        for page in reader.pages():
+            for run in page:
+                aggregate.add(run)
+                writer.append(run)
+            writer.close()  # flush so the checkpoint records complete partitions
+            _write_state(
+                _ledger_state(None, aggregate, run_store, source=source, last_rowid=reader.last_rowid),
+                state_path,
+            )
+            if progress:
+                progress(reader.entries, reader.last_rowid, max_rowid)
+
+    summary = _summary_from_aggregate(
+        aggregate,
+        log_path=source,
         preset_tags_path=Path(preset_tags_path) if preset_tags_path else None,
-        lookback=lookback,
+        now=current_time,
+        run_store=run_store,
+    )
+    summary["metadata"]["ingest"] = {
+        "mode": mode,
+        "appended_runs": reader.entries,
+        "last_rowid": reader.last_rowid,
+    }
+    write_summary(summary, output)
+    _write_state(
+        _ledger_state(summary, aggregate, run_store, source=source, last_rowid=reader.last_rowid),
+        state_path,
     )
-    write_summary(summary, output_path)
     _write_parquet_tables(
         summary,
         runs_path=Path(runs_parquet_path) if runs_parquet_path else None,
         daily_path=Path(daily_parquet_path) if daily_parquet_path else None,
+        run_store=run_store,
+        batch_size=parquet_batch_size,
     )
     if emit_tail_log:
         _log_summary(summary, action="search-ledger migrate")
     return summary
 
 
+def load_run_table(
+    summary_path: Path | str = DEFAULT_SUMMARY_PATH,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> RunTable:
+    """Load the ledger's runs into a columnar :class:`RunTable`."""
+
+    return RunTable.from_dicts(_iter_run_dicts(summary_path, since=since, until=until))
+
+
+def _load_aggregate(summary_path: Path | str) -> LedgerAggregate | None:
+    """Return the aggregate saved by the ingest that wrote ``summary_path``, if still current."""
+
+    target = Path(summary_path)
+    state = _read_state(_state_path(target))
+    if not state.get("aggregate"):
+        return None
+    if read_summary(target).get("generated_at") != state.get("generated_at"):
+        return None
+    return LedgerAggregate.from_state(state["aggregate"])
+
+
 def compute_preset_drift_from_summary(
     summary_path: Path | str = DEFAULT_SUMMARY_PATH,
     *,
     lookback: int = 50,
     preset_tags_path: Path | str | None = None,
 ) -> list[dict[str, Any]]:
-    summary = read_summary(summary_path)
-    runs_payload = summary.get("runs", [])
-    runs: list[RunRecord] = []
-    if isinstance(runs_payload, list):
-        for entry in runs_payload:
-            if isinstance(entry, dict):
-                runs.append(_record_from_summary(entry))
     preset_tags = _load_preset_tags(Path(preset_tags_path) if preset_tags_path else None)
+    aggregate = _load_aggregate(summary_path)
+    if aggregate is not None and lookback <= aggregate.lookback:
+        # Lifetime totals and the newest samples per preset are already in
+        # the saved state, so no run partitions need to be read.
+        aggregate.lookback = lookback
+        return aggregate.preset_drift(preset_tags)
+    runs = load_run_table(summary_path)
     return _compute_preset_drift(runs, lookback=lookback, preset_tags=preset_tags)
 
 
+def compute_preset_drift_windows(
+    summary_path: Path | str = DEFAULT_SUMMARY_PATH,
+    *,
+    windows: Sequence[str | int] = DEFAULT_DRIFT_WINDOWS,
+    preset_tags_path: Path | str | None = None,
+    now: datetime | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Preset drift for every window in ``windows``, keyed by window label.
+
+    Time windows end at ``now`` (default: the current time). When the saved
+    aggregate kept enough samples the partitions are not read at all;
+    otherwise every window is computed in one pass over the run table.
+    """
+
+    current_time = now or datetime.now(timezone.utc)
+    preset_tags = _load_preset_tags(Path(preset_tags_path) if preset_tags_path else None)
+    aggregate = _load_aggregate(summary_path)
+    if aggregate is not None and aggregate.covers(windows, now=current_time):
+        aggregate.advance_window(current_time)
+        return aggregate.preset_drift_windows(preset_tags, now=current_time, windows=windows)
+    runs = load_run_table(summary_path)
+    if np is not None:
+        return _preset_drift_windows_columnar(runs, windows=windows, preset_tags=preset_tags, now=current_time)
+    counts = [count for _, count, _ in map(_parse_drift_window, windows) if count]
+    fallback = LedgerAggregate(lookback=max(counts, default=1), drift_windows=tuple(windows))
+    fallback.advance_window(current_time)
+    for run in runs:
+        fallback.add(run)
+    return fallback.preset_drift_windows(preset_tags, now=current_time)
+
+
 def _render_stats(summary: dict[str, Any], *, limit: int = 10) -> None:
     if not summary:
         print("No telemetry summary found. Run the ingest command first.")
@@ -603,17 +2079,55 @@ def _render_stats(summary: dict[str, Any], *, limit: int = 10) -> None:
         )
 
 
+def _print_migration_progress(migrated: int, last_rowid: int, max_rowid: int) -> None:
+    print(f"Migrated {migrated} rows (rowid {last_rowid}/{max_rowid})", file=sys.stderr)
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Search telemetry ledger commands")
     parser.add_argument("--no-tail-log", action="store_true", help="Disable tail log emission")
     subparsers = parser.add_subparsers(dest="command", required=False)
 
     ingest_parser = subparsers.add_parser("ingest", help="Recompute ledger from JSONL log")
-    ingest_parser.add_argument("--log-path", type=Path, default=DEFAULT_LOG_PATH)
+    ingest_parser.add_argument(
+        "--log-path",
+        type=Path,
+        default=DEFAULT_LOG_PATH,
+        help="Log file, or a quoted glob such as 'logs/search-history.jsonl*' to include rotations",
+    )
+    ingest_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used for a glob --log-path (default: CPU count)",
+    )
     ingest_parser.add_argument("--output", type=Path, default=DEFAULT_SUMMARY_PATH)
     ingest_parser.add_argument("--preset-tags", type=Path, default=None)
     ingest_parser.add_argument("--lookback", type=int, default=50)
-    ingest_parser.add_argument("--runs-parquet", type=Path, default=None, help="Optional Parquet path for run-level entries")
+    ingest_parser.add_argument(
+        "--drift-window",
+        dest="drift_windows",
+        action="append",
+        default=None,
+        help="Drift window as a run count (50) or span (24h); repeatable, defaults to 20/50/200/1h/24h/7d",
+    )
+    ingest_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only parse lines appended since the last incremental ingest",
+    )
+    ingest_parser.add_argument(
+        "--runs-parquet",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_RUNS_PARQUET_PATH,
+        default=None,
+        help=(
+            "Day-partitioned Parquet dataset directory for run-level entries (default "
+            f"{DEFAULT_RUNS_PARQUET_PATH.name}/ when given without a path); a .parquet file "
+            "path is rewritten in full on every ingest"
+        ),
+    )
     ingest_parser.add_argument(
         "--daily-parquet",
         type=Path,
@@ -628,8 +2142,33 @@ def _build_parser() -> argparse.ArgumentParser:
     migrate_parser.add_argument("--output", type=Path, default=DEFAULT_SUMMARY_PATH)
     migrate_parser.add_argument("--preset-tags", type=Path, default=None)
     migrate_parser.add_argument("--lookback", type=int, default=50)
-    migrate_parser.add_argument("--runs-parquet", type=Path, default=None)
+    migrate_parser.add_argument(
+        "--drift-window",
+        dest="drift_windows",
+        action="append",
+        default=None,
+        help="Drift window as a run count (50) or span (24h); repeatable, defaults to 20/50/200/1h/24h/7d",
+    )
+    migrate_parser.add_argument("--runs-parquet", type=Path, nargs="?", const=DEFAULT_RUNS_PARQUET_PATH, default=None)
     migrate_parser.add_argument("--daily-parquet", type=Path, default=None)
+    migrate_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_SQLITE_CHUNK_ROWS,
+        help="Rows fetched from SQLite per page",
+    )
+    migrate_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue after the last migrated rowid instead of starting over",
+    )
+    for command_parser in (ingest_parser, migrate_parser):
+        command_parser.add_argument(
+            "--parquet-batch-size",
+            type=int,
+            default=DEFAULT_PARQUET_BATCH_SIZE,
+            help="Rows per Parquet record batch",
+        )
 
     stats_parser = subparsers.add_parser("stats", help="Print ledger summary details")
     stats_parser.add_argument("--summary-path", type=Path, default=DEFAULT_SUMMARY_PATH)
@@ -657,6 +2196,11 @@ def main(argv: Sequence[str] | None = None) -> int:
             runs_parquet_path=args.runs_parquet,
             daily_parquet_path=args.daily_parquet,
             emit_tail_log=tail_log_enabled,
+            drift_windows=args.drift_windows or DEFAULT_DRIFT_WINDOWS,
+            parquet_batch_size=args.parquet_batch_size,
+            chunk_size=args.chunk_size,
+            resume=args.resume,
+            progress=_print_migration_progress,
         )
         print(f"Ledger written to {args.output}")
         return 0
@@ -669,6 +2213,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         runs_parquet_path=args.runs_parquet,
         daily_parquet_path=args.daily_parquet,
         emit_tail_log=tail_log_enabled,
+        incremental=getattr(args, "incremental", False),
+        drift_windows=getattr(args, "drift_windows", None) or DEFAULT_DRIFT_WINDOWS,
+        workers=getattr(args, "workers", None),
+        parquet_batch_size=getattr(args, "parquet_batch_size", DEFAULT_PARQUET_BATCH_SIZE),
     )
     print(f"Ledger written to {args.output}")
     return 0
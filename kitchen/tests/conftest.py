@@ -9,3 +9,5 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
 	sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.utils.tail_log import isolated_tail_log  # noqa: E402,F401
@@ -63,11 +63,11 @@ def test_load_interactions_uses_datastore_when_no_path(monkeypatch: pytest.Monke
 			self.list_calls: list[int] = []
 
 		def count_interactions(self) -> int:
-			return 1
+			raise AssertionError("paging should not need a count")
 
-		def list_interactions(self, limit: int):
+		def list_interactions(self, limit: int, *, cursor=None, since=None, until=None):
 			self.list_calls.append(limit)
-			return [record]
+			return [record] if cursor is None else []
 
 	@contextmanager
 	def fake_context():
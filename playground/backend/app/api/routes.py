@@ -4,9 +4,13 @@ from __future__ import annotations
 # @tag:backend,api,ops
 
 # --- Imports -----------------------------------------------------------------
+import math
 from dataclasses import asdict
+from datetime import datetime
+from typing import Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from ..config import get_settings
 from ..schemas import (
@@ -14,6 +18,10 @@ from ..schemas import (
     ArtifactRead,
     ChatPayload,
     ChatResponse,
+    InteractionRead,
+    LLMCacheStats,
+    LLMLimiterStats,
+    LLMSingleFlightStats,
     OpsCommandRequest,
     OpsCommandResponse,
     OpsStatus,
@@ -21,9 +29,22 @@ from ..schemas import (
     TailLogEntryCreate,
     TailLogEntryRead,
 )
-from ..services.data_store import BaseDataStore, get_data_store
-from ..services.llm_client import get_llm_client
+from ..services.async_data_store import AsyncBaseDataStore, get_async_data_store
+from ..services.chat_stream import chat_stream_events, primed
+from ..services.data_store import (
+    ArtifactRecord,
+    BaseDataStore,
+    InteractionRecord,
+    PageCursor,
+    TailLogRecord,
+    get_data_store,
+)
+from ..services.interaction_recorder import get_interaction_recorder
+from ..services.llm_client import get_llm_client, llm_cache_stats, llm_limiter_stats, llm_single_flight_stats
+from ..services.llm_limiter import LLMRateLimitedError
 from ..services.search_telemetry import get_search_telemetry_summary
+from ..services.tail_log_broker import get_tail_log_broker
+from ..services.tail_log_stream import tail_log_events
 
 from app.services.orchestrator import get_orchestrator  # type: ignore  # noqa: E402
 
@@ -32,10 +53,57 @@ from app.services.orchestrator import get_orchestrator  # type: ignore  # noqa:
 router = APIRouter(tags=["chat", "canvas"])
 
 
+# --- Keyset paging -------------------------------------------------------------
+def _decode_cursor(token: str | None) -> PageCursor | None:
+    if token is None:
+        return None
+    try:
+        return PageCursor.decode(token)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def _page_cursor(cursor: str | None = Query(None, description="X-Next-Cursor from the previous page")) -> PageCursor | None:
+    return _decode_cursor(cursor)
+
+
+def _set_next_cursor(
+    response: Response,
+    records: Sequence[InteractionRecord | ArtifactRecord | TailLogRecord],
+    limit: int,
+) -> None:
+    # A short page is the last one; a full page may have more behind it.
+    if len(records) == limit:
+        response.headers["X-Next-Cursor"] = PageCursor.after(records[-1]).encode()
+
+
+# --- Chat --------------------------------------------------------------------
+def _llm_failure(exc: Exception) -> HTTPException:
+    # Provider throttling that outlasted the client's retries is passed on as 429.
+    if isinstance(exc, LLMRateLimitedError):
+        retry_after = exc.retry_after
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="LLM provider is rate limiting requests; retry later",
+            headers={"Retry-After": str(math.ceil(retry_after))} if retry_after is not None else None,
+        )
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail="Failed to retrieve LLM response",
+    )
+
+
+def _record_interaction(data_store: AsyncBaseDataStore):
+    # Write-behind acknowledges with a pre-assigned id and commits in the background.
+    if get_settings().interaction_write_mode == "write_behind":
+        return get_interaction_recorder().record
+    return data_store.record_interaction
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def create_chat_completion(
     payload: ChatPayload,
-    data_store: BaseDataStore = Depends(get_data_store),
+    data_store: AsyncBaseDataStore = Depends(get_async_data_store),
 ):
     settings = get_settings()
     llm_client = get_llm_client()
@@ -43,12 +111,10 @@ async def create_chat_completion(
     try:
         llm_result = await llm_client.generate(payload.final_prompt_text)
     except Exception as exc:  # pragma: no cover - network errors
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to retrieve LLM response",
-        ) from exc
+        raise _llm_failure(exc) from exc
 
-    interaction = data_store.record_interaction(
+    record = _record_interaction(data_store)
+    interaction = await record(
         prompt=payload.final_prompt_text,
         metadata=payload.to_metadata_dict(),
         llm_text=llm_result.text,
@@ -61,16 +127,95 @@ async def create_chat_completion(
         ai_response_text=interaction.ai_response_text,
         model_name=interaction.model_name or settings.openai_model,
         latency_ms=interaction.latency_ms,
+        first_token_ms=interaction.first_token_ms,
+        cached=llm_result.cached,
         created_at=interaction.created_at,
     )
 
 
+@router.get("/llm/cache", response_model=LLMCacheStats)
+def get_llm_cache_stats():
+    stats = llm_cache_stats()
+    return LLMCacheStats(enabled=stats is not None, **(stats or {}))
+
+
+@router.get("/llm/single-flight", response_model=LLMSingleFlightStats)
+def get_llm_single_flight_stats():
+    stats = llm_single_flight_stats()
+    return LLMSingleFlightStats(enabled=stats is not None, **(stats or {}))
+
+
+@router.get("/llm/limiter", response_model=LLMLimiterStats)
+def get_llm_limiter_stats():
+    stats = llm_limiter_stats()
+    return LLMLimiterStats(enabled=stats is not None, **(stats or {}))
+
+
+@router.post("/chat/stream", response_class=StreamingResponse)
+async def stream_chat_completion(
+    payload: ChatPayload,
+    data_store: AsyncBaseDataStore = Depends(get_async_data_store),
+):
+    """Stream the completion as NDJSON ``token`` frames, then a ``done`` frame shaped like ``/chat``.
+
+    The interaction is stored once the stream ends, with ``first_token_ms``
+    next to ``latency_ms``.
+    """
+
+    settings = get_settings()
+    record = _record_interaction(data_store)
+
+    async def write(text: str, model_name: str, latency_ms: int, first_token_ms: int | None):
+        return await record(
+            prompt=payload.final_prompt_text,
+            metadata=payload.to_metadata_dict(),
+            llm_text=text,
+            model_name=model_name,
+            latency_ms=latency_ms,
+            first_token_ms=first_token_ms,
+        )
+
+    events = chat_stream_events(
+        get_llm_client().generate_stream(payload.final_prompt_text),
+        write,
+        default_model=settings.openai_model,
+    )
+    try:
+        frames = await primed(events)
+    except Exception as exc:  # pragma: no cover - network errors
+        raise _llm_failure(exc) from exc
+    return StreamingResponse(
+        frames,
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/interactions", response_model=list[InteractionRead])
+def list_interactions(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: PageCursor | None = Depends(_page_cursor),
+    since: datetime | None = None,
+    until: datetime | None = None,
+    data_store: BaseDataStore = Depends(get_data_store),
+):
+    records = data_store.list_interactions(limit, cursor=cursor, since=since, until=until)
+    _set_next_cursor(response, records, limit)
+    return [InteractionRead.model_validate(asdict(record)) for record in records]
+
+
 @router.get("/artifacts", response_model=list[ArtifactRead])
 def list_artifacts(
+    response: Response,
     limit: int = Query(8, ge=1, le=64),
+    cursor: PageCursor | None = Depends(_page_cursor),
+    since: datetime | None = None,
+    until: datetime | None = None,
     data_store: BaseDataStore = Depends(get_data_store),
 ):
-    records = data_store.list_artifacts(limit)
+    records = data_store.list_artifacts(limit, cursor=cursor, since=since, until=until)
+    _set_next_cursor(response, records, limit)
     return [ArtifactRead.model_validate(asdict(record)) for record in records]
 
 
@@ -85,13 +230,42 @@ def create_artifact(
 
 @router.get("/tail-log", response_model=list[TailLogEntryRead])
 def list_tail_log(
+    response: Response,
     limit: int = Query(18, ge=1, le=200),
+    cursor: PageCursor | None = Depends(_page_cursor),
+    since: datetime | None = None,
+    until: datetime | None = None,
     data_store: BaseDataStore = Depends(get_data_store),
 ):
-    entries = data_store.list_tail_log(limit)
+    entries = data_store.list_tail_log(limit, cursor=cursor, since=since, until=until)
+    _set_next_cursor(response, entries, limit)
     return [TailLogEntryRead.model_validate(asdict(entry)) for entry in entries]
 
 
+@router.get("/tail-log/stream", response_class=StreamingResponse)
+async def stream_tail_log(
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    after: str | None = Query(None, description="Event id to resume after when no Last-Event-ID is sent"),
+    data_store: AsyncBaseDataStore = Depends(get_async_data_store),
+):
+    """Server-sent events for new tail-log entries; reconnects resume via ``Last-Event-ID``."""
+
+    settings = get_settings()
+    events = tail_log_events(
+        data_store,
+        get_tail_log_broker(),
+        cursor=_decode_cursor(last_event_id or after),
+        heartbeat=settings.tail_log_stream_heartbeat_s,
+        resync=settings.tail_log_stream_resync_s,
+        lag=settings.tail_log_stream_lag_s,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/tail-log", response_model=TailLogEntryRead, status_code=status.HTTP_201_CREATED)
 def create_tail_log_entry(
     payload: TailLogEntryCreate,
@@ -17,6 +17,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 _ENV_LAB_ROOT = os.environ.get("LAB_ROOT")
 PROJECT_ROOT = Path(_ENV_LAB_ROOT).expanduser().resolve() if _ENV_LAB_ROOT else Path(__file__).resolve().parents[3]
 DEFAULT_DB_PATH = PROJECT_ROOT / "data" / "interactions.db"
+# Runtime state, not repo data: ``.cache/`` is gitignored.
+DEFAULT_LLM_CACHE_PATH = PROJECT_ROOT / ".cache" / "llm_cache.sqlite3"
 
 
 # --- Settings model -----------------------------------------------------------
@@ -36,16 +38,134 @@ class Settings(BaseSettings):
         default="sqlite", alias="DATABASE_PROVIDER"
     )
     database_path: Path = Field(default=DEFAULT_DB_PATH, alias="DATABASE_PATH")
+    sql_echo: bool = Field(default=False, alias="SQL_ECHO", description="Log every SQL statement")
+    sqlite_journal_mode: Literal["wal", "delete", "truncate", "persist", "memory"] = Field(
+        default="wal",
+        alias="SQLITE_JOURNAL_MODE",
+        description="WAL lets readers proceed while a writer commits",
+    )
+    sqlite_synchronous: Literal["off", "normal", "full", "extra"] = Field(
+        default="normal",
+        alias="SQLITE_SYNCHRONOUS",
+        description="normal is durable under WAL except for the last commits on power loss",
+    )
+    sqlite_mmap_size_mb: int = Field(default=256, alias="SQLITE_MMAP_SIZE_MB", ge=0)
+    sqlite_cache_size_mb: int = Field(default=64, alias="SQLITE_CACHE_SIZE_MB", ge=1)
+    sqlite_busy_timeout_ms: int = Field(default=5000, alias="SQLITE_BUSY_TIMEOUT_MS", ge=0)
     json_store_path: Path = Field(
         default=PROJECT_ROOT / "data" / "playground_store.json",
         alias="JSON_STORE_PATH",
     )
+    json_store_mode: Literal["snapshot", "segments"] = Field(
+        default="snapshot",
+        alias="JSON_STORE_MODE",
+        description="snapshot rewrites one JSON file per write; segments appends to per-collection JSONL files",
+    )
+    json_flush_delay_ms: int = Field(
+        default=250,
+        alias="JSON_FLUSH_DELAY_MS",
+        description="Maximum delay before in-memory JSON snapshot writes are flushed to disk",
+        ge=0,
+    )
+    json_segment_max_bytes: int = Field(default=4 * 1024 * 1024, alias="JSON_SEGMENT_MAX_BYTES", ge=1024)
+    json_segment_compact_after: int = Field(default=8, alias="JSON_SEGMENT_COMPACT_AFTER", ge=2)
+    interaction_write_mode: Literal["sync", "write_behind"] = Field(
+        default="sync",
+        alias="INTERACTION_WRITE_MODE",
+        description="write_behind returns /chat responses before the interaction is committed",
+    )
+    interaction_max_unflushed: int = Field(
+        default=256,
+        alias="INTERACTION_MAX_UNFLUSHED",
+        description="Write-behind durability bound: acknowledged interactions that may be lost on a crash",
+        ge=1,
+    )
+    interaction_batch_size: int = Field(default=64, alias="INTERACTION_BATCH_SIZE", ge=1)
+    interaction_flush_interval_ms: int = Field(default=50, alias="INTERACTION_FLUSH_INTERVAL_MS", ge=0)
+    tail_log_stream_heartbeat_s: float = Field(
+        default=15.0,
+        alias="TAIL_LOG_STREAM_HEARTBEAT_S",
+        description="Keep-alive comment interval on /api/tail-log/stream",
+        gt=0,
+    )
+    tail_log_stream_resync_s: float = Field(
+        default=30.0,
+        alias="TAIL_LOG_STREAM_RESYNC_S",
+        description="Keyset read that picks up entries written by other processes; 0 disables it",
+        ge=0,
+    )
+    tail_log_stream_lag_s: float = Field(
+        default=10.0,
+        alias="TAIL_LOG_STREAM_LAG_S",
+        description="How far behind the newest sent entry a late commit can land and still be streamed",
+        ge=0,
+    )
     llm_provider: Literal["openai", "echo"] = Field(
         default="echo", alias="LLM_PROVIDER"
     )
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4o-mini", alias="OPENAI_MODEL")
+    openai_base_url: str = Field(default="https://api.openai.com/v1", alias="OPENAI_BASE_URL")
+    llm_timeout_s: float = Field(default=30.0, alias="LLM_TIMEOUT_S", gt=0)
+    llm_http2: bool = Field(
+        default=True,
+        alias="LLM_HTTP2",
+        description="Multiplex LLM requests over HTTP/2 (needs the h2 package; HTTP/1.1 keep-alive otherwise)",
+    )
+    llm_max_connections: int = Field(default=100, alias="LLM_MAX_CONNECTIONS", ge=1)
+    llm_max_keepalive_connections: int = Field(default=20, alias="LLM_MAX_KEEPALIVE_CONNECTIONS", ge=0)
+    llm_keepalive_expiry_s: float = Field(default=30.0, alias="LLM_KEEPALIVE_EXPIRY_S", ge=0)
+    llm_rate_limit_rpm: int = Field(
+        default=500,
+        alias="LLM_RATE_LIMIT_RPM",
+        ge=0,
+        description="Client-side requests/minute budget for the provider; 0 disables it",
+    )
+    llm_rate_limit_tpm: int = Field(
+        default=200_000,
+        alias="LLM_RATE_LIMIT_TPM",
+        ge=0,
+        description="Client-side tokens/minute budget (prompt estimate + max tokens); 0 disables it",
+    )
+    llm_rate_limit_burst_s: float = Field(
+        default=1.0,
+        alias="LLM_RATE_LIMIT_BURST_S",
+        gt=0,
+        description="Seconds of the RPM/TPM budget that may be spent at once",
+    )
+    llm_max_concurrency: int = Field(default=16, alias="LLM_MAX_CONCURRENCY", ge=1)
+    llm_max_retries: int = Field(default=4, alias="LLM_MAX_RETRIES", ge=0)
+    llm_backoff_base_s: float = Field(default=0.5, alias="LLM_BACKOFF_BASE_S", gt=0)
+    llm_backoff_max_s: float = Field(default=20.0, alias="LLM_BACKOFF_MAX_S", gt=0)
     max_response_tokens: int = Field(default=512, alias="MAX_RESPONSE_TOKENS")
+    llm_cache_enabled: bool = Field(
+        default=False,
+        alias="LLM_CACHE_ENABLED",
+        description=(
+            "Serve identical (provider, model, prompt, params) requests from the response cache; "
+            "opt-in because sampled completions would otherwise repeat verbatim"
+        ),
+    )
+    llm_cache_ttl_s: float = Field(default=3600.0, alias="LLM_CACHE_TTL_S", gt=0)
+    llm_cache_memory_max_entries: int = Field(
+        default=512,
+        alias="LLM_CACHE_MEMORY_MAX_ENTRIES",
+        ge=0,
+        description="In-process LRU size; 0 disables the memory tier",
+    )
+    llm_cache_disk_max_entries: int = Field(
+        default=10_000,
+        alias="LLM_CACHE_DISK_MAX_ENTRIES",
+        ge=0,
+        description="SQLite tier size; 0 disables the disk tier",
+    )
+    llm_cache_path: Path = Field(default=DEFAULT_LLM_CACHE_PATH, alias="LLM_CACHE_PATH")
+    llm_single_flight_enabled: bool = Field(
+        default=True,
+        alias="LLM_SINGLE_FLIGHT_ENABLED",
+        description="Share one provider call among concurrent identical generate requests",
+    )
+    llm_single_flight_timeout_s: float = Field(default=60.0, alias="LLM_SINGLE_FLIGHT_TIMEOUT_S", gt=0)
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     cosmos_endpoint: Optional[str] = Field(default=None, alias="COSMOS_ENDPOINT")
     cosmos_database: Optional[str] = Field(default=None, alias="COSMOS_DATABASE")
@@ -68,6 +188,18 @@ class Settings(BaseSettings):
     cosmos_consistency: Literal["Session", "Eventual", "Strong", "ConsistentPrefix"] = Field(
         default="Session", alias="COSMOS_CONSISTENCY"
     )
+    cosmos_partition_strategy: Literal["day", "tenant"] = Field(
+        default="day",
+        alias="COSMOS_PARTITION_STRATEGY",
+        description="Partition key for Playground containers: the UTC day of each record, or COSMOS_TENANT",
+    )
+    cosmos_tenant: str = Field(default="default", alias="COSMOS_TENANT")
+    cosmos_partition_lookback_days: int = Field(
+        default=7,
+        alias="COSMOS_PARTITION_LOOKBACK_DAYS",
+        description="Day partitions read one by one before a list falls back to a cross-partition query",
+        ge=1,
+    )
     elements_max_active_runs: int = Field(
         default=3,
         alias="ELEMENTS_MAX_ACTIVE_RUNS",
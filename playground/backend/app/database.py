@@ -4,10 +4,12 @@ from __future__ import annotations
 # @tag:backend,models
 
 # --- Imports -----------------------------------------------------------------
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Iterator, Self
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from .config import get_settings
@@ -18,6 +20,52 @@ class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
 
 
+class UnitOfWorkMixin:
+    """Let a session-backed repository defer its commits to a batch scope.
+
+    Write methods call ``_commit()``; inside ``unit_of_work()`` that only
+    flushes, and the scope commits once on exit (or rolls back on error).
+    Side effects that must only follow a commit go through ``_after_commit``.
+    """
+
+    _session: Session
+    _unit_of_work_depth = 0
+    _pending_callbacks: list[Callable[[], None]] | None = None
+
+    def _commit(self) -> None:
+        if self._unit_of_work_depth:
+            self._session.flush()
+        else:
+            self._session.commit()
+
+    def _after_commit(self, callback: Callable[[], None]) -> None:
+        if not self._unit_of_work_depth:
+            callback()
+            return
+        if self._pending_callbacks is None:
+            self._pending_callbacks = []
+        self._pending_callbacks.append(callback)
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Self]:
+        self._unit_of_work_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._unit_of_work_depth == 1:
+                self._session.rollback()
+                self._pending_callbacks = None
+            raise
+        else:
+            if self._unit_of_work_depth == 1:
+                self._session.commit()
+                callbacks, self._pending_callbacks = self._pending_callbacks or [], None
+                for callback in callbacks:
+                    callback()
+        finally:
+            self._unit_of_work_depth -= 1
+
+
 def _ensure_parent_directory(database_path: Path) -> None:
     database_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -35,8 +83,41 @@ def _assert_sqlite_backend() -> None:
         )
 
 
+def sqlite_pragmas(settings) -> list[str]:
+    """PRAGMA statements applied to every new SQLite connection."""
+
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode.upper()}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous.upper()}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size_mb * 1024 * 1024}",
+        # Negative cache_size is in KiB rather than pages.
+        f"PRAGMA cache_size={-settings.sqlite_cache_size_mb * 1024}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def apply_sqlite_pragmas(engine: Engine, settings) -> None:
+    """Run :func:`sqlite_pragmas` whenever ``engine`` opens a DBAPI connection."""
+
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 def get_engine():
-    """Return a module-level SQLite engine (created lazily)."""
+    """Return a module-level SQLite engine, created and migrated on first use.
+
+    Migrating here rather than in the app lifespan means CLI scripts and
+    ``data_store_context()`` callers never hit an out-of-date schema.
+    """
 
     _assert_sqlite_backend()
 
@@ -49,9 +130,13 @@ def get_engine():
         _engine = create_engine(
             f"sqlite:///{db_path.as_posix()}",
             future=True,
-            echo=settings.environment == "local",
+            echo=settings.sql_echo,
             connect_args=connect_args,
         )
+        apply_sqlite_pragmas(_engine, settings)
+        from .migrations import apply_migrations  # migrations imports this module
+
+        apply_migrations(_engine)
     return _engine
 
 
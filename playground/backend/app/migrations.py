@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+"""Versioned schema migrations for existing Playground SQLite databases."""
+# @tag:backend,models
+
+# --- Imports -----------------------------------------------------------------
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+
+from . import models  # noqa: F401 - registers tables on Base.metadata
+from .database import Base, get_engine
+
+
+# --- Migrations ---------------------------------------------------------------
+def _create_model_indexes(connection: Connection) -> None:
+    # ``create_all`` skips tables that already exist, indexes included, so
+    # databases created before the indexes were declared need them added.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def _add_interaction_first_token_ms(connection: Connection) -> None:
+    columns = {row[1] for row in connection.execute(text("PRAGMA table_info(interactions)"))}
+    if "first_token_ms" not in columns:
+        connection.execute(text("ALTER TABLE interactions ADD COLUMN first_token_ms INTEGER"))
+
+
+# (version, description, upgrade). The applied version is kept in
+# ``PRAGMA user_version``; append new steps with the next number.
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "indexes for newest-first list queries", _create_model_indexes),
+    (2, "time-to-first-token next to interaction latency", _add_interaction_first_token_ms),
+]
+
+
+def schema_version(connection: Connection) -> int:
+    return int(connection.execute(text("PRAGMA user_version")).scalar() or 0)
+
+
+def apply_migrations(engine: Engine | None = None) -> list[int]:
+    """Create missing tables, then run every migration newer than the stored version."""
+
+    engine = engine or get_engine()
+    applied: list[int] = []
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection)
+        current = schema_version(connection)
+        for version, _description, upgrade in MIGRATIONS:
+            if version <= current:
+                continue
+            upgrade(connection)
+            connection.execute(text(f"PRAGMA user_version = {version}"))
+            applied.append(version)
+    return applied
+
+
+def migrate_sqlite_file(database_path: Path) -> list[int]:
+    """Apply migrations to ``database_path`` through a short-lived sync engine."""
+
+    engine = create_engine(f"sqlite:///{database_path.as_posix()}", future=True)
+    try:
+        return apply_migrations(engine)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    versions = apply_migrations()
+    print(f"Applied migrations: {versions}" if versions else "Schema is up to date")
@@ -7,7 +7,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -18,6 +18,7 @@ class Interaction(Base):
     """Full fidelity capture of each prompt/response pair."""
 
     __tablename__ = "interactions"
+    __table_args__ = (Index("ix_interactions_created_at", "created_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -27,6 +28,7 @@ class Interaction(Base):
     ai_response_text: Mapped[str] = mapped_column(Text, nullable=False)
     model_name: Mapped[str] = mapped_column(String(64), nullable=False)
     latency_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    first_token_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -39,6 +41,7 @@ class Artifact(Base):
     """Pinned notes/insights surfaced on the Canvas + Artifact shelf."""
 
     __tablename__ = "artifacts"
+    __table_args__ = (Index("ix_artifacts_updated_at", "updated_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -66,6 +69,7 @@ class TailLogEntry(Base):
     """Short-form events mirrored by the UI and DataLab notebooks."""
 
     __tablename__ = "tail_log_entries"
+    __table_args__ = (Index("ix_tail_log_entries_created_at", "created_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -84,6 +88,10 @@ class ElementGraph(Base):
     """Persisted Elements graph definitions with tenant/workspace scoping."""
 
     __tablename__ = "element_graphs"
+    __table_args__ = (
+        Index("ix_element_graphs_tenant_workspace_updated_at", "tenant_id", "workspace_id", "updated_at"),
+        Index("ix_element_graphs_updated_at", "updated_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     name: Mapped[str] = mapped_column(String(160), nullable=False)
@@ -105,6 +113,10 @@ class ElementRun(Base):
     """Execution log for Elements graphs (synchronous prototype)."""
 
     __tablename__ = "element_runs"
+    __table_args__ = (
+        Index("ix_element_runs_graph_id_created_at", "graph_id", "created_at"),
+        Index("ix_element_runs_status", "status"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     graph_id: Mapped[str] = mapped_column(String(36), ForeignKey("element_graphs.id"), nullable=False)
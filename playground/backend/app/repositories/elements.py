@@ -13,6 +13,7 @@ from uuid import uuid4
 from sqlalchemy.orm import Session
 
 from ..config import Settings, get_settings
+from ..database import UnitOfWorkMixin
 from ..models import ElementGraph, ElementRun
 from ..schemas import (
     GraphCreateRequest,
@@ -84,8 +85,12 @@ class ElementGraphRepository(Protocol):
 
 
 # --- SQLAlchemy implementation -------------------------------------------------
-class SqlElementGraphRepository:
-    """SQL-backed repository used for local dev and CI."""
+class SqlElementGraphRepository(UnitOfWorkMixin):
+    """SQL-backed repository used for local dev and CI.
+
+    Ids and timestamps are assigned client-side, so results are built from
+    the values written rather than refreshed from the database.
+    """
 
     def __init__(self, session: Session):
         self._session = session
@@ -100,16 +105,20 @@ class SqlElementGraphRepository:
         return [_row_to_graph(graph) for graph in graphs]
 
     def create_graph(self, payload: GraphCreateRequest) -> GraphRead:
+        now = datetime.now(timezone.utc)
         graph = ElementGraph(
+            id=str(uuid4()),
             name=payload.name,
             tenant_id=payload.tenant_id,
             workspace_id=payload.workspace_id,
             definition=payload.model_dump(by_alias=True),
+            created_at=now,
+            updated_at=now,
         )
+        result = _row_to_graph(graph)
         self._session.add(graph)
-        self._session.commit()
-        self._session.refresh(graph)
-        return _row_to_graph(graph)
+        self._commit()
+        return result
 
     def get_graph(self, graph_id: str) -> GraphRead | None:
         graph = self._session.get(ElementGraph, graph_id)
@@ -124,10 +133,9 @@ class SqlElementGraphRepository:
         graph.workspace_id = payload.workspace_id
         graph.definition = payload.model_dump(by_alias=True)
         graph.updated_at = datetime.now(timezone.utc)
-        self._session.add(graph)
-        self._session.commit()
-        self._session.refresh(graph)
-        return _row_to_graph(graph)
+        result = _row_to_graph(graph)
+        self._commit()
+        return result
 
     def delete_graph(self, graph_id: str) -> None:
         graph = self._session.get(ElementGraph, graph_id)
@@ -135,7 +143,7 @@ class SqlElementGraphRepository:
             return
         self._session.query(ElementRun).filter(ElementRun.graph_id == graph_id).delete()
         self._session.delete(graph)
-        self._session.commit()
+        self._commit()
 
     def get_run(self, run_id: str) -> GraphRunRead | None:
         run = self._session.get(ElementRun, run_id)
@@ -143,19 +151,22 @@ class SqlElementGraphRepository:
 
     def delete_runs_for_graph(self, graph_id: str) -> None:
         self._session.query(ElementRun).filter(ElementRun.graph_id == graph_id).delete()
-        self._session.commit()
+        self._commit()
 
     def create_run(self, graph: GraphRead, status: GraphRunStatus = "queued") -> GraphRunRead:
         run = ElementRun(
+            id=str(uuid4()),
             graph_id=graph.id,
             status=status,
             result_json={"outputs": {}, "trace": []},
             error=None,
+            created_at=datetime.now(timezone.utc),
+            completed_at=None,
         )
+        result = _row_to_run(run)
         self._session.add(run)
-        self._session.commit()
-        self._session.refresh(run)
-        return _row_to_run(run)
+        self._commit()
+        return result
 
     def update_run(
         self,
@@ -176,10 +187,9 @@ class SqlElementGraphRepository:
             run.error = error
         if status in ("succeeded", "failed"):
             run.completed_at = datetime.now(timezone.utc)
-        self._session.add(run)
-        self._session.commit()
-        self._session.refresh(run)
-        return _row_to_run(run)
+        updated = _row_to_run(run)
+        self._commit()
+        return updated
 
     def count_active_runs(self, tenant_id: str, workspace_id: str) -> int:
         query = (
@@ -65,9 +65,43 @@ class ChatResponse(APIModel):
     ai_response_text: str
     model_name: str
     latency_ms: int
+    first_token_ms: Optional[int] = None
+    cached: bool = False
     created_at: datetime
 
 
+class LLMCacheStats(APIModel):
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+    memory_entries: int = 0
+    disk_entries: int = 0
+
+
+class LLMSingleFlightStats(APIModel):
+    enabled: bool
+    calls: int = 0
+    coalesced: int = 0
+    timeouts: int = 0
+    abandoned: int = 0
+    in_flight: int = 0
+
+
+class LLMLimiterStats(APIModel):
+    enabled: bool
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    in_flight: int = 0
+
+
 class InteractionRead(APIModel):
     id: UUID
     user_prompt_text: str
@@ -75,6 +109,7 @@ class InteractionRead(APIModel):
     ai_response_text: str
     model_name: str
     latency_ms: int
+    first_token_ms: Optional[int] = None
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True, protected_namespaces=())
@@ -100,6 +135,14 @@ class ArtifactRead(ArtifactCreate):
     model_config = ConfigDict(from_attributes=True, protected_namespaces=())
 
 
+class ArtifactImport(ArtifactCreate):
+    """Bulk-import row; the original id and timestamps are kept when present."""
+
+    id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 # --- Tail log entries --------------------------------------------------------
 class TailLogEntryCreate(APIModel):
     message: str = Field(..., min_length=2)
@@ -112,6 +155,13 @@ class TailLogEntryRead(TailLogEntryCreate):
     model_config = ConfigDict(from_attributes=True, protected_namespaces=())
 
 
+class TailLogEntryImport(TailLogEntryCreate):
+    """Bulk-import row; the original id and timestamp are kept when present."""
+
+    id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+
+
 # --- Ops Deck schemas --------------------------------------------------------
 class ServiceStatus(APIModel):
     name: str
@@ -209,6 +259,7 @@ class SearchTelemetrySummary(APIModel):
     last_ingest_at: datetime | None = None
     top_patterns: list[SearchTelemetryTopPattern] = Field(default_factory=list)
     preset_drift: list[SearchPresetDrift] = Field(default_factory=list)
+    preset_drift_windows: dict[str, list[SearchPresetDrift]] = Field(default_factory=dict)
 
 
 # --- Control Center schemas -------------------------------------------------
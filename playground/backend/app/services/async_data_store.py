@@ -0,0 +1,625 @@
+from __future__ import annotations
+
+"""Async counterparts of the Playground data stores for event-loop callers."""
+# @tag: backend,services,data
+
+import asyncio
+import time
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Protocol, TypeVar
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from ..config import get_settings
+from ..database import apply_sqlite_pragmas
+from ..migrations import migrate_sqlite_file
+from ..models import Artifact, Interaction, TailLogEntry
+from ..schemas import ArtifactCreate, TailLogEntryCreate
+from .data_store import (
+    COSMOS_PARTITION_PATH,
+    ArtifactRecord,
+    BaseDataStore,
+    CosmosDataStore,
+    CosmosMetrics,
+    InteractionRecord,
+    PageCursor,
+    TailLogRecord,
+    _CosmosRequestCharge,
+    _artifact_doc,
+    _cosmos_container_options,
+    _cosmos_page_query,
+    _cosmos_partition_key,
+    _cosmos_partition_value,
+    _cosmos_policy_upgrade,
+    _cosmos_read_plan,
+    _interaction_doc,
+    _keyset_filter,
+    _tail_log_doc,
+    data_store_context,
+)
+from .tail_log_broker import publish_tail_log
+
+try:  # pragma: no cover - optional dependency
+    import aiosqlite  # noqa: F401
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+except ImportError:  # pragma: no cover
+    aiosqlite = None  # type: ignore
+    async_sessionmaker = None  # type: ignore
+    create_async_engine = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    from azure.cosmos.aio import CosmosClient as AsyncCosmosClient
+    from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+except ImportError:  # pragma: no cover
+    AsyncCosmosClient = None  # type: ignore
+    AsyncDefaultAzureCredential = None  # type: ignore
+
+T = TypeVar("T")
+
+
+class AsyncBaseDataStore(Protocol):
+    """Async contract mirroring :class:`BaseDataStore`."""
+
+    async def record_interaction(
+        self,
+        *,
+        prompt: str,
+        metadata: dict[str, Any],
+        llm_text: str,
+        model_name: str,
+        latency_ms: int,
+        first_token_ms: int | None = None,
+    ) -> InteractionRecord:
+        ...
+
+    async def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        ...
+
+    async def count_interactions(self) -> int:
+        ...
+
+    async def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        ...
+
+    async def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
+        ...
+
+    async def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        ...
+
+    async def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
+        ...
+
+    async def aclose(self) -> None:
+        ...
+
+
+# --- Thread offload -------------------------------------------------------------
+class ThreadedDataStore(AsyncBaseDataStore):
+    """Run a synchronous store's calls on the default thread pool.
+
+    ``store_factory`` yields a store per call, which lets SQLite open its
+    session inside the worker thread; process-wide stores (JSON) are simply
+    yielded as-is.
+    """
+
+    def __init__(self, store_factory: Callable[[], AbstractContextManager[BaseDataStore]]):
+        self._store_factory = store_factory
+
+    async def _call(self, method: Callable[[BaseDataStore], T]) -> T:
+        def run() -> T:
+            with self._store_factory() as store:
+                return method(store)
+
+        return await asyncio.to_thread(run)
+
+    async def record_interaction(
+        self,
+        *,
+        prompt: str,
+        metadata: dict[str, Any],
+        llm_text: str,
+        model_name: str,
+        latency_ms: int,
+        first_token_ms: int | None = None,
+    ) -> InteractionRecord:
+        return await self._call(
+            lambda store: store.record_interaction(
+                prompt=prompt,
+                metadata=metadata,
+                llm_text=llm_text,
+                model_name=model_name,
+                latency_ms=latency_ms,
+                first_token_ms=first_token_ms,
+            )
+        )
+
+    async def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        return await self._call(lambda store: store.list_interactions(limit, cursor=cursor, since=since, until=until))
+
+    async def count_interactions(self) -> int:
+        return await self._call(lambda store: store.count_interactions())
+
+    async def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        return await self._call(lambda store: store.list_artifacts(limit, cursor=cursor, since=since, until=until))
+
+    async def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
+        return await self._call(lambda store: store.create_artifact(payload))
+
+    async def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        return await self._call(lambda store: store.list_tail_log(limit, cursor=cursor, since=since, until=until))
+
+    async def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
+        return await self._call(lambda store: store.create_tail_log_entry(payload))
+
+    async def aclose(self) -> None:
+        return None
+
+
+# --- SQLite (aiosqlite) implementation ------------------------------------------
+def _interaction_record(row: Interaction) -> InteractionRecord:
+    return InteractionRecord(
+        id=row.id,
+        user_prompt_text=row.user_prompt_text,
+        typing_metadata_json=dict(row.typing_metadata_json),
+        ai_response_text=row.ai_response_text,
+        model_name=row.model_name,
+        latency_ms=row.latency_ms,
+        created_at=row.created_at,
+        first_token_ms=row.first_token_ms,
+    )
+
+
+def _artifact_record(row: Artifact) -> ArtifactRecord:
+    return ArtifactRecord(
+        id=row.id,
+        title=row.title,
+        body=row.body,
+        owner=row.owner,
+        category=row.category,
+        accent=row.accent,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def _tail_log_record(row: TailLogEntry) -> TailLogRecord:
+    return TailLogRecord(id=row.id, message=row.message, source=row.source, created_at=row.created_at)
+
+
+class AsyncSqliteDataStore(AsyncBaseDataStore):
+    """SQLAlchemy ``AsyncSession`` store on an aiosqlite engine."""
+
+    def __init__(self, database_path: Path):
+        if create_async_engine is None:
+            raise RuntimeError("aiosqlite is required for the async SQLite data store")
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        migrate_sqlite_file(database_path)
+        settings = get_settings()
+        self._engine = create_async_engine(
+            f"sqlite+aiosqlite:///{database_path.as_posix()}",
+            future=True,
+            echo=settings.sql_echo,
+        )
+        apply_sqlite_pragmas(self._engine.sync_engine, settings)
+        self._sessions = async_sessionmaker(self._engine, expire_on_commit=False, autoflush=False)
+
+    async def _add(self, row: Any) -> Any:
+        async with self._sessions() as session:
+            session.add(row)
+            await session.commit()
+        return row
+
+    async def _newest(self, model: Any, column: Any, limit: int, **bounds: Any) -> list[Any]:
+        query = _keyset_filter(select(model), column, model.id, **bounds)
+        async with self._sessions() as session:
+            result = await session.execute(query.limit(limit))
+            return list(result.scalars())
+
+    async def record_interaction(
+        self,
+        *,
+        prompt: str,
+        metadata: dict[str, Any],
+        llm_text: str,
+        model_name: str,
+        latency_ms: int,
+        first_token_ms: int | None = None,
+    ) -> InteractionRecord:
+        interaction = await self._add(
+            Interaction(
+                id=str(uuid4()),
+                user_prompt_text=prompt,
+                typing_metadata_json=metadata,
+                ai_response_text=llm_text,
+                model_name=model_name,
+                latency_ms=latency_ms,
+                first_token_ms=first_token_ms,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        return _interaction_record(interaction)
+
+    async def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        rows = await self._newest(Interaction, Interaction.created_at, limit, cursor=cursor, since=since, until=until)
+        return [_interaction_record(row) for row in rows]
+
+    async def count_interactions(self) -> int:
+        async with self._sessions() as session:
+            result = await session.execute(select(func.count(Interaction.id)))
+            return int(result.scalar() or 0)
+
+    async def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        rows = await self._newest(Artifact, Artifact.updated_at, limit, cursor=cursor, since=since, until=until)
+        return [_artifact_record(row) for row in rows]
+
+    async def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
+        now = datetime.now(timezone.utc)
+        artifact = await self._add(
+            Artifact(
+                id=str(uuid4()),
+                title=payload.title,
+                body=payload.body,
+                owner=payload.owner,
+                category=payload.category,
+                accent=payload.accent,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        return _artifact_record(artifact)
+
+    async def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        rows = await self._newest(TailLogEntry, TailLogEntry.created_at, limit, cursor=cursor, since=since, until=until)
+        return [_tail_log_record(row) for row in rows]
+
+    async def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
+        entry = await self._add(
+            TailLogEntry(
+                id=str(uuid4()),
+                message=payload.message,
+                source=payload.source,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        record = _tail_log_record(entry)
+        publish_tail_log([record])
+        return record
+
+    async def aclose(self) -> None:
+        await self._engine.dispose()
+
+
+# --- Cosmos DB (aio) implementation ---------------------------------------------
+class AsyncCosmosDataStore(AsyncBaseDataStore):
+    """Cosmos store on the ``azure.cosmos.aio`` client; containers resolve on first use.
+
+    Shares the partitioning and per-call RU/latency capture of
+    :class:`CosmosDataStore`.
+    """
+
+    def __init__(self, database: Any | None = None, *, settings: Any | None = None):
+        settings = settings or get_settings()
+        self._settings = settings
+        self._client = None
+        self._credential = None
+        if database is None:
+            if not settings.cosmos_enabled:
+                raise RuntimeError("Cosmos DB is not configured but selected as provider")
+            if AsyncCosmosClient is None:
+                raise RuntimeError("azure-cosmos (with aiohttp) is required for the async Cosmos data store")
+            if settings.cosmos_prefer_managed_identity and not settings.cosmos_key:
+                if AsyncDefaultAzureCredential is None:
+                    raise RuntimeError("azure-identity is required for managed identity auth")
+                self._credential = AsyncDefaultAzureCredential()
+                credential: Any = self._credential
+            else:
+                credential = settings.cosmos_key
+            self._client = AsyncCosmosClient(  # type: ignore[misc]
+                settings.cosmos_endpoint,
+                credential=credential,
+                consistency_level=settings.cosmos_consistency,
+            )
+            database = self._client.get_database_client(settings.cosmos_database)
+        self._database = database
+        self._containers: dict[str, Any] = {}
+        self._cross_partition_only: set[str] = set()
+        self._containers_lock = asyncio.Lock()
+        self.metrics = CosmosMetrics()
+
+    async def _container(self, name: str):
+        container = self._containers.get(name)
+        if container is not None:
+            return container
+        async with self._containers_lock:
+            if name not in self._containers:
+                options = _cosmos_container_options(self._settings, name)
+                try:
+                    container = await self._database.create_container_if_not_exists(**options)
+                except Exception:  # container exists
+                    container = self._database.get_container_client(name)
+                properties = await container.read()
+                paths = properties.get("partitionKey", {}).get("paths", [])
+                policy = _cosmos_policy_upgrade(properties, options)
+                if policy is not None:
+                    container = await self._database.replace_container(
+                        container, partition_key=_cosmos_partition_key(paths[0]), indexing_policy=policy
+                    )
+                if paths != [COSMOS_PARTITION_PATH]:
+                    self._cross_partition_only.add(name)
+                self._containers[name] = container
+            return self._containers[name]
+
+    def _measure(self, name: str, operation: str, started: float, request_charge: float) -> None:
+        self.metrics.record(f"{name}.{operation}", request_charge, (time.perf_counter() - started) * 1000)
+
+    async def _query(
+        self,
+        container_name: str,
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        *,
+        partition_key: str | None = None,
+    ) -> list[Any]:
+        container = await self._container(container_name)
+        options: dict[str, Any] = {"partition_key": partition_key} if partition_key is not None else {}
+        started = time.perf_counter()
+        rows: list[Any] = []
+        charge = _CosmosRequestCharge()
+        pages = container.query_items(query, parameters=parameters, response_hook=charge, **options).by_page()
+        async for page in pages:
+            rows.extend([item async for item in page])
+        self._measure(container_name, "query", started, charge.total)
+        return rows
+
+    async def _newest(
+        self,
+        container_name: str,
+        field: str,
+        limit: int,
+        *,
+        cursor: PageCursor | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> list[dict[str, Any]]:
+        await self._container(container_name)
+        if container_name in self._cross_partition_only:
+            plan: list[tuple[str | None, datetime | None, datetime | None]] = [(None, since, until)]
+        else:
+            plan = _cosmos_read_plan(self._settings, cursor=cursor, since=since, until=until)
+        docs: list[dict[str, Any]] = []
+        for partition, lower, upper in plan:
+            query, parameters = _cosmos_page_query(field, limit - len(docs), cursor=cursor, since=lower, until=upper)
+            docs.extend(await self._query(container_name, query, parameters, partition_key=partition))
+            if len(docs) >= limit:
+                break
+        return docs
+
+    async def _upsert(self, container_name: str, doc: dict[str, Any], field: str) -> None:
+        doc["pk"] = _cosmos_partition_value(self._settings, doc[field])
+        container = await self._container(container_name)
+        started = time.perf_counter()
+        charge = _CosmosRequestCharge()
+        await container.upsert_item(doc, response_hook=charge)
+        self._measure(container_name, "upsert", started, charge.total)
+
+    async def record_interaction(
+        self,
+        *,
+        prompt: str,
+        metadata: dict[str, Any],
+        llm_text: str,
+        model_name: str,
+        latency_ms: int,
+        first_token_ms: int | None = None,
+    ) -> InteractionRecord:
+        record = InteractionRecord(
+            id=str(uuid4()),
+            user_prompt_text=prompt,
+            typing_metadata_json=metadata,
+            ai_response_text=llm_text,
+            model_name=model_name,
+            latency_ms=latency_ms,
+            created_at=datetime.now(timezone.utc),
+            first_token_ms=first_token_ms,
+        )
+        await self._upsert(self._settings.cosmos_interaction_container, _interaction_doc(record), "created_at")
+        return record
+
+    async def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        rows = await self._newest(
+            self._settings.cosmos_interaction_container,
+            "created_at",
+            limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return [CosmosDataStore._interaction_from_doc(item) for item in rows]
+
+    async def count_interactions(self) -> int:
+        rows = await self._query(self._settings.cosmos_interaction_container, "SELECT VALUE COUNT(1) FROM c")
+        return int(sum(rows))
+
+    async def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        rows = await self._newest(
+            self._settings.cosmos_artifact_container,
+            "updated_at",
+            limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return [CosmosDataStore._artifact_from_doc(item) for item in rows]
+
+    async def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
+        now = datetime.now(timezone.utc)
+        record = ArtifactRecord(
+            id=str(uuid4()),
+            title=payload.title,
+            body=payload.body,
+            owner=payload.owner,
+            category=payload.category,
+            accent=payload.accent,
+            created_at=now,
+            updated_at=now,
+        )
+        await self._upsert(self._settings.cosmos_artifact_container, _artifact_doc(record), "updated_at")
+        return record
+
+    async def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        rows = await self._newest(
+            self._settings.cosmos_tail_log_container,
+            "created_at",
+            limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return [CosmosDataStore._tail_log_from_doc(item) for item in rows]
+
+    async def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
+        record = TailLogRecord(
+            id=str(uuid4()),
+            message=payload.message,
+            source=payload.source,
+            created_at=datetime.now(timezone.utc),
+        )
+        await self._upsert(self._settings.cosmos_tail_log_container, _tail_log_doc(record), "created_at")
+        publish_tail_log([record])
+        return record
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        if self._credential is not None:
+            await self._credential.close()
+
+
+# --- Dependency helper ----------------------------------------------------------
+_async_data_store: AsyncBaseDataStore | None = None
+
+
+def _build_async_data_store(settings) -> AsyncBaseDataStore:
+    provider = settings.database_provider
+
+    if provider == "sqlite":
+        if create_async_engine is not None:
+            return AsyncSqliteDataStore(Path(settings.database_path))
+        # Without aiosqlite, keep the event loop free by committing on a worker thread.
+        return ThreadedDataStore(data_store_context)
+
+    if provider == "cosmos":
+        return AsyncCosmosDataStore()
+
+    if provider == "json":
+        # JSON stores are process-wide and in-memory; only their locks and the
+        # occasional reload touch disk, so a worker thread is enough.
+        return ThreadedDataStore(data_store_context)
+
+    raise RuntimeError(f"Unsupported DATABASE_PROVIDER: {provider}")
+
+
+def get_async_data_store() -> AsyncBaseDataStore:
+    """Return the process-wide async store for ``DATABASE_PROVIDER``."""
+
+    global _async_data_store
+    if _async_data_store is None:
+        _async_data_store = _build_async_data_store(get_settings())
+    return _async_data_store
+
+
+async def close_async_data_store() -> None:
+    """Release the async store's engine/client (called from the app lifespan)."""
+
+    global _async_data_store
+    store, _async_data_store = _async_data_store, None
+    if store is not None:
+        await store.aclose()
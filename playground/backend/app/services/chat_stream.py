@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+"""Newline-delimited JSON frames for ``POST /api/chat/stream``."""
+# @tag: backend,services,llm
+
+import json
+import time
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable
+
+from ..schemas import ChatResponse
+from .data_store import InteractionRecord
+from .llm_client import LLMChunk
+
+# Persists the assembled completion: (text, model_name, latency_ms, first_token_ms).
+InteractionWriter = Callable[[str, str, int, int | None], Awaitable[InteractionRecord]]
+
+
+def _frame(payload: dict) -> str:
+    return json.dumps(payload, separators=(",", ":")) + "\n"
+
+
+async def chat_stream_events(
+    chunks: AsyncIterator[LLMChunk],
+    write: InteractionWriter,
+    *,
+    default_model: str,
+) -> AsyncIterator[str]:
+    """Yield a ``token`` frame per chunk, then persist and yield ``done``.
+
+    ``first_token_ms`` is measured from the first read of this generator to
+    the first non-empty chunk; ``latency_ms`` to the end of the stream, so the
+    stored pair is comparable with non-streamed interactions.
+
+    Failures before anything was sent propagate (the route answers 502);
+    later ones end the stream with an ``error`` frame and nothing is stored.
+    A client that disconnects closes the generator and the upstream request.
+    """
+
+    start = time.perf_counter()
+    first_token_ms: int | None = None
+    model_name = default_model
+    cached = False
+    parts: list[str] = []
+    async with aclosing(chunks):
+        try:
+            async for chunk in chunks:
+                if not chunk.text:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = int((time.perf_counter() - start) * 1000)
+                model_name = chunk.model_name or model_name
+                cached = chunk.cached
+                parts.append(chunk.text)
+                yield _frame({"type": "token", "text": chunk.text})
+        except Exception:
+            if not parts:
+                raise
+            yield _frame({"type": "error", "detail": "LLM stream interrupted"})
+            return
+
+    latency_ms = int((time.perf_counter() - start) * 1000)
+    interaction = await write("".join(parts).strip(), model_name, latency_ms, first_token_ms)
+    done = ChatResponse(
+        interaction_id=interaction.id,
+        ai_response_text=interaction.ai_response_text,
+        model_name=interaction.model_name or default_model,
+        latency_ms=interaction.latency_ms,
+        first_token_ms=interaction.first_token_ms,
+        cached=cached,
+        created_at=interaction.created_at,
+    )
+    yield _frame({"type": "done", **done.model_dump(mode="json")})
+
+
+async def primed(events: AsyncGenerator[str, None]) -> AsyncIterator[str]:
+    """Run ``events`` to its first frame now, so early failures raise before the response starts."""
+
+    first = await anext(events)
+
+    async def replay() -> AsyncIterator[str]:
+        async with aclosing(events):
+            yield first
+            async for frame in events:
+                yield frame
+
+    return replay()
@@ -3,22 +3,33 @@ from __future__ import annotations
 """Storage abstraction supporting SQLite, Cosmos DB, and JSON snapshots."""
 # @tag: backend,services,data
 
+import atexit
+import base64
+import bisect
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import count
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Any, Protocol
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, Mapping, Protocol, Sequence, TypeVar
 from uuid import uuid4
 
 from fastapi import Depends
-from sqlalchemy import func
+from sqlalchemy import and_, func, insert, or_
 from sqlalchemy.orm import Session
 
 from ..config import get_settings
 from ..models import Artifact, Interaction, TailLogEntry
 from ..schemas import ArtifactCreate, TailLogEntryCreate
-from ..database import get_optional_db_session, get_sessionmaker
+from ..database import UnitOfWorkMixin, get_optional_db_session, get_sessionmaker
+from .tail_log_broker import publish_tail_log
 
 try:  # pragma: no cover - optional dependency
     from azure.cosmos import CosmosClient, PartitionKey
@@ -30,6 +41,8 @@ except ImportError:  # pragma: no cover
     CosmosResourceNotFoundError = Exception  # type: ignore
     DefaultAzureCredential = None  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class InteractionRecord:
@@ -40,6 +53,7 @@ class InteractionRecord:
     model_name: str
     latency_ms: int
     created_at: datetime
+    first_token_ms: int | None = None
 
 
 @dataclass
@@ -62,6 +76,280 @@ class TailLogRecord:
     created_at: datetime
 
 
+RecordT = TypeVar("RecordT", InteractionRecord, ArtifactRecord, TailLogRecord)
+RowT = TypeVar("RowT")
+
+
+# --- Keyset pagination ----------------------------------------------------------
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything is written in UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Keyset position of the last record on a page: its (timestamp, id).
+
+    ``list_*`` calls return records newest first; passing the cursor of the
+    last record returns the records strictly older than it. Artifacts page by
+    ``updated_at`` (their list order), everything else by ``created_at``.
+    """
+
+    timestamp: datetime
+    id: str
+
+    @classmethod
+    def after(cls, record: InteractionRecord | ArtifactRecord | TailLogRecord) -> "PageCursor":
+        return cls(_as_utc(getattr(record, "updated_at", record.created_at)), record.id)
+
+    def encode(self) -> str:
+        raw = f"{_as_utc(self.timestamp).isoformat()}|{self.id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+            stamp, record_id = raw.split("|", 1)
+            return cls(_as_utc(datetime.fromisoformat(stamp)), record_id)
+        except ValueError as exc:  # binascii.Error and UnicodeDecodeError included
+            raise ValueError(f"Invalid page cursor: {token!r}") from exc
+
+
+def _keyset_filter(
+    query: Any,
+    column: Any,
+    id_column: Any,
+    *,
+    cursor: PageCursor | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> Any:
+    """Apply cursor/time bounds and newest-first ordering to a Query or Select."""
+
+    if cursor is not None:
+        stamp = _as_utc(cursor.timestamp)
+        query = query.filter(or_(column < stamp, and_(column == stamp, id_column < cursor.id)))
+    if since is not None:
+        query = query.filter(column >= _as_utc(since))
+    if until is not None:
+        query = query.filter(column < _as_utc(until))
+    return query.order_by(column.desc(), id_column.desc())
+
+
+def _cosmos_page_query(
+    field: str,
+    limit: int,
+    *,
+    cursor: PageCursor | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> tuple[str, list[dict[str, Any]]]:
+    """Cosmos SQL for one newest-first page.
+
+    Cosmos only serves the two-property ORDER BY from a composite
+    ``(field DESC, id DESC)`` index; :func:`_cosmos_container_options` declares it.
+    """
+
+    clauses: list[str] = []
+    parameters: list[dict[str, Any]] = [{"name": "@limit", "value": limit}]
+    if cursor is not None:
+        clauses.append(f"(c.{field} < @cursorTs OR (c.{field} = @cursorTs AND c.id < @cursorId))")
+        parameters += [
+            {"name": "@cursorTs", "value": _as_utc(cursor.timestamp).isoformat()},
+            {"name": "@cursorId", "value": cursor.id},
+        ]
+    if since is not None:
+        clauses.append(f"c.{field} >= @since")
+        parameters.append({"name": "@since", "value": _as_utc(since).isoformat()})
+    if until is not None:
+        clauses.append(f"c.{field} < @until")
+        parameters.append({"name": "@until", "value": _as_utc(until).isoformat()})
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return f"SELECT * FROM c{where} ORDER BY c.{field} DESC, c.id DESC OFFSET 0 LIMIT @limit", parameters
+
+
+# Timestamp each collection lists by; artifacts follow ``updated_at`` like the SQL stores.
+_LIST_KEY_FIELDS = {"interactions": "created_at", "artifacts": "updated_at", "tail_log": "created_at"}
+
+
+def _doc_key(doc: Mapping[str, Any], key_field: str) -> tuple[datetime, str]:
+    return _as_utc(datetime.fromisoformat(doc[key_field])), doc["id"]
+
+
+def _first_not_below(size: int, is_below: Callable[[int], bool]) -> int:
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if is_below(mid):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _page_docs(
+    size: int,
+    key_at: Callable[[int], tuple[datetime, str]],
+    doc_at: Callable[[int], RowT],
+    limit: int,
+    *,
+    cursor: PageCursor | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> list[RowT]:
+    """Newest-first page over a collection kept in ascending ``(timestamp, id)`` order.
+
+    File stores maintain that order as they index records, whatever order
+    they arrive in, so every bound is a binary search: deep pages cost
+    O(log n) key probes plus ``limit`` reads.
+    """
+
+    end = size
+    if cursor is not None:
+        target = (_as_utc(cursor.timestamp), cursor.id)
+        end = _first_not_below(size, lambda index: key_at(index) < target)
+    if until is not None:
+        end = min(end, _first_not_below(size, lambda index: key_at(index)[0] < _as_utc(until)))
+    start = max(end - limit, 0)
+    if since is not None:
+        start = max(start, _first_not_below(end, lambda index: key_at(index)[0] < _as_utc(since)))
+    return [doc_at(index) for index in range(end - 1, start - 1, -1)]
+
+
+def iter_pages(
+    list_page: Callable[..., list[RecordT]],
+    *,
+    page_size: int = 500,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Iterator[list[RecordT]]:
+    """Walk a ``list_*`` method newest-first in constant-size keyset pages."""
+
+    cursor: PageCursor | None = None
+    while True:
+        page = list_page(page_size, cursor=cursor, since=since, until=until)
+        if page:
+            yield page
+        if len(page) < page_size:
+            return
+        cursor = PageCursor.after(page[-1])
+
+
+def _bulk_timestamps() -> Iterator[datetime]:
+    # Consecutive microseconds keep bulk rows in input order for newest-first reads.
+    now = datetime.now(timezone.utc)
+    return (now + timedelta(microseconds=index) for index in count())
+
+
+def _new_interaction_records(items: Iterable[Mapping[str, Any]]) -> list[InteractionRecord]:
+    """Build records from ``record_interaction`` keyword-argument mappings.
+
+    Historic imports may carry their own ``id`` and ``created_at`` (datetime
+    or ISO string; naive values are taken as UTC), in any order: the file
+    stores re-sort what they index. Both are assigned when absent.
+    """
+
+    records = []
+    for item, stamp in zip(items, _bulk_timestamps()):
+        created_at = item.get("created_at") or stamp
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        created_at = _as_utc(created_at)
+        records.append(
+            InteractionRecord(
+                id=item.get("id") or str(uuid4()),
+                user_prompt_text=item["prompt"],
+                typing_metadata_json=item.get("metadata") or {},
+                ai_response_text=item["llm_text"],
+                model_name=item["model_name"],
+                latency_ms=item.get("latency_ms", 0),
+                created_at=created_at,
+                first_token_ms=item.get("first_token_ms"),
+            )
+        )
+    return records
+
+
+def _imported(payload: Any, field: str) -> Any:
+    """``field`` of an import row (see ``ArtifactImport``), or ``None`` for plain create payloads."""
+
+    value = getattr(payload, field, None)
+    if isinstance(value, datetime):
+        return _as_utc(value)
+    return str(value) if value is not None else None
+
+
+def _new_artifact_records(payloads: Iterable[ArtifactCreate]) -> list[ArtifactRecord]:
+    """Build records from create payloads; ``ArtifactImport`` rows keep their id and timestamps."""
+
+    records = []
+    for payload, stamp in zip(payloads, _bulk_timestamps()):
+        created_at = _imported(payload, "created_at") or stamp
+        records.append(
+            ArtifactRecord(
+                id=_imported(payload, "id") or str(uuid4()),
+                title=payload.title,
+                body=payload.body,
+                owner=payload.owner,
+                category=payload.category,
+                accent=payload.accent,
+                created_at=created_at,
+                updated_at=_imported(payload, "updated_at") or created_at,
+            )
+        )
+    return records
+
+
+def _new_tail_log_records(payloads: Iterable[TailLogEntryCreate]) -> list[TailLogRecord]:
+    """Build records from create payloads; ``TailLogEntryImport`` rows keep their id and timestamp."""
+
+    return [
+        TailLogRecord(
+            id=_imported(payload, "id") or str(uuid4()),
+            message=payload.message,
+            source=payload.source,
+            created_at=_imported(payload, "created_at") or stamp,
+        )
+        for payload, stamp in zip(payloads, _bulk_timestamps())
+    ]
+
+
+def _artifact_doc(record: ArtifactRecord) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "title": record.title,
+        "body": record.body,
+        "owner": record.owner,
+        "category": record.category,
+        "accent": record.accent,
+        "created_at": record.created_at.isoformat(),
+        "updated_at": record.updated_at.isoformat(),
+    }
+
+
+def _tail_log_doc(record: TailLogRecord) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "message": record.message,
+        "source": record.source,
+        "created_at": record.created_at.isoformat(),
+    }
+
+
+def _interaction_doc(record: InteractionRecord) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "user_prompt_text": record.user_prompt_text,
+        "typing_metadata_json": record.typing_metadata_json,
+        "ai_response_text": record.ai_response_text,
+        "model_name": record.model_name,
+        "latency_ms": record.latency_ms,
+        "first_token_ms": record.first_token_ms,
+        "created_at": record.created_at.isoformat(),
+    }
+
+
 class BaseDataStore(Protocol):
     """Contract for persisting Playground telemetry + artifacts."""
 
@@ -73,31 +361,79 @@ class BaseDataStore(Protocol):
         llm_text: str,
         model_name: str,
         latency_ms: int,
+        first_token_ms: int | None = None,
     ) -> InteractionRecord:
         ...
 
-    def list_interactions(self, limit: int) -> list[InteractionRecord]:
+    def write_interactions(self, records: Sequence[InteractionRecord]) -> None:
+        """Persist interactions whose id and timestamp were assigned by the caller."""
+        ...
+
+    def record_interactions_bulk(self, items: Iterable[Mapping[str, Any]]) -> list[InteractionRecord]:
+        """Insert many interactions (``record_interaction`` kwargs) in one write.
+
+        Items may also carry ``id`` and a historic ``created_at``; backfills
+        in any timestamp order list the same on every provider.
+        """
+        ...
+
+    def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        """Newest first; ``since`` is inclusive, ``until`` exclusive, ``cursor`` from :meth:`PageCursor.after`."""
         ...
 
     def count_interactions(self) -> int:
         ...
 
-    def list_artifacts(self, limit: int) -> list[ArtifactRecord]:
+    def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
         ...
 
     def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
         ...
 
-    def list_tail_log(self, limit: int) -> list[TailLogRecord]:
+    def create_artifacts_bulk(self, payloads: Iterable[ArtifactCreate]) -> list[ArtifactRecord]:
+        """Insert many artifacts in one write; ``ArtifactImport`` rows keep their id and timestamps."""
+        ...
+
+    def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
         ...
 
     def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
         ...
 
+    def create_tail_log_entries_bulk(self, payloads: Iterable[TailLogEntryCreate]) -> list[TailLogRecord]:
+        """Insert many entries in one write; ``TailLogEntryImport`` rows keep their id and timestamp."""
+        ...
+
 
 # --- SQLite implementation ----------------------------------------------------
-class SqliteDataStore(BaseDataStore):
-    """SQLAlchemy-backed store used for local dev and CI."""
+class SqliteDataStore(UnitOfWorkMixin, BaseDataStore):
+    """SQLAlchemy-backed store used for local dev and CI.
+
+    Every column is known client-side (uuid4 ids, Python timestamps), so
+    writes return the record they inserted instead of re-reading the row.
+    Wrap several writes in ``unit_of_work()`` to commit them once.
+    """
 
     def __init__(self, session: Session):
         self._session = session
@@ -110,8 +446,9 @@ class SqliteDataStore(BaseDataStore):
         llm_text: str,
         model_name: str,
         latency_ms: int,
+        first_token_ms: int | None = None,
     ) -> InteractionRecord:
-        interaction = Interaction(
+        record = InteractionRecord(
             id=str(uuid4()),
             user_prompt_text=prompt,
             typing_metadata_json=metadata,
@@ -119,27 +456,43 @@ class SqliteDataStore(BaseDataStore):
             model_name=model_name,
             latency_ms=latency_ms,
             created_at=datetime.now(timezone.utc),
+            first_token_ms=first_token_ms,
         )
-        self._session.add(interaction)
-        self._session.commit()
-        self._session.refresh(interaction)
-        return InteractionRecord(
-            id=interaction.id,
-            user_prompt_text=interaction.user_prompt_text,
-            typing_metadata_json=dict(interaction.typing_metadata_json),
-            ai_response_text=interaction.ai_response_text,
-            model_name=interaction.model_name,
-            latency_ms=interaction.latency_ms,
-            created_at=interaction.created_at,
-        )
+        self._session.add(Interaction(**vars(record)))
+        self._commit()
+        return record
+
+    def _insert_many(self, model: Any, rows: list[dict[str, Any]]) -> None:
+        # One executemany (batched into multi-row VALUES) and one commit.
+        if rows:
+            self._session.execute(insert(model), rows)
+        self._commit()
 
-    def list_interactions(self, limit: int) -> list[InteractionRecord]:
-        rows = (
-            self._session.query(Interaction)
-            .order_by(Interaction.created_at.desc())
-            .limit(limit)
-            .all()
+    def write_interactions(self, records: Sequence[InteractionRecord]) -> None:
+        self._insert_many(Interaction, [vars(record) for record in records])
+
+    def record_interactions_bulk(self, items: Iterable[Mapping[str, Any]]) -> list[InteractionRecord]:
+        records = _new_interaction_records(items)
+        self.write_interactions(records)
+        return records
+
+    def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        query = _keyset_filter(
+            self._session.query(Interaction),
+            Interaction.created_at,
+            Interaction.id,
+            cursor=cursor,
+            since=since,
+            until=until,
         )
+        rows = query.limit(limit).all()
         return [
             InteractionRecord(
                 id=row.id,
@@ -149,6 +502,7 @@ class SqliteDataStore(BaseDataStore):
                 model_name=row.model_name,
                 latency_ms=row.latency_ms,
                 created_at=row.created_at,
+                first_token_ms=row.first_token_ms,
             )
             for row in rows
         ]
@@ -156,13 +510,23 @@ class SqliteDataStore(BaseDataStore):
     def count_interactions(self) -> int:
         return int(self._session.query(func.count(Interaction.id)).scalar() or 0)
 
-    def list_artifacts(self, limit: int) -> list[ArtifactRecord]:
-        rows = (
-            self._session.query(Artifact)
-            .order_by(Artifact.updated_at.desc())
-            .limit(limit)
-            .all()
+    def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        query = _keyset_filter(
+            self._session.query(Artifact),
+            Artifact.updated_at,
+            Artifact.id,
+            cursor=cursor,
+            since=since,
+            until=until,
         )
+        rows = query.limit(limit).all()
         return [
             ArtifactRecord(
                 id=row.id,
@@ -178,35 +542,33 @@ class SqliteDataStore(BaseDataStore):
         ]
 
     def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
-        artifact = Artifact(
-            id=str(uuid4()),
-            title=payload.title,
-            body=payload.body,
-            owner=payload.owner,
-            category=payload.category,
-            accent=payload.accent,
-        )
-        self._session.add(artifact)
-        self._session.commit()
-        self._session.refresh(artifact)
-        return ArtifactRecord(
-            id=artifact.id,
-            title=artifact.title,
-            body=artifact.body,
-            owner=artifact.owner,
-            category=artifact.category,
-            accent=artifact.accent,
-            created_at=artifact.created_at,
-            updated_at=artifact.updated_at,
-        )
+        (record,) = _new_artifact_records([payload])
+        self._session.add(Artifact(**vars(record)))
+        self._commit()
+        return record
+
+    def create_artifacts_bulk(self, payloads: Iterable[ArtifactCreate]) -> list[ArtifactRecord]:
+        records = _new_artifact_records(payloads)
+        self._insert_many(Artifact, [vars(record) for record in records])
+        return records
 
-    def list_tail_log(self, limit: int) -> list[TailLogRecord]:
-        rows = (
-            self._session.query(TailLogEntry)
-            .order_by(TailLogEntry.created_at.desc())
-            .limit(limit)
-            .all()
+    def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        query = _keyset_filter(
+            self._session.query(TailLogEntry),
+            TailLogEntry.created_at,
+            TailLogEntry.id,
+            cursor=cursor,
+            since=since,
+            until=until,
         )
+        rows = query.limit(limit).all()
         return [
             TailLogRecord(
                 id=row.id,
@@ -218,41 +580,215 @@ class SqliteDataStore(BaseDataStore):
         ]
 
     def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
-        entry = TailLogEntry(
-            id=str(uuid4()),
-            message=payload.message,
-            source=payload.source,
-            created_at=datetime.now(timezone.utc),
-        )
-        self._session.add(entry)
-        self._session.commit()
-        self._session.refresh(entry)
-        return TailLogRecord(
-            id=entry.id,
-            message=entry.message,
-            source=entry.source,
-            created_at=entry.created_at,
-        )
+        (record,) = _new_tail_log_records([payload])
+        self._session.add(TailLogEntry(**vars(record)))
+        self._commit()
+        self._after_commit(lambda: publish_tail_log([record]))
+        return record
+
+    def create_tail_log_entries_bulk(self, payloads: Iterable[TailLogEntryCreate]) -> list[TailLogRecord]:
+        records = _new_tail_log_records(payloads)
+        self._insert_many(TailLogEntry, [vars(record) for record in records])
+        self._after_commit(lambda: publish_tail_log(records))
+        return records
 
 
 # --- JSON snapshot implementation --------------------------------------------
-class JsonDataStore(BaseDataStore):
-    """Lightweight file-backed store for ephemeral or local experiments."""
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-    def __init__(self, store_path: Path):
-        self._path = store_path
+
+@contextmanager
+def _sibling_tempfile(path: Path, mode: str, **kwargs: Any) -> Iterator[Any]:
+    """Write a uniquely named file next to ``path``, then atomically replace ``path`` with it.
+
+    Each writer gets its own temp file, so processes flushing the same store
+    never interleave their bytes.
+    """
+
+    handle = tempfile.NamedTemporaryFile(
+        mode, dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False, **kwargs
+    )
+    try:
+        with handle:
+            yield handle
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+
+
+class _JsonSnapshot:
+    """Process-wide parsed copy of one JSON snapshot with write-behind flushing.
+
+    Reads are served from memory; the file's mtime/size is re-checked at most
+    every ``check_interval`` seconds so writes from other processes are
+    picked up. Inserts mark the snapshot dirty and a timer flushes it within
+    ``flush_delay`` seconds via an atomic replace. Pending inserts are
+    re-applied on top of the file if another process wrote it in between.
+
+    Each collection is kept newest first by ``(timestamp, id)``, the SQL
+    stores' list order, so backfills and merged writes that arrive out of
+    order still page correctly.
+    """
+
+    _COLLECTIONS = ("interactions", "artifacts", "tail_log")
+
+    def __init__(self, path: Path, *, flush_delay: float, check_interval: float):
+        self._path = path
+        self._flush_delay = flush_delay
+        self._check_interval = check_interval
+        self._lock = threading.RLock()
+        self._data: dict[str, list[dict[str, Any]]] = {name: [] for name in self._COLLECTIONS}
+        self._signature: tuple[int, int] | None = None
+        self._checked_at = 0.0
+        self._pending: list[tuple[str, dict[str, Any]]] = []
+        self._timer: threading.Timer | None = None
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        if not self._path.exists():
-            self._write({"interactions": [], "artifacts": [], "tail_log": []})
+        with self._lock:
+            if self._path.exists():
+                self._load()
+            else:
+                self._write_file()
 
-    def _read(self) -> dict[str, list[dict[str, Any]]]:
+    def _load(self) -> None:
         with self._path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+            data = json.load(handle)
+        for name in self._COLLECTIONS:
+            docs = data.setdefault(name, [])
+            # Sorted already unless another writer went out of order; timsort is linear on sorted input.
+            docs.sort(key=lambda doc, field=_LIST_KEY_FIELDS[name]: _doc_key(doc, field), reverse=True)
+        self._data = data
+        self._signature = _file_signature(self._path)
+        self._checked_at = time.monotonic()
+        for name in self._COLLECTIONS:
+            pending = [doc for collection, doc in self._pending if collection == name]
+            if pending:
+                self._merge(name, pending)
+
+    def _merge(self, collection: str, docs: list[dict[str, Any]]) -> None:
+        """Put ``docs`` (oldest first) into the newest-first collection."""
+
+        if not docs:
+            return
+        current = self._data[collection]
+        field = _LIST_KEY_FIELDS[collection]
+        keys = [_doc_key(doc, field) for doc in docs]
+        in_order = all(older < newer for older, newer in zip(keys, keys[1:]))
+        if in_order and (not current or keys[0] > _doc_key(current[0], field)):
+            current[:0] = docs[::-1]  # the usual case: newer than everything stored
+        elif len(docs) == 1:
+            position = _first_not_below(len(current), lambda index: _doc_key(current[index], field) > keys[0])
+            current.insert(position, docs[0])
+        else:
+            current[:0] = docs[::-1]
+            current.sort(key=lambda doc: _doc_key(doc, field), reverse=True)
+
+    def _write_file(self) -> None:
+        with _sibling_tempfile(self._path, "w", encoding="utf-8") as handle:
+            json.dump(self._data, handle, indent=2)
+        self._signature = _file_signature(self._path)
+        self._checked_at = time.monotonic()
+
+    def _sync(self) -> None:
+        if time.monotonic() - self._checked_at < self._check_interval:
+            return
+        self._checked_at = time.monotonic()
+        if _file_signature(self._path) != self._signature:
+            self._load()
+
+    def newest(self, collection: str, limit: int, **bounds: Any) -> list[dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            docs = self._data[collection]
+            if not any(bounds.values()):
+                return docs[:limit]
+            field = _LIST_KEY_FIELDS[collection]
+            last = len(docs) - 1
+            return _page_docs(
+                len(docs),
+                lambda index: _doc_key(docs[last - index], field),
+                lambda index: docs[last - index],
+                limit,
+                **bounds,
+            )
 
-    def _write(self, payload: dict[str, list[dict[str, Any]]]) -> None:
-        tmp_path = self._path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        tmp_path.replace(self._path)
+    def count(self, collection: str) -> int:
+        with self._lock:
+            self._sync()
+            return len(self._data[collection])
+
+    def insert(self, collection: str, doc: dict[str, Any]) -> None:
+        self.insert_many(collection, [doc])
+
+    def insert_many(self, collection: str, docs: list[dict[str, Any]]) -> None:
+        """Insert ``docs`` (oldest first) and schedule a single flush for all of them."""
+
+        with self._lock:
+            self._sync()
+            self._merge(collection, docs)
+            self._pending.extend((collection, doc) for doc in docs)
+            if self._timer is None:
+                self._timer = threading.Timer(self._flush_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            if _file_signature(self._path) != self._signature:
+                self._load()
+            self._write_file()
+            self._pending.clear()
+
+
+_json_snapshots: dict[Path, _JsonSnapshot] = {}
+_json_snapshots_lock = threading.Lock()
+
+
+def _json_snapshot(path: Path, *, flush_delay: float, check_interval: float) -> _JsonSnapshot:
+    with _json_snapshots_lock:
+        snapshot = _json_snapshots.get(path)
+        if snapshot is None:
+            snapshot = _json_snapshots[path] = _JsonSnapshot(
+                path, flush_delay=flush_delay, check_interval=check_interval
+            )
+        return snapshot
+
+
+def flush_json_stores() -> None:
+    """Write every dirty JSON snapshot to disk now."""
+
+    with _json_snapshots_lock:
+        snapshots = list(_json_snapshots.values())
+    for snapshot in snapshots:
+        snapshot.flush()
+
+
+atexit.register(flush_json_stores)
+
+
+class JsonDataStore(BaseDataStore):
+    """Lightweight file-backed store for ephemeral or local experiments.
+
+    Instances share one in-memory snapshot per path, so reads cost no I/O
+    and writes reach disk within ``flush_delay`` seconds.
+    """
+
+    def __init__(self, store_path: Path, *, flush_delay: float = 0.25, check_interval: float = 1.0):
+        self._path = store_path
+        self._snapshot = _json_snapshot(store_path, flush_delay=flush_delay, check_interval=check_interval)
+
+    def flush(self) -> None:
+        self._snapshot.flush()
 
     def record_interaction(
         self,
@@ -262,8 +798,8 @@ class JsonDataStore(BaseDataStore):
         llm_text: str,
         model_name: str,
         latency_ms: int,
+        first_token_ms: int | None = None,
     ) -> InteractionRecord:
-        snapshot = self._read()
         created_at = datetime.now(timezone.utc)
         doc = {
             "id": str(uuid4()),
@@ -272,10 +808,10 @@ class JsonDataStore(BaseDataStore):
             "ai_response_text": llm_text,
             "model_name": model_name,
             "latency_ms": latency_ms,
+            "first_token_ms": first_token_ms,
             "created_at": created_at.isoformat(),
         }
-        snapshot["interactions"].insert(0, doc)
-        self._write(snapshot)
+        self._snapshot.insert("interactions", doc)
         return InteractionRecord(
             id=doc["id"],
             user_prompt_text=prompt,
@@ -284,11 +820,26 @@ class JsonDataStore(BaseDataStore):
             model_name=model_name,
             latency_ms=latency_ms,
             created_at=created_at,
+            first_token_ms=first_token_ms,
         )
 
-    def list_interactions(self, limit: int) -> list[InteractionRecord]:
-        snapshot = self._read()
-        records = snapshot.get("interactions", [])[:limit]
+    def write_interactions(self, records: Sequence[InteractionRecord]) -> None:
+        self._snapshot.insert_many("interactions", [_interaction_doc(record) for record in records])
+
+    def record_interactions_bulk(self, items: Iterable[Mapping[str, Any]]) -> list[InteractionRecord]:
+        records = _new_interaction_records(items)
+        self.write_interactions(records)
+        return records
+
+    def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        records = self._snapshot.newest("interactions", limit, cursor=cursor, since=since, until=until)
         return [
             InteractionRecord(
                 id=item["id"],
@@ -298,17 +849,23 @@ class JsonDataStore(BaseDataStore):
                 model_name=item["model_name"],
                 latency_ms=item.get("latency_ms", 0),
                 created_at=datetime.fromisoformat(item["created_at"]),
+                first_token_ms=item.get("first_token_ms"),
             )
             for item in records
         ]
 
     def count_interactions(self) -> int:
-        snapshot = self._read()
-        return len(snapshot.get("interactions", []))
+        return self._snapshot.count("interactions")
 
-    def list_artifacts(self, limit: int) -> list[ArtifactRecord]:
-        snapshot = self._read()
-        records = snapshot.get("artifacts", [])[:limit]
+    def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        records = self._snapshot.newest("artifacts", limit, cursor=cursor, since=since, until=until)
         return [
             ArtifactRecord(
                 id=item["id"],
@@ -324,7 +881,6 @@ class JsonDataStore(BaseDataStore):
         ]
 
     def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
-        snapshot = self._read()
         now = datetime.now(timezone.utc)
         doc = {
             "id": str(uuid4()),
@@ -336,8 +892,7 @@ class JsonDataStore(BaseDataStore):
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
         }
-        snapshot.setdefault("artifacts", []).insert(0, doc)
-        self._write(snapshot)
+        self._snapshot.insert("artifacts", doc)
         return ArtifactRecord(
             id=doc["id"],
             title=doc["title"],
@@ -349,9 +904,20 @@ class JsonDataStore(BaseDataStore):
             updated_at=now,
         )
 
-    def list_tail_log(self, limit: int) -> list[TailLogRecord]:
-        snapshot = self._read()
-        records = snapshot.get("tail_log", [])[:limit]
+    def create_artifacts_bulk(self, payloads: Iterable[ArtifactCreate]) -> list[ArtifactRecord]:
+        records = _new_artifact_records(payloads)
+        self._snapshot.insert_many("artifacts", [_artifact_doc(record) for record in records])
+        return records
+
+    def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        records = self._snapshot.newest("tail_log", limit, cursor=cursor, since=since, until=until)
         return [
             TailLogRecord(
                 id=item["id"],
@@ -363,7 +929,6 @@ class JsonDataStore(BaseDataStore):
         ]
 
     def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
-        snapshot = self._read()
         created_at = datetime.now(timezone.utc)
         doc = {
             "id": str(uuid4()),
@@ -371,57 +936,268 @@ class JsonDataStore(BaseDataStore):
             "source": payload.source,
             "created_at": created_at.isoformat(),
         }
-        snapshot.setdefault("tail_log", []).insert(0, doc)
-        self._write(snapshot)
-        return TailLogRecord(
+        self._snapshot.insert("tail_log", doc)
+        record = TailLogRecord(
             id=doc["id"],
             message=payload.message,
             source=payload.source,
             created_at=created_at,
         )
+        publish_tail_log([record])
+        return record
+
+    def create_tail_log_entries_bulk(self, payloads: Iterable[TailLogEntryCreate]) -> list[TailLogRecord]:
+        records = _new_tail_log_records(payloads)
+        self._snapshot.insert_many("tail_log", [_tail_log_doc(record) for record in records])
+        publish_tail_log(records)
+        return records
+
+
+# --- JSONL segment implementation ---------------------------------------------
+class _SegmentLog:
+    """Append-only JSONL segments for one collection plus an offset index.
+
+    Lines are appended to the newest ``<n>.jsonl`` segment; a new segment is
+    started once it reaches ``max_bytes``. The index keeps the byte position
+    of every record sorted by ``(key_field, id)``, oldest first, so the newest
+    ``limit`` records are read with a handful of seeks even when records were
+    appended out of order. Appends from other processes are picked up by
+    indexing whatever grew since the last call.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int, compact_after: int, key_field: str = "created_at"):
+        self._root = root
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._compact_after = compact_after
+        self._key_field = key_field
+        self._lock = threading.Lock()
+        # Parallel lists in ascending key order.
+        self._keys: list[tuple[datetime, str]] = []
+        self._positions: list[tuple[str, int]] = []
+        self._indexed: dict[str, int] = {}
 
+    @staticmethod
+    def _segment_name(number: int) -> str:
+        return f"{number:08d}.jsonl"
+
+    def _segments(self) -> list[str]:
+        return sorted(path.name for path in self._root.glob("*.jsonl"))
+
+    def _refresh(self) -> list[str]:
+        names = self._segments()
+        sizes = {name: (self._root / name).stat().st_size for name in names}
+        if any(sizes.get(name, -1) < indexed for name, indexed in self._indexed.items()):
+            # Compacted (possibly by another process): start the index over.
+            self._clear_index()
+        for name in names:
+            offset = self._indexed.get(name, 0)
+            if sizes[name] <= offset:
+                continue
+            with (self._root / name).open("rb") as handle:
+                handle.seek(offset)
+                for raw in handle:
+                    if not raw.endswith(b"\n"):
+                        break  # torn or in-flight append
+                    if raw.strip():
+                        self._index_line(raw, (name, offset))
+                    offset += len(raw)
+            self._indexed[name] = offset
+        return names
+
+    def _index_line(self, raw: bytes, position: tuple[str, int]) -> None:
+        try:
+            key = _doc_key(json.loads(raw), self._key_field)
+        except (KeyError, ValueError):
+            return  # unreadable; compaction drops it
+        if not self._keys or key > self._keys[-1]:
+            self._keys.append(key)
+            self._positions.append(position)
+        else:
+            index = bisect.bisect_right(self._keys, key)
+            self._keys.insert(index, key)
+            self._positions.insert(index, position)
+
+    def _clear_index(self) -> None:
+        self._keys.clear()
+        self._positions.clear()
+        self._indexed.clear()
+
+    def append(self, doc: dict[str, Any]) -> None:
+        self.append_many([doc])
+
+    def append_many(self, docs: list[dict[str, Any]]) -> None:
+        """Append ``docs`` (oldest first), one write per segment they span."""
+
+        if not docs:
+            return
+        lines = [(json.dumps(doc, separators=(",", ":")) + "\n").encode("utf-8") for doc in docs]
+        with self._lock:
+            names = self._refresh()
+            name = names[-1] if names else self._segment_name(1)
+            size = self._indexed.get(name, 0)
+            rolled = 0
+            chunk: list[bytes] = []
+            for line in lines:
+                if size and size + len(line) > self._max_bytes:
+                    self._write(name, chunk)
+                    chunk = []
+                    name = self._segment_name(int(name.split(".")[0]) + 1)
+                    size = 0
+                    rolled += 1
+                chunk.append(line)
+                size += len(line)
+            self._write(name, chunk)
+            if rolled and max(len(names), 1) + rolled - 1 > self._compact_after:
+                self._compact()
+            else:
+                self._refresh()
+
+    def _write(self, name: str, chunk: list[bytes]) -> None:
+        if not chunk:
+            return
+        fd = os.open(self._root / name, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            data = memoryview(b"".join(chunk))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
-# --- Cosmos DB implementation -------------------------------------------------
-class CosmosDataStore(BaseDataStore):
-    """Azure Cosmos-backed store for multi-region deployments."""
+    def newest(self, limit: int, **bounds: Any) -> list[dict[str, Any]]:
+        try:
+            return self._read_newest(limit, bounds)
+        except FileNotFoundError:
+            # Another process compacted between indexing and reading.
+            with self._lock:
+                self._clear_index()
+            return self._read_newest(limit, bounds)
+
+    def _read_line(self, handles: dict[str, Any], name: str, offset: int) -> dict[str, Any]:
+        handle = handles.get(name)
+        if handle is None:
+            handle = handles[name] = (self._root / name).open("rb")
+        handle.seek(offset)
+        return json.loads(handle.readline())
+
+    def _read_newest(self, limit: int, bounds: dict[str, Any]) -> list[dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            keys, positions = self._keys, self._positions
+            page = _page_docs(len(positions), keys.__getitem__, positions.__getitem__, limit, **bounds)
+        handles: dict[str, Any] = {}
+        try:
+            docs: list[dict[str, Any]] = []
+            for name, offset in page:
+                try:
+                    docs.append(self._read_line(handles, name, offset))
+                except json.JSONDecodeError:
+                    continue
+            return docs
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._positions)
+
+    def compact(self) -> None:
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Merge every sealed segment into the oldest one, dropping unreadable lines."""
+
+        sealed = self._segments()[:-1]
+        if len(sealed) < 2:
+            return
+        target = self._root / sealed[0]
+        with _sibling_tempfile(target, "wb") as out:
+            for name in sealed:
+                with (self._root / name).open("rb") as handle:
+                    for raw in handle:
+                        if not raw.endswith(b"\n") or not raw.strip():
+                            continue
+                        try:
+                            json.loads(raw)
+                        except json.JSONDecodeError:
+                            continue
+                        out.write(raw)
+        for name in sealed[1:]:
+            (self._root / name).unlink(missing_ok=True)
+        self._clear_index()
+        self._refresh()
+
+
+_segment_logs: dict[Path, _SegmentLog] = {}
+_segment_logs_lock = threading.Lock()
+
+
+def _segment_log(root: Path, *, max_bytes: int, compact_after: int, key_field: str) -> _SegmentLog:
+    with _segment_logs_lock:
+        log = _segment_logs.get(root)
+        if log is None:
+            log = _segment_logs[root] = _SegmentLog(
+                root, max_bytes=max_bytes, compact_after=compact_after, key_field=key_field
+            )
+        return log
 
-    def __init__(self):
-        settings = get_settings()
-        if not settings.cosmos_enabled:
-            raise RuntimeError("Cosmos DB is not configured but selected as provider")
-        if CosmosClient is None:
-            raise RuntimeError("azure-cosmos is required for the Cosmos data store")
 
-        self._settings = settings
-        credential = None
-        if settings.cosmos_prefer_managed_identity and not settings.cosmos_key:
-            if DefaultAzureCredential is None:
-                raise RuntimeError("azure-identity is required for managed identity auth")
-            credential = DefaultAzureCredential()
-        else:
-            credential = settings.cosmos_key
+def reset_json_segment_logs() -> None:
+    """Forget cached segment indexes (primarily for tests)."""
 
-        self._client = CosmosClient(  # type: ignore[arg-type]
-            settings.cosmos_endpoint,
-            credential=credential,
-            consistency_level=settings.cosmos_consistency,
-        )
-        self._database = self._client.get_database_client(settings.cosmos_database)
-        self._interactions = self._ensure_container(settings.cosmos_interaction_container)
-        self._artifacts = self._ensure_container(settings.cosmos_artifact_container)
-        self._tail_log = self._ensure_container(settings.cosmos_tail_log_container)
-
-    def _ensure_container(self, name: str):
-        if PartitionKey is None:  # pragma: no cover - defensive
-            raise RuntimeError("azure-cosmos PartitionKey helper missing")
-        try:
-            return self._database.create_container_if_not_exists(
-                id=name,
-                partition_key=PartitionKey(path="/id"),
-                offer_throughput=400,
+    with _segment_logs_lock:
+        _segment_logs.clear()
+
+
+class JsonSegmentDataStore(BaseDataStore):
+    """File-backed store that appends each record to per-collection JSONL segments.
+
+    Writes cost one append regardless of history size and ``list_*`` reads
+    only the newest lines through a process-wide index. An existing JSON
+    snapshot at ``snapshot_path`` is imported the first time the segments are
+    empty.
+    """
+
+    _COLLECTIONS = ("interactions", "artifacts", "tail_log")
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_segment_bytes: int = 4 * 1024 * 1024,
+        compact_after: int = 8,
+        snapshot_path: Path | None = None,
+    ):
+        logs = {
+            name: _segment_log(
+                root / name,
+                max_bytes=max_segment_bytes,
+                compact_after=compact_after,
+                key_field=_LIST_KEY_FIELDS[name],
             )
-        except Exception:  # container exists
-            return self._database.get_container_client(name)
+            for name in self._COLLECTIONS
+        }
+        self._interactions = logs["interactions"]
+        self._artifacts = logs["artifacts"]
+        self._tail_log = logs["tail_log"]
+        if snapshot_path is not None and snapshot_path.exists():
+            self._import_snapshot(snapshot_path, logs)
+
+    @staticmethod
+    def _import_snapshot(snapshot_path: Path, logs: dict[str, _SegmentLog]) -> None:
+        if any(log.count() for log in logs.values()):
+            return
+        flush_json_stores()
+        try:
+            snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        for name, log in logs.items():
+            # Snapshots are stored newest-first; segments are oldest-first.
+            log.append_many(snapshot.get(name, [])[::-1])
 
     def record_interaction(
         self,
@@ -431,6 +1207,7 @@ class CosmosDataStore(BaseDataStore):
         llm_text: str,
         model_name: str,
         latency_ms: int,
+        first_token_ms: int | None = None,
     ) -> InteractionRecord:
         created_at = datetime.now(timezone.utc)
         doc = {
@@ -440,50 +1217,44 @@ class CosmosDataStore(BaseDataStore):
             "ai_response_text": llm_text,
             "model_name": model_name,
             "latency_ms": latency_ms,
+            "first_token_ms": first_token_ms,
             "created_at": created_at.isoformat(),
         }
-        self._interactions.upsert_item(doc)
-        return InteractionRecord(
-            id=doc["id"],
-            user_prompt_text=prompt,
-            typing_metadata_json=metadata,
-            ai_response_text=llm_text,
-            model_name=model_name,
-            latency_ms=latency_ms,
-            created_at=created_at,
-        )
+        self._interactions.append(doc)
+        return self._interaction_from_doc(doc)
 
-    def list_interactions(self, limit: int) -> list[InteractionRecord]:
-        query = "SELECT * FROM c ORDER BY c.created_at DESC OFFSET 0 LIMIT @limit"
-        rows = list(
-            self._interactions.query_items(
-                query,
-                parameters=[{"name": "@limit", "value": limit}],
-                enable_cross_partition_query=True,
-            )
-        )
-        return [self._interaction_from_doc(item) for item in rows]
+    def write_interactions(self, records: Sequence[InteractionRecord]) -> None:
+        self._interactions.append_many([_interaction_doc(record) for record in records])
+
+    def record_interactions_bulk(self, items: Iterable[Mapping[str, Any]]) -> list[InteractionRecord]:
+        records = _new_interaction_records(items)
+        self.write_interactions(records)
+        return records
+
+    def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        docs = self._interactions.newest(limit, cursor=cursor, since=since, until=until)
+        return [self._interaction_from_doc(doc) for doc in docs]
 
     def count_interactions(self) -> int:
-        query = "SELECT VALUE COUNT(1) FROM c"
-        rows = list(
-            self._interactions.query_items(
-                query,
-                enable_cross_partition_query=True,
-            )
-        )
-        return int(rows[0]) if rows else 0
-
-    def list_artifacts(self, limit: int) -> list[ArtifactRecord]:
-        query = "SELECT * FROM c ORDER BY c.updated_at DESC OFFSET 0 LIMIT @limit"
-        rows = list(
-            self._artifacts.query_items(
-                query,
-                parameters=[{"name": "@limit", "value": limit}],
-                enable_cross_partition_query=True,
-            )
-        )
-        return [self._artifact_from_doc(item) for item in rows]
+        return self._interactions.count()
+
+    def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        docs = self._artifacts.newest(limit, cursor=cursor, since=since, until=until)
+        return [self._artifact_from_doc(doc) for doc in docs]
 
     def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
         now = datetime.now(timezone.utc)
@@ -497,19 +1268,24 @@ class CosmosDataStore(BaseDataStore):
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
         }
-        self._artifacts.upsert_item(doc)
+        self._artifacts.append(doc)
         return self._artifact_from_doc(doc)
 
-    def list_tail_log(self, limit: int) -> list[TailLogRecord]:
-        query = "SELECT * FROM c ORDER BY c.created_at DESC OFFSET 0 LIMIT @limit"
-        rows = list(
-            self._tail_log.query_items(
-                query,
-                parameters=[{"name": "@limit", "value": limit}],
-                enable_cross_partition_query=True,
-            )
-        )
-        return [self._tail_log_from_doc(item) for item in rows]
+    def create_artifacts_bulk(self, payloads: Iterable[ArtifactCreate]) -> list[ArtifactRecord]:
+        records = _new_artifact_records(payloads)
+        self._artifacts.append_many([_artifact_doc(record) for record in records])
+        return records
+
+    def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        docs = self._tail_log.newest(limit, cursor=cursor, since=since, until=until)
+        return [self._tail_log_from_doc(doc) for doc in docs]
 
     def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
         now = datetime.now(timezone.utc)
@@ -519,8 +1295,20 @@ class CosmosDataStore(BaseDataStore):
             "source": payload.source,
             "created_at": now.isoformat(),
         }
-        self._tail_log.upsert_item(doc)
-        return self._tail_log_from_doc(doc)
+        self._tail_log.append(doc)
+        record = self._tail_log_from_doc(doc)
+        publish_tail_log([record])
+        return record
+
+    def create_tail_log_entries_bulk(self, payloads: Iterable[TailLogEntryCreate]) -> list[TailLogRecord]:
+        records = _new_tail_log_records(payloads)
+        self._tail_log.append_many([_tail_log_doc(record) for record in records])
+        publish_tail_log(records)
+        return records
+
+    def compact(self) -> None:
+        for log in (self._interactions, self._artifacts, self._tail_log):
+            log.compact()
 
     @staticmethod
     def _artifact_from_doc(doc: dict[str, Any]) -> ArtifactRecord:
@@ -554,10 +1342,465 @@ class CosmosDataStore(BaseDataStore):
             model_name=doc.get("model_name", "unknown"),
             latency_ms=doc.get("latency_ms", 0),
             created_at=datetime.fromisoformat(doc["created_at"]),
+            first_token_ms=doc.get("first_token_ms"),
+        )
+
+
+# --- Cosmos DB implementation -------------------------------------------------
+COSMOS_PARTITION_PATH = "/pk"
+
+
+def _cosmos_partition_key(path: str) -> Any:
+    # ``PartitionKey`` is a dict subclass; the plain dict keeps in-memory fakes
+    # usable where azure-cosmos is not installed.
+    if PartitionKey is not None:
+        return PartitionKey(path=path)
+    return {"paths": [path], "kind": "Hash"}
+
+
+def _cosmos_container_options(settings: Any, name: str) -> dict[str, Any]:
+    """``create_container_if_not_exists`` arguments for container ``name``, sync or async.
+
+    The indexing policy is Cosmos's default plus the composite index that
+    :func:`_cosmos_page_query` orders by; artifacts list by ``updated_at``.
+    """
+
+    order_field = "updated_at" if name == settings.cosmos_artifact_container else "created_at"
+    return {
+        "id": name,
+        "partition_key": _cosmos_partition_key(COSMOS_PARTITION_PATH),
+        "indexing_policy": {
+            "indexingMode": "consistent",
+            "automatic": True,
+            "includedPaths": [{"path": "/*"}],
+            "excludedPaths": [{"path": '/"_etag"/?'}],
+            "compositeIndexes": [
+                [{"path": f"/{order_field}", "order": "descending"}, {"path": "/id", "order": "descending"}]
+            ],
+        },
+        "offer_throughput": 400,
+    }
+
+
+def _cosmos_policy_upgrade(properties: Mapping[str, Any], options: Mapping[str, Any]) -> dict[str, Any] | None:
+    """The container's indexing policy plus any composite index it lacks, or ``None``.
+
+    ``create_container_if_not_exists`` leaves existing containers as they
+    are, so ones created before the list queries sorted on two properties
+    are upgraded in place; their other indexing settings are kept.
+    """
+
+    policy = dict(properties.get("indexingPolicy") or {})
+    composites = list(policy.get("compositeIndexes") or [])
+    missing = [index for index in options["indexing_policy"]["compositeIndexes"] if index not in composites]
+    if not missing:
+        return None
+    policy["compositeIndexes"] = composites + missing
+    return policy
+
+
+def _cosmos_partition_value(settings: Any, stamp: str) -> str:
+    """``pk`` for a document stamped ``stamp`` (UTC ISO-8601): its day or the tenant."""
+
+    if settings.cosmos_partition_strategy == "tenant":
+        return settings.cosmos_tenant
+    return stamp[:10]
+
+
+def _cosmos_read_plan(
+    settings: Any,
+    *,
+    cursor: PageCursor | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> list[tuple[str | None, datetime | None, datetime | None]]:
+    """(partition key, since, until) queries to run newest first; ``None`` is cross-partition.
+
+    Documents stamped after today (clock skew around midnight, backfills
+    with a future ``created_at``) come first, from one cross-partition query
+    bounded below by tomorrow. Day buckets are then walked back from the
+    upper bound for at most ``cosmos_partition_lookback_days`` partitions;
+    anything older is fetched with one cross-partition query capped at the
+    oldest day already read.
+    """
+
+    if settings.cosmos_partition_strategy == "tenant":
+        return [(settings.cosmos_tenant, since, until)]
+    now = datetime.now(timezone.utc)
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+    bounds = [_as_utc(value) for value in (until,) if value is not None]
+    if cursor is not None:
+        bounds.append(_as_utc(cursor.timestamp))
+    plan: list[tuple[str | None, datetime | None, datetime | None]] = []
+    if not bounds or min(bounds) > tomorrow:
+        plan.append((None, tomorrow if since is None else max(_as_utc(since), tomorrow), until))
+    day = min(bounds + [now]).date()
+    floor = _as_utc(since).date() if since is not None else None
+    for _ in range(settings.cosmos_partition_lookback_days):
+        if floor is not None and day < floor:
+            return plan
+        plan.append((day.isoformat(), since, until))
+        day -= timedelta(days=1)
+    oldest_read = datetime.combine(day + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+    if floor is None or day >= floor:
+        plan.append((None, since, oldest_read if until is None else min(_as_utc(until), oldest_read)))
+    return plan
+
+
+class _CosmosRequestCharge:
+    """``response_hook`` summing the RU charge of one call's own responses.
+
+    The client's ``last_response_headers`` are shared by every caller of the
+    pooled client, so concurrent calls would read each other's charge.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+
+    def __call__(self, headers: Mapping[str, Any] | None, *_: Any) -> None:
+        self.total += float((headers or {}).get("x-ms-request-charge", 0) or 0)
+
+
+@dataclass
+class CosmosCallStats:
+    calls: int = 0
+    request_charge: float = 0.0
+    elapsed_ms: float = 0.0
+
+
+class CosmosMetrics:
+    """Running RU charge and latency per ``<container>.<operation>``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, CosmosCallStats] = {}
+
+    def record(self, operation: str, request_charge: float, elapsed_ms: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(operation, CosmosCallStats())
+            stats.calls += 1
+            stats.request_charge += request_charge
+            stats.elapsed_ms += elapsed_ms
+        logger.debug("cosmos %s: %.2f RU in %.1f ms", operation, request_charge, elapsed_ms)
+
+    def snapshot(self) -> dict[str, CosmosCallStats]:
+        with self._lock:
+            return {operation: CosmosCallStats(**vars(stats)) for operation, stats in self._stats.items()}
+
+
+class CosmosDataStore(BaseDataStore):
+    """Azure Cosmos-backed store for multi-region deployments.
+
+    One instance (and one ``CosmosClient``) serves the whole process;
+    containers are resolved on first use. Documents carry a ``pk`` of their
+    UTC day (or the configured tenant), so newest-first reads query the most
+    recent partitions directly instead of fanning out. Containers created
+    before that, partitioned on ``/id``, keep working with cross-partition
+    queries. Every call's RU charge and latency land in ``metrics``.
+    """
+
+    def __init__(self, database: Any | None = None, *, settings: Any | None = None):
+        settings = settings or get_settings()
+        if database is None:
+            database = self._connect(settings).get_database_client(settings.cosmos_database)
+        self._settings = settings
+        self._database = database
+        self._containers: dict[str, Any] = {}
+        self._cross_partition_only: set[str] = set()
+        self._containers_lock = threading.Lock()
+        self.metrics = CosmosMetrics()
+
+    @staticmethod
+    def _connect(settings: Any) -> Any:
+        if not settings.cosmos_enabled:
+            raise RuntimeError("Cosmos DB is not configured but selected as provider")
+        if CosmosClient is None:
+            raise RuntimeError("azure-cosmos is required for the Cosmos data store")
+        if settings.cosmos_prefer_managed_identity and not settings.cosmos_key:
+            if DefaultAzureCredential is None:
+                raise RuntimeError("azure-identity is required for managed identity auth")
+            credential: Any = DefaultAzureCredential()
+        else:
+            credential = settings.cosmos_key
+        return CosmosClient(  # type: ignore[arg-type]
+            settings.cosmos_endpoint,
+            credential=credential,
+            consistency_level=settings.cosmos_consistency,
+        )
+
+    def _container(self, name: str) -> Any:
+        container = self._containers.get(name)
+        if container is not None:
+            return container
+        with self._containers_lock:
+            if name not in self._containers:
+                options = _cosmos_container_options(self._settings, name)
+                try:
+                    container = self._database.create_container_if_not_exists(**options)
+                except Exception:  # container exists
+                    container = self._database.get_container_client(name)
+                properties = container.read()
+                paths = properties.get("partitionKey", {}).get("paths", [])
+                policy = _cosmos_policy_upgrade(properties, options)
+                if policy is not None:
+                    container = self._database.replace_container(
+                        container, partition_key=_cosmos_partition_key(paths[0]), indexing_policy=policy
+                    )
+                if paths != [COSMOS_PARTITION_PATH]:
+                    self._cross_partition_only.add(name)
+                self._containers[name] = container
+            return self._containers[name]
+
+    def _measure(self, name: str, operation: str, started: float, request_charge: float) -> None:
+        self.metrics.record(f"{name}.{operation}", request_charge, (time.perf_counter() - started) * 1000)
+
+    def _query(
+        self,
+        name: str,
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        *,
+        partition_key: str | None = None,
+    ) -> list[Any]:
+        container = self._container(name)
+        options: dict[str, Any] = (
+            {"partition_key": partition_key} if partition_key is not None else {"enable_cross_partition_query": True}
+        )
+        started = time.perf_counter()
+        rows: list[Any] = []
+        charge = _CosmosRequestCharge()
+        for page in container.query_items(query, parameters=parameters, response_hook=charge, **options).by_page():
+            rows.extend(page)
+        self._measure(name, "query", started, charge.total)
+        return rows
+
+    def _newest(
+        self,
+        name: str,
+        field: str,
+        limit: int,
+        *,
+        cursor: PageCursor | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> list[dict[str, Any]]:
+        self._container(name)
+        if name in self._cross_partition_only:
+            plan: list[tuple[str | None, datetime | None, datetime | None]] = [(None, since, until)]
+        else:
+            plan = _cosmos_read_plan(self._settings, cursor=cursor, since=since, until=until)
+        docs: list[dict[str, Any]] = []
+        for partition, lower, upper in plan:
+            query, parameters = _cosmos_page_query(field, limit - len(docs), cursor=cursor, since=lower, until=upper)
+            docs.extend(self._query(name, query, parameters, partition_key=partition))
+            if len(docs) >= limit:
+                break
+        return docs
+
+    def _partitioned(self, doc: dict[str, Any], field: str) -> dict[str, Any]:
+        doc["pk"] = _cosmos_partition_value(self._settings, doc[field])
+        return doc
+
+    def _upsert(self, name: str, doc: dict[str, Any]) -> None:
+        container = self._container(name)
+        started = time.perf_counter()
+        charge = _CosmosRequestCharge()
+        container.upsert_item(doc, response_hook=charge)
+        self._measure(name, "upsert", started, charge.total)
+
+    def _upsert_many(self, name: str, docs: list[dict[str, Any]]) -> None:
+        if not docs:
+            return
+        container = self._container(name)
+        if name in self._cross_partition_only:
+            # Every document is its own ``/id`` partition, so transactional
+            # batches (single partition only) don't apply; overlap the round trips.
+            with ThreadPoolExecutor(max_workers=min(len(docs), 16)) as pool:
+                list(pool.map(lambda doc: self._upsert(name, doc), docs))
+            return
+        by_partition: dict[str, list[dict[str, Any]]] = {}
+        for doc in docs:
+            by_partition.setdefault(doc["pk"], []).append(doc)
+        for partition, partition_docs in by_partition.items():
+            # Transactional batches hold at most 100 operations.
+            for offset in range(0, len(partition_docs), 100):
+                chunk = partition_docs[offset : offset + 100]
+                started = time.perf_counter()
+                charge = _CosmosRequestCharge()
+                container.execute_item_batch(
+                    [("upsert", (doc,)) for doc in chunk], partition_key=partition, response_hook=charge
+                )
+                self._measure(name, "batch", started, charge.total)
+
+    def record_interaction(
+        self,
+        *,
+        prompt: str,
+        metadata: dict[str, Any],
+        llm_text: str,
+        model_name: str,
+        latency_ms: int,
+        first_token_ms: int | None = None,
+    ) -> InteractionRecord:
+        record = InteractionRecord(
+            id=str(uuid4()),
+            user_prompt_text=prompt,
+            typing_metadata_json=metadata,
+            ai_response_text=llm_text,
+            model_name=model_name,
+            latency_ms=latency_ms,
+            created_at=datetime.now(timezone.utc),
+            first_token_ms=first_token_ms,
+        )
+        self._upsert(self._settings.cosmos_interaction_container, self._partitioned(_interaction_doc(record), "created_at"))
+        return record
+
+    def write_interactions(self, records: Sequence[InteractionRecord]) -> None:
+        docs = [self._partitioned(_interaction_doc(record), "created_at") for record in records]
+        self._upsert_many(self._settings.cosmos_interaction_container, docs)
+
+    def record_interactions_bulk(self, items: Iterable[Mapping[str, Any]]) -> list[InteractionRecord]:
+        records = _new_interaction_records(items)
+        self.write_interactions(records)
+        return records
+
+    def list_interactions(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[InteractionRecord]:
+        docs = self._newest(
+            self._settings.cosmos_interaction_container,
+            "created_at",
+            limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return [self._interaction_from_doc(item) for item in docs]
+
+    def count_interactions(self) -> int:
+        rows = self._query(self._settings.cosmos_interaction_container, "SELECT VALUE COUNT(1) FROM c")
+        return int(sum(rows))
+
+    def list_artifacts(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[ArtifactRecord]:
+        docs = self._newest(
+            self._settings.cosmos_artifact_container,
+            "updated_at",
+            limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return [self._artifact_from_doc(item) for item in docs]
+
+    def create_artifact(self, payload: ArtifactCreate) -> ArtifactRecord:
+        (record,) = _new_artifact_records([payload])
+        self._upsert(self._settings.cosmos_artifact_container, self._partitioned(_artifact_doc(record), "updated_at"))
+        return record
+
+    def create_artifacts_bulk(self, payloads: Iterable[ArtifactCreate]) -> list[ArtifactRecord]:
+        records = _new_artifact_records(payloads)
+        docs = [self._partitioned(_artifact_doc(record), "updated_at") for record in records]
+        self._upsert_many(self._settings.cosmos_artifact_container, docs)
+        return records
+
+    def list_tail_log(
+        self,
+        limit: int,
+        *,
+        cursor: PageCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TailLogRecord]:
+        docs = self._newest(
+            self._settings.cosmos_tail_log_container,
+            "created_at",
+            limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return [self._tail_log_from_doc(item) for item in docs]
+
+    def create_tail_log_entry(self, payload: TailLogEntryCreate) -> TailLogRecord:
+        (record,) = _new_tail_log_records([payload])
+        self._upsert(self._settings.cosmos_tail_log_container, self._partitioned(_tail_log_doc(record), "created_at"))
+        publish_tail_log([record])
+        return record
+
+    def create_tail_log_entries_bulk(self, payloads: Iterable[TailLogEntryCreate]) -> list[TailLogRecord]:
+        records = _new_tail_log_records(payloads)
+        docs = [self._partitioned(_tail_log_doc(record), "created_at") for record in records]
+        self._upsert_many(self._settings.cosmos_tail_log_container, docs)
+        publish_tail_log(records)
+        return records
+
+    @staticmethod
+    def _artifact_from_doc(doc: dict[str, Any]) -> ArtifactRecord:
+        return ArtifactRecord(
+            id=doc["id"],
+            title=doc["title"],
+            body=doc["body"],
+            owner=doc["owner"],
+            category=doc["category"],
+            accent=doc.get("accent"),
+            created_at=datetime.fromisoformat(doc["created_at"]),
+            updated_at=datetime.fromisoformat(doc["updated_at"]),
+        )
+
+    @staticmethod
+    def _tail_log_from_doc(doc: dict[str, Any]) -> TailLogRecord:
+        return TailLogRecord(
+            id=doc["id"],
+            message=doc["message"],
+            source=doc["source"],
+            created_at=datetime.fromisoformat(doc["created_at"]),
+        )
+
+    @staticmethod
+    def _interaction_from_doc(doc: dict[str, Any]) -> InteractionRecord:
+        return InteractionRecord(
+            id=doc["id"],
+            user_prompt_text=doc["user_prompt_text"],
+            typing_metadata_json=doc.get("typing_metadata_json", {}),
+            ai_response_text=doc["ai_response_text"],
+            model_name=doc.get("model_name", "unknown"),
+            latency_ms=doc.get("latency_ms", 0),
+            created_at=datetime.fromisoformat(doc["created_at"]),
+            first_token_ms=doc.get("first_token_ms"),
         )
 
 
 # --- Dependency helper --------------------------------------------------------
+_file_stores: dict[tuple[str, Path], BaseDataStore] = {}
+_file_stores_lock = threading.Lock()
+_cosmos_store: CosmosDataStore | None = None
+
+
+def reset_data_stores() -> None:
+    """Flush and forget the process-wide stores (primarily for tests)."""
+
+    global _cosmos_store
+    flush_json_stores()
+    with _file_stores_lock:
+        _file_stores.clear()
+        _cosmos_store = None
+    with _json_snapshots_lock:
+        _json_snapshots.clear()
+    reset_json_segment_logs()
+
+
 def get_data_store(
     session: Session | None = Depends(get_optional_db_session),
 ) -> BaseDataStore:
@@ -574,10 +1817,32 @@ def _build_data_store(settings, session: Session | None) -> BaseDataStore:
         return SqliteDataStore(session)
 
     if provider == "cosmos":
-        return CosmosDataStore()
+        # One client, connection pool and container cache for the process.
+        global _cosmos_store
+        with _file_stores_lock:
+            if _cosmos_store is None:
+                _cosmos_store = CosmosDataStore(settings=settings)
+            return _cosmos_store
 
     if provider == "json":
-        return JsonDataStore(settings.json_store_path)
+        # File-backed stores are stateless wrappers around process-wide
+        # caches, so one instance per path serves every request.
+        path = settings.json_store_path
+        key = (settings.json_store_mode, path)
+        with _file_stores_lock:
+            store = _file_stores.get(key)
+            if store is None:
+                if settings.json_store_mode == "segments":
+                    store = JsonSegmentDataStore(
+                        path.with_name(f"{path.stem}-segments"),
+                        max_segment_bytes=settings.json_segment_max_bytes,
+                        compact_after=settings.json_segment_compact_after,
+                        snapshot_path=path,
+                    )
+                else:
+                    store = JsonDataStore(path, flush_delay=settings.json_flush_delay_ms / 1000)
+                _file_stores[key] = store
+            return store
 
     raise RuntimeError(f"Unsupported DATABASE_PROVIDER: {provider}")
 
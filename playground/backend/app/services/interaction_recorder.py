@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+"""Write-behind persistence for chat interactions."""
+# @tag: backend,services,data
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Sequence
+from uuid import uuid4
+
+from ..config import get_settings
+from .data_store import InteractionRecord, data_store_context
+
+logger = logging.getLogger(__name__)
+
+BatchWriter = Callable[[Sequence[InteractionRecord]], None]
+
+
+def _write_with_data_store(records: Sequence[InteractionRecord]) -> None:
+    with data_store_context() as store:
+        store.write_interactions(records)
+
+
+class InteractionRecorder:
+    """Acknowledge interactions immediately and commit them in batches.
+
+    ``record`` assigns the id and timestamp, queues the record and returns.
+    A single writer task drains the queue into ``writer`` (run on a worker
+    thread) with one transaction per batch of up to ``batch_size`` records,
+    waiting at most ``flush_interval`` seconds for a batch to fill.
+
+    ``max_unflushed`` bounds how many acknowledged records can be
+    uncommitted at once, i.e. how many can be lost if the process dies.
+    Callers wait once that many are outstanding, which is the backpressure
+    that keeps a slow database from growing the queue without limit.
+    """
+
+    def __init__(
+        self,
+        writer: BatchWriter = _write_with_data_store,
+        *,
+        max_unflushed: int = 256,
+        batch_size: int = 64,
+        flush_interval: float = 0.05,
+    ):
+        self._writer = writer
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._slots = asyncio.Semaphore(max_unflushed)
+        self._queue: asyncio.Queue[InteractionRecord] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._pending = 0
+        self.written = 0
+        self.failed = 0
+
+    async def record(
+        self,
+        *,
+        prompt: str,
+        metadata: dict[str, Any],
+        llm_text: str,
+        model_name: str,
+        latency_ms: int,
+        first_token_ms: int | None = None,
+    ) -> InteractionRecord:
+        record = InteractionRecord(
+            id=str(uuid4()),
+            user_prompt_text=prompt,
+            typing_metadata_json=metadata,
+            ai_response_text=llm_text,
+            model_name=model_name,
+            latency_ms=latency_ms,
+            created_at=datetime.now(timezone.utc),
+            first_token_ms=first_token_ms,
+        )
+        await self._slots.acquire()
+        self._pending += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="interaction-recorder")
+        self._queue.put_nowait(record)
+        return record
+
+    @property
+    def pending(self) -> int:
+        """Acknowledged records not yet committed (queued or in flight)."""
+
+        return self._pending
+
+    async def _next_batch(self) -> list[InteractionRecord]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        while len(batch) < self._batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await asyncio.to_thread(self._writer, batch)
+                self.written += len(batch)
+            except Exception:  # pragma: no cover - logged, writer keeps draining
+                self.failed += len(batch)
+                logger.exception("Failed to persist %d interaction(s)", len(batch))
+            finally:
+                self._pending -= len(batch)
+                for _ in batch:
+                    self._queue.task_done()
+                    self._slots.release()
+
+    async def flush(self) -> None:
+        """Wait until every acknowledged record has been written."""
+
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# --- Dependency helper ----------------------------------------------------------
+_interaction_recorder: InteractionRecorder | None = None
+
+
+def get_interaction_recorder() -> InteractionRecorder:
+    """Return the process-wide write-behind recorder configured from settings."""
+
+    global _interaction_recorder
+    if _interaction_recorder is None:
+        settings = get_settings()
+        _interaction_recorder = InteractionRecorder(
+            max_unflushed=settings.interaction_max_unflushed,
+            batch_size=settings.interaction_batch_size,
+            flush_interval=settings.interaction_flush_interval_ms / 1000,
+        )
+    return _interaction_recorder
+
+
+async def close_interaction_recorder() -> None:
+    """Flush outstanding interactions and stop the writer (called from the app lifespan)."""
+
+    global _interaction_recorder
+    recorder, _interaction_recorder = _interaction_recorder, None
+    if recorder is not None:
+        await recorder.aclose()
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+"""Two-tier response cache for identical LLM requests."""
+# @tag:backend,services,llm
+
+# --- Imports -----------------------------------------------------------------
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping, Protocol
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], float]
+
+
+def cache_key(provider: str, model: str, prompt: str, params: Mapping[str, Any]) -> str:
+    """SHA-256 of the request with the prompt normalized.
+
+    The prompt is NFC-normalized, has its line endings unified and its outer
+    whitespace stripped, so copies of the same prompt from different editors
+    share an entry. Inner whitespace is kept; it can change the answer.
+    """
+
+    normalized = unicodedata.normalize("NFC", prompt).replace("\r\n", "\n").strip()
+    blob = json.dumps(
+        {"provider": provider.strip().lower(), "model": model.strip(), "prompt": normalized, "params": dict(params)},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedCompletion:
+    text: str
+    model_name: str
+    expires_at: float
+
+
+# --- Tiers ---------------------------------------------------------------------
+class LLMCacheTier(Protocol):
+    """Storage for cached completions. Tiers drop expired entries on read."""
+
+    def get(self, key: str) -> CachedCompletion | None:
+        ...
+
+    def put(self, key: str, entry: CachedCompletion) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    evictions: int
+
+
+class MemoryCacheTier:
+    """In-process LRU bounded to ``max_entries``."""
+
+    def __init__(self, max_entries: int, *, clock: Clock = time.time):
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedCompletion] = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: str) -> CachedCompletion | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedCompletion) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCacheTier:
+    """On-disk tier that survives restarts and is shared by every worker on the host.
+
+    Keeps at most ``max_entries`` rows; writes past that drop expired rows
+    and then the least recently used ones. Calls block, so async callers run
+    them on a worker thread.
+    """
+
+    def __init__(self, path: Path, max_entries: int, *, clock: Clock = time.time):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY, text TEXT NOT NULL, model_name TEXT NOT NULL,"
+            " expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_last_used ON llm_cache (last_used)")
+        self.evictions = 0
+
+    def get(self, key: str) -> CachedCompletion | None:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, model_name, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[2] <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+        return CachedCompletion(text=row[0], model_name=row[1], expires_at=row[2])
+
+    def put(self, key: str, entry: CachedCompletion) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, text, model_name, expires_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, entry.text, entry.model_name, entry.expires_at, now),
+            )
+            overflow = self._count() - self._max_entries
+            if overflow > 0:
+                self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                overflow = self._count() - self._max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_used LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+
+    def _count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# --- Cache ---------------------------------------------------------------------
+@dataclass
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+
+
+class LLMResponseCache:
+    """Memory tier in front of an optional blocking tier (SQLite by default).
+
+    Disk hits are promoted to memory. The disk tier is best-effort: errors
+    are logged and treated as misses so a broken cache never fails a chat.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory: MemoryCacheTier | None = None,
+        disk: LLMCacheTier | None = None,
+        ttl_s: float = 3600.0,
+        clock: Clock = time.time,
+    ):
+        self._memory = memory
+        self._disk = disk
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self.stats = LLMCacheStats()
+
+    async def get(self, key: str) -> CachedCompletion | None:
+        entry = self._memory.get(key) if self._memory is not None else None
+        if entry is not None:
+            self.stats.hits += 1
+            self.stats.memory_hits += 1
+            return entry
+        if self._disk is not None:
+            try:
+                entry = await asyncio.to_thread(self._disk.get, key)
+            except Exception:
+                logger.warning("LLM cache disk read failed", exc_info=True)
+            if entry is not None:
+                if self._memory is not None:
+                    self._memory.put(key, entry)
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                return entry
+        self.stats.misses += 1
+        return None
+
+    async def put(self, key: str, text: str, model_name: str) -> None:
+        if not text:
+            return
+        entry = CachedCompletion(text=text, model_name=model_name, expires_at=self._clock() + self._ttl_s)
+        if self._memory is not None:
+            self._memory.put(key, entry)
+        if self._disk is not None:
+            try:
+                await asyncio.to_thread(self._disk.put, key, entry)
+            except Exception:
+                logger.warning("LLM cache disk write failed", exc_info=True)
+        self.stats.stores += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Counters plus tier sizes and evictions, for the stats endpoint."""
+
+        return {
+            **asdict(self.stats),
+            "memory_entries": len(self._memory) if self._memory is not None else 0,
+            "disk_entries": len(self._disk) if self._disk is not None else 0,
+            "evictions": sum(tier.evictions for tier in (self._memory, self._disk) if tier is not None),
+        }
+
+    def close(self) -> None:
+        close = getattr(self._disk, "close", None)
+        if close is not None:
+            close()
@@ -5,13 +5,28 @@ from __future__ import annotations
 
 # --- Imports -----------------------------------------------------------------
 import asyncio
+import json
+import logging
+import re
 import time
-from dataclasses import dataclass
-from typing import Protocol
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Protocol, TypeVar
 
 import httpx
 
-from ..config import get_settings
+from ..config import Settings, get_settings
+from .llm_cache import LLMResponseCache, MemoryCacheTier, SqliteCacheTier, cache_key
+from .llm_limiter import LLMRateLimiter
+from .single_flight import SingleFlight
+
+try:  # pragma: no cover - optional dependency (httpx[http2])
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover
+    h2 = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -21,12 +36,27 @@ class LLMResult:
     text: str
     model_name: str
     latency_ms: int
+    cached: bool = False
+    total_tokens: int | None = None
+
+
+@dataclass
+class LLMChunk:
+    """One streamed slice of a completion, in arrival order."""
+
+    text: str
+    model_name: str
+    cached: bool = False
 
 
 class LLMClient(Protocol):
     async def generate(self, prompt: str) -> LLMResult:  # pragma: no cover - protocol
         ...
 
+    def generate_stream(self, prompt: str) -> AsyncIterator[LLMChunk]:  # pragma: no cover - protocol
+        """Yield the completion as it is produced instead of once it is finished."""
+        ...
+
 
 class EchoLLMClient:
     """Predictable test double that simply echoes prompts."""
@@ -41,36 +71,246 @@ class EchoLLMClient:
             latency_ms=latency_ms,
         )
 
+    async def generate_stream(self, prompt: str) -> AsyncIterator[LLMChunk]:
+        # Word-sized chunks so streaming consumers see more than one frame.
+        for piece in re.findall(r"\s*\S+", f"[echo] {prompt}"):
+            await asyncio.sleep(0)
+            yield LLMChunk(text=piece, model_name="echo")
+
 
 class OpenAILLMClient:
-    """Thin wrapper around OpenAI's Chat Completions endpoint."""
+    """Thin wrapper around OpenAI's Chat Completions endpoint.
+
+    Owns one pooled ``httpx.AsyncClient`` for its lifetime, so prompts reuse
+    warm keep-alive connections (and multiplex over HTTP/2 when ``h2`` is
+    installed) instead of paying TCP + TLS setup per request. Call
+    ``aclose()`` on shutdown.
+    """
 
-    def __init__(self, api_key: str, model: str, max_tokens: int) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_tokens: int,
+        *,
+        base_url: str = "https://api.openai.com/v1",
+        timeout: float = 30.0,
+        limits: httpx.Limits | None = None,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+        temperature: float = 0.2,
+    ) -> None:
         self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
-        self._base_url = "https://api.openai.com/v1/chat/completions"
+        self.temperature = temperature
+        if http2 and h2 is None:
+            logger.info("h2 is not installed; OpenAI client falls back to HTTP/1.1 keep-alive")
+            http2 = False
+        self._http = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=timeout,
+            limits=limits or httpx.Limits(),
+            http2=http2,
+            transport=transport,
+        )
 
-    async def generate(self, prompt: str) -> LLMResult:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {
+    def _payload(self, prompt: str, **extra: Any) -> dict[str, Any]:
+        return {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "max_tokens": self.max_tokens,
-            "temperature": 0.2,
+            "temperature": self.temperature,
+            **extra,
         }
+
+    async def generate(self, prompt: str) -> LLMResult:
+        payload = self._payload(prompt)
         start = time.perf_counter()
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(self._base_url, headers=headers, json=payload)
+        resp = await self._http.post("/chat/completions", json=payload)
         resp.raise_for_status()
         latency_ms = int((time.perf_counter() - start) * 1000)
         data = resp.json()
         message = data["choices"][0]["message"]["content"].strip()
         model_name = data.get("model", self.model)
-        return LLMResult(text=message, model_name=model_name, latency_ms=latency_ms)
+        total_tokens = (data.get("usage") or {}).get("total_tokens")
+        return LLMResult(text=message, model_name=model_name, latency_ms=latency_ms, total_tokens=total_tokens)
+
+    async def generate_stream(self, prompt: str) -> AsyncIterator[LLMChunk]:
+        """Parse the ``stream=true`` server-sent events into content deltas."""
+
+        payload = self._payload(prompt, stream=True)
+        async with self._http.stream("POST", "/chat/completions", json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                choices = event.get("choices") or []
+                text = (choices[0].get("delta") or {}).get("content") if choices else None
+                if text:
+                    yield LLMChunk(text=text, model_name=event.get("model", self.model))
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+class RateLimitedLLMClient:
+    """Send provider calls through an :class:`LLMRateLimiter`.
+
+    Each call reserves ``len(prompt) // 4 + max_tokens`` from the
+    tokens/minute budget up front; ``generate`` hands back the difference
+    once the provider reports its actual usage.
+    """
+
+    def __init__(self, client: LLMClient, limiter: LLMRateLimiter, *, max_tokens: int) -> None:
+        self.client = client
+        self.limiter = limiter
+        self._max_tokens = max_tokens
+
+    def _estimate(self, prompt: str) -> int:
+        return len(prompt) // 4 + self._max_tokens
+
+    async def generate(self, prompt: str) -> LLMResult:
+        estimate = self._estimate(prompt)
+        result = await self.limiter.run(lambda: self.client.generate(prompt), tokens=estimate)
+        self.limiter.settle(estimate, result.total_tokens)
+        return result
+
+    def generate_stream(self, prompt: str) -> AsyncIterator[LLMChunk]:
+        return self.limiter.stream(lambda: self.client.generate_stream(prompt), tokens=self._estimate(prompt))
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class CachedLLMClient:
+    """Serve repeated requests from an :class:`LLMResponseCache` before calling ``client``.
+
+    The key covers ``provider``, the client's model and its sampling
+    ``params``, so changing any of them misses. Streams replay a hit as one
+    chunk and store a miss once it has finished; an abandoned stream is not
+    stored.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: LLMResponseCache,
+        *,
+        provider: str,
+        model: str,
+        params: dict[str, Any],
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self._provider = provider
+        self._model = model
+        self._params = params
+
+    def _key(self, prompt: str) -> str:
+        return cache_key(self._provider, self._model, prompt, self._params)
+
+    async def generate(self, prompt: str) -> LLMResult:
+        start = time.perf_counter()
+        key = self._key(prompt)
+        hit = await self.cache.get(key)
+        if hit is not None:
+            latency_ms = int((time.perf_counter() - start) * 1000)
+            return LLMResult(text=hit.text, model_name=hit.model_name, latency_ms=latency_ms, cached=True)
+        result = await self.client.generate(prompt)
+        await self.cache.put(key, result.text, result.model_name)
+        return result
+
+    async def generate_stream(self, prompt: str) -> AsyncIterator[LLMChunk]:
+        key = self._key(prompt)
+        hit = await self.cache.get(key)
+        if hit is not None:
+            yield LLMChunk(text=hit.text, model_name=hit.model_name, cached=True)
+            return
+        parts: list[str] = []
+        model_name = self._model
+        async for chunk in self.client.generate_stream(prompt):
+            parts.append(chunk.text)
+            model_name = chunk.model_name or model_name
+            yield chunk
+        await self.cache.put(key, "".join(parts).strip(), model_name)
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        await asyncio.to_thread(self.cache.close)
+
+
+class CoalescingLLMClient:
+    """Share one in-flight ``generate`` call among concurrent identical requests.
+
+    Requests are matched on the same normalized key as the response cache, so
+    a burst of one prompt costs one provider call (and, when this wraps a
+    :class:`CachedLLMClient`, one cache lookup and one store). Timeout and
+    cancellation follow :class:`SingleFlight`. Streams are not coalesced;
+    each stream has its own consumer pacing.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        flights: SingleFlight[LLMResult],
+        *,
+        provider: str,
+        model: str,
+        params: dict[str, Any],
+    ) -> None:
+        self.client = client
+        self.flights = flights
+        self._provider = provider
+        self._model = model
+        self._params = params
+
+    async def generate(self, prompt: str) -> LLMResult:
+        key = cache_key(self._provider, self._model, prompt, self._params)
+        return await self.flights.do(key, lambda: self.client.generate(prompt))
+
+    def generate_stream(self, prompt: str) -> AsyncIterator[LLMChunk]:
+        return self.client.generate_stream(prompt)
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _find_layer(client: Any, layer: type[T]) -> T | None:
+    # Wrappers expose the client they decorate as ``.client``.
+    while client is not None:
+        if isinstance(client, layer):
+            return client
+        client = getattr(client, "client", None)
+    return None
+
+
+def _build_llm_cache(settings: Settings) -> LLMResponseCache:
+    memory = (
+        MemoryCacheTier(settings.llm_cache_memory_max_entries)
+        if settings.llm_cache_memory_max_entries
+        else None
+    )
+    disk = (
+        SqliteCacheTier(settings.llm_cache_path, settings.llm_cache_disk_max_entries)
+        if settings.llm_cache_disk_max_entries
+        else None
+    )
+    return LLMResponseCache(memory=memory, disk=disk, ttl_s=settings.llm_cache_ttl_s)
 
 
 _llm_client: LLMClient | None = None
@@ -84,19 +324,122 @@ def get_llm_client() -> LLMClient:
         return _llm_client
 
     settings = get_settings()
+    client: LLMClient
     if settings.llm_provider == "openai" and settings.openai_api_key:
-        _llm_client = OpenAILLMClient(
+        openai = OpenAILLMClient(
             api_key=settings.openai_api_key,
             model=settings.openai_model,
             max_tokens=settings.max_response_tokens,
+            base_url=settings.openai_base_url,
+            timeout=settings.llm_timeout_s,
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_keepalive_connections,
+                keepalive_expiry=settings.llm_keepalive_expiry_s,
+            ),
+            http2=settings.llm_http2,
+        )
+        provider, model = "openai", openai.model
+        params: dict[str, Any] = {"max_tokens": openai.max_tokens, "temperature": openai.temperature}
+        # Below the cache and single-flight, so only real provider calls spend quota.
+        client = RateLimitedLLMClient(
+            openai,
+            LLMRateLimiter(
+                requests_per_minute=settings.llm_rate_limit_rpm,
+                tokens_per_minute=settings.llm_rate_limit_tpm,
+                burst_s=settings.llm_rate_limit_burst_s,
+                max_concurrency=settings.llm_max_concurrency,
+                max_retries=settings.llm_max_retries,
+                backoff_base=settings.llm_backoff_base_s,
+                backoff_max=settings.llm_backoff_max_s,
+            ),
+            max_tokens=openai.max_tokens,
         )
     else:
-        _llm_client = EchoLLMClient()
+        client, provider, model, params = EchoLLMClient(), "echo", "echo", {}
+
+    # Echo is free and deterministic; caching it would only cost disk writes.
+    if settings.llm_cache_enabled and provider != "echo":
+        client = CachedLLMClient(
+            client,
+            _build_llm_cache(settings),
+            provider=provider,
+            model=model,
+            params=params,
+        )
+    if settings.llm_single_flight_enabled:
+        client = CoalescingLLMClient(
+            client,
+            SingleFlight(timeout=settings.llm_single_flight_timeout_s),
+            provider=provider,
+            model=model,
+            params=params,
+        )
+    _llm_client = client
     return _llm_client
 
 
+_closing: set[asyncio.Task] = set()
+
+
+async def _close_quietly(client: LLMClient) -> None:
+    try:
+        await client.aclose()  # type: ignore[attr-defined]
+    except Exception:
+        # Pooled connections opened on another, now closed, event loop can't be shut down cleanly.
+        logger.warning("Closing the previous LLM client failed", exc_info=True)
+
+
 def reset_llm_client() -> None:
-    """Force recreation of the cached LLM client (primarily for tests)."""
+    """Force recreation of the cached LLM client (primarily for tests).
+
+    The previous client is closed like :func:`close_llm_client` does: right
+    away when no event loop is running, otherwise as a task on that loop.
+    Close failures are logged, not raised.
+    """
+
+    global _llm_client
+    client, _llm_client = _llm_client, None
+    if getattr(client, "aclose", None) is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_close_quietly(client))
+        return
+    task = loop.create_task(_close_quietly(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def llm_cache_stats() -> dict[str, Any] | None:
+    """Counters for the active response cache, or ``None`` when caching is off."""
+
+    cached = _find_layer(get_llm_client(), CachedLLMClient)
+    return cached.cache.snapshot() if cached is not None else None
+
+
+def llm_single_flight_stats() -> dict[str, Any] | None:
+    """Coalescing counters, or ``None`` when single-flight is off."""
+
+    coalescing = _find_layer(get_llm_client(), CoalescingLLMClient)
+    if coalescing is None:
+        return None
+    return {**asdict(coalescing.flights.stats), "in_flight": coalescing.flights.in_flight}
+
+
+def llm_limiter_stats() -> dict[str, Any] | None:
+    """Queue depth and retry counters, or ``None`` when the provider is not rate limited."""
+
+    limited = _find_layer(get_llm_client(), RateLimitedLLMClient)
+    return asdict(limited.limiter.stats) if limited is not None else None
+
+
+async def close_llm_client() -> None:
+    """Close the cached client's connection pool (called from the app lifespan)."""
 
     global _llm_client
-    _llm_client = None
+    client, _llm_client = _llm_client, None
+    aclose = getattr(client, "aclose", None)
+    if aclose is not None:
+        await aclose()
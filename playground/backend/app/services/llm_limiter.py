@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+"""Client-side rate limiting, concurrency cap and retry policy for LLM providers."""
+# @tag:backend,services,llm
+
+# --- Imports -----------------------------------------------------------------
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class LLMRateLimitedError(RuntimeError):
+    """The provider kept answering 429 after every retry."""
+
+    def __init__(self, retry_after: float | None):
+        super().__init__("LLM provider rate limit exceeded")
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(response: httpx.Response, *, now: float | None = None) -> float | None:
+    """Parse ``Retry-After`` (delta-seconds or an HTTP date) into seconds from now."""
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(when - (time.time() if now is None else now), 0.0)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """429s, 5xx responses and transport failures (connect, read timeout) are retried."""
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+# --- Token bucket --------------------------------------------------------------
+class TokenBucket:
+    """Async bucket refilled continuously at ``per_minute``, holding ``burst_s`` seconds of it.
+
+    Providers enforce per-minute quotas over shorter windows, so the burst is
+    kept small rather than a full minute. Waiters are served in arrival
+    order, so a large request is not starved by a stream of small ones. A
+    request larger than the bucket waits for a full bucket and leaves it in
+    debt, as does a charge after the fact (see :meth:`adjust`); later callers
+    wait for the debt to refill.
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        *,
+        burst_s: float = 1.0,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ):
+        self._rate = per_minute / 60.0
+        self.capacity = max(self._rate * burst_s, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        needed = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return
+                await self._sleep((needed - self._tokens) / self._rate)
+
+    def adjust(self, delta: float) -> None:
+        """Return (positive) or charge (negative) tokens without waiting."""
+
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + delta)
+
+
+# --- Limiter -------------------------------------------------------------------
+@dataclass
+class LLMLimiterStats:
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    in_flight: int = 0
+
+
+class LLMRateLimiter:
+    """Gate provider calls by concurrency, requests/minute and tokens/minute.
+
+    Each attempt takes a concurrency slot, then one request token and the
+    caller's token estimate, then calls the provider. Retryable failures
+    release the slot and back off with full jitter (``uniform(0, base * 2**n)``
+    capped at ``backoff_max``). A 429 additionally pauses *every* caller until
+    its ``Retry-After`` has passed, so a throttled burst drains at the
+    provider's pace instead of retrying in lockstep.
+
+    ``queue_depth`` counts callers waiting for a slot, a token or a cool-down.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        burst_s: float = 1.0,
+        max_concurrency: int = 16,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+        rng: random.Random | None = None,
+    ):
+        bucket = {"burst_s": burst_s, "clock": clock, "sleep": sleep}
+        self._requests = TokenBucket(requests_per_minute, **bucket) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, **bucket) if tokens_per_minute else None
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._paused_until = 0.0
+        self.stats = LLMLimiterStats()
+
+    def backoff(self, attempt: int) -> float:
+        return self._rng.uniform(0, min(self._backoff_max, self._backoff_base * 2**attempt))
+
+    async def _wait_for_cooldown(self) -> None:
+        while (remaining := self._paused_until - self._clock()) > 0:
+            await self._sleep(remaining)
+
+    async def _admit(self, tokens: int) -> None:
+        self.stats.queue_depth += 1
+        self.stats.peak_queue_depth = max(self.stats.peak_queue_depth, self.stats.queue_depth)
+        try:
+            await self._slots.acquire()
+            try:
+                await self._wait_for_cooldown()
+                if self._requests is not None:
+                    await self._requests.acquire(1)
+                if self._tokens is not None:
+                    await self._tokens.acquire(tokens)
+            except BaseException:
+                self._slots.release()
+                raise
+        finally:
+            self.stats.queue_depth -= 1
+        self.stats.in_flight += 1
+
+    def _release(self) -> None:
+        self.stats.in_flight -= 1
+        self._slots.release()
+
+    def settle(self, estimated: int, actual: int | None) -> None:
+        """Correct the tokens/minute bucket once the real usage is known."""
+
+        if self._tokens is not None and actual is not None:
+            self._tokens.adjust(estimated - actual)
+
+    def _retry_delay(self, exc: BaseException, attempt: int) -> float | None:
+        """Seconds to wait before the next attempt, or ``None`` to give up."""
+
+        if not is_retryable(exc):
+            return None
+        delay = self.backoff(attempt)
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+            # Pause everyone, not just this caller, even when it is about to give up.
+            self.stats.throttled += 1
+            retry_after = retry_after_seconds(exc.response)
+            if retry_after is not None:
+                delay = retry_after + self._rng.uniform(0, self._backoff_base)
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+        if attempt >= self._max_retries:
+            return None
+        self.stats.retries += 1
+        logger.info("LLM call failed (%s); retry %d in %.2fs", exc, attempt + 1, delay)
+        return delay
+
+    def _give_up(self, exc: BaseException) -> None:
+        """Count the failure; a final 429 is raised as :class:`LLMRateLimitedError`."""
+
+        self.stats.failures += 1
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+            raise LLMRateLimitedError(retry_after_seconds(exc.response)) from exc
+
+    async def run(self, fn: Callable[[], Awaitable[T]], *, tokens: int = 0) -> T:
+        """Call ``fn`` under the limits, retrying retryable failures."""
+
+        self.stats.requests += 1
+        attempt = 0
+        while True:
+            await self._admit(tokens)
+            try:
+                return await fn()
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    self._give_up(exc)
+                    raise
+            finally:
+                self._release()
+            await self._sleep(delay)
+            attempt += 1
+
+    async def stream(self, open_stream: Callable[[], AsyncIterator[T]], *, tokens: int = 0) -> AsyncIterator[T]:
+        """Yield from ``open_stream()`` under the limits, holding a slot until it ends.
+
+        Only failures before the first item are retried; once anything was
+        yielded a retry would repeat it.
+        """
+
+        self.stats.requests += 1
+        attempt = 0
+        while True:
+            await self._admit(tokens)
+            items = open_stream()
+            try:
+                try:
+                    first = await anext(items)
+                except StopAsyncIteration:
+                    return
+                except Exception as exc:
+                    delay = self._retry_delay(exc, attempt)
+                    if delay is None:
+                        self._give_up(exc)
+                        raise
+                else:
+                    yield first
+                    async for item in items:
+                        yield item
+                    return
+            finally:
+                aclose = getattr(items, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                self._release()
+            await self._sleep(delay)
+            attempt += 1
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -57,14 +59,45 @@ class TelemetrySummary:
         }
 
 
-def _count_recent_runs(runs: list[dict[str, Any]], *, recent_hours: int) -> int:
+@dataclass(slots=True)
+class _CachedSummary:
+    """Parsed ledger state reused until the ledger or preset tags change on disk."""
+
+    signature: tuple[Any, ...]
+    summary: TelemetrySummary | None
+    match_rate: float
+    preset_drift: list[dict[str, Any]]
+    preset_drift_windows: dict[str, list[dict[str, Any]]]
+    recent_timestamps: list[float]
+
+
+_summary_cache: dict[tuple[str, int, int, str], _CachedSummary] = {}
+_summary_cache_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_recent_timestamps(path: Path, *, recent_hours: int) -> list[float]:
     window = datetime.now(timezone.utc) - timedelta(hours=recent_hours)
-    total = 0
-    for entry in runs:
-        timestamp = _safe_datetime(entry.get("timestamp")) if isinstance(entry, dict) else None
-        if timestamp and timestamp >= window:
-            total += 1
-    return total
+    # Only the run-store partitions overlapping the window are read.
+    timestamps: list[float] = []
+    for entry in ledger.load_runs(path, since=window):
+        timestamp = _safe_datetime(entry.get("timestamp"))
+        if timestamp:
+            timestamps.append(timestamp.timestamp())
+    return sorted(timestamps)
+
+
+def _count_recent_runs(timestamps: list[float], *, recent_hours: int) -> int:
+    # The ledger is unchanged while cached, so runs can only age out of the window.
+    window = datetime.now(timezone.utc) - timedelta(hours=recent_hours)
+    return len(timestamps) - bisect_left(timestamps, window.timestamp())
 
 
 def _resolve_match_stats(summary: dict[str, Any]) -> tuple[int, int, float | None, float | None, datetime | None]:
@@ -76,6 +109,50 @@ def _resolve_match_stats(summary: dict[str, Any]) -> tuple[int, int, float | Non
     return total_runs, runs_with_matches, avg_duration, avg_density, last_ingest
 
 
+def _load_summary(
+    path: Path,
+    *,
+    signature: tuple[Any, ...],
+    recent_hours: int,
+    preset_drift_lookback: int,
+    preset_tags_path: Path,
+) -> _CachedSummary:
+    summary_payload = ledger.read_summary(path)
+    if not summary_payload:
+        return _CachedSummary(signature, None, 0.0, [], {}, [])
+
+    total_runs, runs_with_matches, avg_duration, avg_density, last_ingest = _resolve_match_stats(summary_payload)
+    preset_drift = ledger.compute_preset_drift_from_summary(
+        path,
+        lookback=preset_drift_lookback,
+        preset_tags_path=preset_tags_path,
+    )
+    # Time windows end at the ingest that wrote the ledger, so the result is
+    # stable for as long as the cache entry is.
+    preset_drift_windows = ledger.compute_preset_drift_windows(
+        path,
+        preset_tags_path=preset_tags_path,
+        now=_safe_datetime(summary_payload.get("generated_at")),
+    )
+    summary = TelemetrySummary(
+        total_runs=total_runs,
+        runs_last_24h=0,
+        runs_with_matches=runs_with_matches,
+        avg_duration_ms=avg_duration,
+        avg_match_density=avg_density,
+        last_ingest_at=last_ingest,
+        top_patterns=list(summary_payload.get("top_patterns", []) or []),
+    )
+    return _CachedSummary(
+        signature=signature,
+        summary=summary,
+        match_rate=(runs_with_matches / total_runs) if total_runs else 0.0,
+        preset_drift=preset_drift,
+        preset_drift_windows=preset_drift_windows,
+        recent_timestamps=_load_recent_timestamps(path, recent_hours=recent_hours),
+    )
+
+
 def get_search_telemetry_summary(
     db_path: Path | str | None = None,
     *,
@@ -84,9 +161,31 @@ def get_search_telemetry_summary(
     preset_drift_lookback: int = 50,
     preset_tags_path: Path | str | None = None,
 ) -> dict[str, Any]:
+    """Return the Ops Deck telemetry summary, served from memory between ingests.
+
+    The parsed ledger, preset drift and recent-run timestamps are cached per
+    ledger path and invalidated when the ledger's mtime/size or the preset
+    tags file's mtime changes.
+    """
+
     path = _resolve_ledger_path(db_path)
-    summary_payload = ledger.read_summary(path)
-    if not summary_payload:
+    tags_path = Path(preset_tags_path or DEFAULT_PRESET_TAGS)
+    key = (str(path), recent_hours, preset_drift_lookback, str(tags_path))
+    signature = (_file_signature(path), _file_signature(tags_path))
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+    if cached is None or cached.signature != signature:
+        cached = _load_summary(
+            path,
+            signature=signature,
+            recent_hours=recent_hours,
+            preset_drift_lookback=preset_drift_lookback,
+            preset_tags_path=tags_path,
+        )
+        with _summary_cache_lock:
+            _summary_cache[key] = cached
+
+    if cached.summary is None:
         return {
             "total_runs": 0,
             "runs_last_24h": 0,
@@ -97,28 +196,22 @@ def get_search_telemetry_summary(
             "match_rate": 0.0,
             "top_patterns": [],
             "preset_drift": [],
+            "preset_drift_windows": {},
         }
 
-    total_runs, runs_with_matches, avg_duration, avg_density, last_ingest = _resolve_match_stats(summary_payload)
-    runs_payload = summary_payload.get("runs", []) if isinstance(summary_payload, dict) else []
-    runs_last_24h = _count_recent_runs(runs_payload if isinstance(runs_payload, list) else [], recent_hours=recent_hours)
-    top_patterns = list(summary_payload.get("top_patterns", []) or [])[:top_n]
-    preset_tags_candidate = preset_tags_path or DEFAULT_PRESET_TAGS
-    preset_drift = ledger.compute_preset_drift_from_summary(
-        path,
-        lookback=preset_drift_lookback,
-        preset_tags_path=preset_tags_candidate,
-    )
-
-    summary = TelemetrySummary(
-        total_runs=total_runs,
-        runs_last_24h=runs_last_24h,
-        runs_with_matches=runs_with_matches,
-        avg_duration_ms=avg_duration,
-        avg_match_density=avg_density,
-        last_ingest_at=last_ingest,
-        top_patterns=top_patterns,
+    summary = replace(
+        cached.summary,
+        runs_last_24h=_count_recent_runs(cached.recent_timestamps, recent_hours=recent_hours),
+        top_patterns=cached.summary.top_patterns[:top_n],
     )
-    summary_dict = summary.to_dict(match_rate=(runs_with_matches / total_runs) if total_runs else 0.0)
-    summary_dict["preset_drift"] = preset_drift
+    summary_dict = summary.to_dict(match_rate=cached.match_rate)
+    summary_dict["preset_drift"] = list(cached.preset_drift)
+    summary_dict["preset_drift_windows"] = {label: list(entries) for label, entries in cached.preset_drift_windows.items()}
     return summary_dict
+
+
+def reset_search_telemetry_cache() -> None:
+    """Drop cached ledger summaries (primarily for tests)."""
+
+    with _summary_cache_lock:
+        _summary_cache.clear()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+"""Coalesce concurrent calls that share a key into one in-flight task."""
+# @tag:backend,services,llm
+
+# --- Imports -----------------------------------------------------------------
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    coalesced: int = 0
+    timeouts: int = 0
+    abandoned: int = 0
+
+
+@dataclass
+class _Flight(Generic[T]):
+    task: asyncio.Task[T]
+    waiters: int = 0
+    timed_out: bool = False
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one ``fn()`` per key at a time; concurrent callers share its result.
+
+    The first caller for a key starts the flight; callers arriving before it
+    finishes wait on the same task and get the same value or exception.
+
+    - Timeout: a flight still running after ``timeout`` seconds (the
+      starting caller's, or the group default) is cancelled and every waiter
+      gets :class:`asyncio.TimeoutError`.
+    - Cancellation: a cancelled waiter only stops waiting. When the last
+      waiter leaves, the flight itself is cancelled so nobody pays for an
+      answer no one will read.
+
+    The next call after a flight ends starts a new one; results are not
+    cached here.
+    """
+
+    def __init__(self, *, timeout: float | None = None):
+        self._timeout = timeout
+        self._flights: dict[str, _Flight[T]] = {}
+        self.stats = SingleFlightStats()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]], *, timeout: float | None = None) -> T:
+        self.stats.calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, fn, self._timeout if timeout is None else timeout)
+        else:
+            self.stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.timed_out:
+                raise asyncio.TimeoutError(f"single-flight call for {key!r} timed out") from None
+            raise
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up; stop the shared call and let the next one start fresh.
+                self.stats.abandoned += 1
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _start(self, key: str, fn: Callable[[], Awaitable[T]], timeout: float | None) -> _Flight[T]:
+        flight: _Flight[T] = _Flight(task=asyncio.ensure_future(fn()))
+        self._flights[key] = flight
+        flight.task.add_done_callback(lambda task: self._finished(key, flight))
+        if timeout is not None:
+            loop = asyncio.get_running_loop()
+            handle = loop.call_later(timeout, self._expire, flight)
+            flight.task.add_done_callback(lambda _: handle.cancel())
+        return flight
+
+    def _expire(self, flight: _Flight[T]) -> None:
+        if not flight.task.done():
+            flight.timed_out = True
+            self.stats.timeouts += 1
+            flight.task.cancel()
+
+    def _finished(self, key: str, flight: _Flight[T]) -> None:
+        self._forget(key, flight)
+        if not flight.task.cancelled():
+            flight.task.exception()  # retrieved by the waiters; silences "never retrieved" when none are left
+
+    def _forget(self, key: str, flight: _Flight[T]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+"""In-process fan-out of new tail-log entries to live subscribers."""
+# @tag: backend,services,data
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover - data_store imports this module
+    from .data_store import TailLogRecord
+
+
+class TailLogSubscription:
+    """One subscriber's queue, bound to the event loop that created it.
+
+    A subscriber that falls more than ``max_pending`` entries behind is
+    marked ``overflowed`` instead of queueing without limit; it is expected
+    to ``reset()`` and catch up from the store with a keyset read.
+    """
+
+    def __init__(self, broker: TailLogBroker, max_pending: int):
+        self._broker = broker
+        self._max_pending = max_pending
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[TailLogRecord] = asyncio.Queue()
+        self.overflowed = False
+
+    def _deliver(self, records: Sequence[TailLogRecord]) -> None:
+        # Runs on the subscriber's loop, so it never races ``reset``.
+        if self.overflowed:
+            return
+        if self._queue.qsize() + len(records) > self._max_pending:
+            self.overflowed = True
+            return
+        for record in records:
+            self._queue.put_nowait(record)
+
+    async def get(self, timeout: float) -> TailLogRecord | None:
+        """Next published entry, or ``None`` after ``timeout`` seconds."""
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def reset(self) -> None:
+        """Drop anything queued; the caller re-reads from the store."""
+
+        self.overflowed = False
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def close(self) -> None:
+        self._broker._discard(self)
+
+
+class TailLogBroker:
+    """Publish/subscribe hub that data stores notify after a tail-log write.
+
+    ``publish`` is safe to call from any thread (sync routes run on the
+    threadpool); delivery hops onto each subscriber's loop. Only writes made
+    by this process are seen, so streams still resync from the store for
+    entries written elsewhere.
+    """
+
+    def __init__(self, *, max_pending: int = 512):
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._subscribers: set[TailLogSubscription] = set()
+
+    def subscribe(self) -> TailLogSubscription:
+        subscription = TailLogSubscription(self, self._max_pending)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _discard(self, subscription: TailLogSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, records: Sequence[TailLogRecord]) -> None:
+        if not records or not self._subscribers:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        batch = tuple(records)
+        for subscription in subscribers:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._deliver, batch)
+            except RuntimeError:  # subscriber's loop already closed
+                self._discard(subscription)
+
+
+# --- Dependency helper ----------------------------------------------------------
+_tail_log_broker = TailLogBroker()
+
+
+def get_tail_log_broker() -> TailLogBroker:
+    return _tail_log_broker
+
+
+def publish_tail_log(records: Sequence[TailLogRecord]) -> None:
+    """Notify live ``/api/tail-log/stream`` subscribers in this process."""
+
+    _tail_log_broker.publish(records)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+"""Server-sent events for ``GET /api/tail-log/stream``."""
+# @tag: backend,services,data
+
+import asyncio
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+from ..schemas import TailLogEntryRead
+from .async_data_store import AsyncBaseDataStore
+from .data_store import PageCursor, TailLogRecord, _as_utc
+from .tail_log_broker import TailLogBroker
+
+RECONNECT_DELAY_MS = 2000
+
+
+def _key(record: TailLogRecord) -> tuple[datetime, str]:
+    return _as_utc(record.created_at), record.id
+
+
+def format_event(record: TailLogRecord, cursor: PageCursor | None = None) -> str:
+    """One SSE frame; the id is the keyset cursor a reconnect resumes from.
+
+    ``cursor`` is the newest position sent so far, which a late-committed
+    ``record`` may sit behind; it defaults to the record's own position.
+    """
+
+    data = TailLogEntryRead.model_validate(asdict(record)).model_dump_json()
+    event_id = (cursor or PageCursor.after(record)).encode()
+    return f"id: {event_id}\nevent: tail-log\ndata: {data}\n\n"
+
+
+async def entries_after(
+    store: AsyncBaseDataStore,
+    cursor: PageCursor | None,
+    *,
+    backlog: int = 1000,
+    page_size: int = 200,
+) -> list[TailLogRecord]:
+    """Entries newer than ``cursor``, oldest first, capped to the newest ``backlog``.
+
+    Keyset pages bounded below by the cursor's timestamp, so a resume only
+    reads what it missed.
+    """
+
+    since = cursor.timestamp if cursor is not None else None
+    newer: list[TailLogRecord] = []
+    page_cursor: PageCursor | None = None
+    while len(newer) < backlog:
+        page = await store.list_tail_log(page_size, cursor=page_cursor, since=since)
+        for record in page:
+            if cursor is None or _key(record) > (cursor.timestamp, cursor.id):
+                newer.append(record)
+        if len(page) < page_size:
+            break
+        page_cursor = PageCursor.after(page[-1])
+    return newer[:backlog][::-1]
+
+
+def _lag_cursor(cursor: PageCursor, lag: float) -> PageCursor:
+    # Ids are never empty, so every entry at the lowered timestamp sorts after "".
+    return PageCursor(cursor.timestamp - timedelta(seconds=lag), "")
+
+
+async def tail_log_events(
+    store: AsyncBaseDataStore,
+    broker: TailLogBroker,
+    *,
+    cursor: PageCursor | None = None,
+    heartbeat: float = 15.0,
+    resync: float = 30.0,
+    lag: float = 10.0,
+) -> AsyncIterator[str]:
+    """Yield SSE frames: missed entries after ``cursor``, then live ones.
+
+    Live entries come from ``broker`` with no database reads. Every
+    ``resync`` seconds (0 disables it) a keyset read picks up writes made by
+    other processes; the same read recovers a subscriber that overflowed its
+    queue. Idle streams get a comment line every ``heartbeat`` seconds so
+    proxies keep the connection open.
+
+    A writer stamps ``created_at`` before it commits, so an entry can become
+    visible after newer ones were sent. Reads therefore start ``lag``
+    seconds before the newest sent entry and skip the ids already sent in
+    that window, instead of cutting off at the cursor.
+    """
+
+    subscription = broker.subscribe()
+    # Ids sent (or present before the stream started) within ``lag`` of ``cursor``.
+    seen: dict[str, datetime] = {}
+
+    def unseen(records: list[TailLogRecord]) -> list[TailLogRecord]:
+        nonlocal cursor
+        fresh = []
+        for record in records:
+            if record.id in seen:
+                continue
+            key = _key(record)
+            seen[record.id] = key[0]
+            if cursor is None or key > (cursor.timestamp, cursor.id):
+                cursor = PageCursor(*key)
+            fresh.append(record)
+        if cursor is not None:
+            floor = cursor.timestamp - timedelta(seconds=lag)
+            for record_id in [record_id for record_id, stamp in seen.items() if stamp < floor]:
+                del seen[record_id]
+        return fresh
+
+    try:
+        start = cursor
+        if start is None:
+            newest = await store.list_tail_log(1)
+            start = PageCursor.after(newest[0]) if newest else None
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        if start is not None:
+            missed = []
+            for record in await entries_after(store, _lag_cursor(start, lag)):
+                if _key(record) <= (start.timestamp, start.id):
+                    seen[record.id] = _as_utc(record.created_at)  # the client has it, or it is history
+                else:
+                    missed.append(record)
+            cursor = start
+            for record in unseen(missed):
+                yield format_event(record, cursor)
+
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        next_resync = loop.time() + resync if resync else None
+        while True:
+            wait = heartbeat - (loop.time() - last_sent)
+            if next_resync is not None:
+                wait = min(wait, next_resync - loop.time())
+            record = await subscription.get(max(wait, 0.0))
+
+            if subscription.overflowed or (next_resync is not None and loop.time() >= next_resync):
+                subscription.reset()
+                records = await entries_after(store, _lag_cursor(cursor, lag) if cursor is not None else None)
+                if next_resync is not None:
+                    next_resync = loop.time() + resync
+            elif record is not None:
+                records = [record]
+            else:
+                records = []
+
+            for record in unseen(records):
+                last_sent = loop.time()
+                yield format_event(record, cursor)
+
+            if loop.time() - last_sent >= heartbeat:
+                last_sent = loop.time()
+                yield ": keep-alive\n\n"
+    finally:
+        subscription.close()
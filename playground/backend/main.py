@@ -15,7 +15,11 @@ from app.api.elements import router as elements_router
 from app.api.routes import router as chat_router
 from app.api.playgrounds import router as playgrounds_router
 from app.config import get_settings
-from app.database import Base, get_engine
+from app.database import get_engine
+from app.services.async_data_store import close_async_data_store
+from app.services.data_store import flush_json_stores
+from app.services.interaction_recorder import close_interaction_recorder
+from app.services.llm_client import close_llm_client, get_llm_client
 
 # --- Settings & metadata ------------------------------------------------------
 settings = get_settings()
@@ -25,9 +29,13 @@ settings = get_settings()
 async def lifespan(_: FastAPI):
     """Provision application resources for the FastAPI lifespan."""
 
-    engine = get_engine()
-    Base.metadata.create_all(bind=engine)
+    get_engine()  # creates and migrates the schema
+    get_llm_client()  # open the pooled HTTP client before the first chat
     yield
+    await close_llm_client()
+    await close_interaction_recorder()
+    await close_async_data_store()
+    flush_json_stores()
 
 
 app = FastAPI(title="Playground FastAPI", version="0.1.0", lifespan=lifespan)
@@ -40,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # list paging from a UI on another origin
 )
 
 
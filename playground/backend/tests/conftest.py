@@ -85,6 +85,10 @@ class StubLLM:
             latency_ms=42,
         )
 
+    async def generate_stream(self, prompt: str):
+        for text in ("stubbed", "::", prompt):
+            yield llm_client.LLMChunk(text=text, model_name="stub-model")
+
 
 class StubNotebookRunner:
     def __init__(self) -> None:
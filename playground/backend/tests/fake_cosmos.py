@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+"""In-memory stand-in for the azure-cosmos database/container clients."""
+# @tag:backend,tests
+
+import re
+from typing import Any, Callable, Iterator
+
+_QUERY = re.compile(
+    r"SELECT (?P<select>VALUE COUNT\(1\)|\*) FROM c"
+    r"(?: WHERE (?P<where>.+?))?"
+    r"(?: ORDER BY (?P<order>.+?))?"
+    r"(?: OFFSET (?P<offset>\d+) LIMIT (?P<limit>@\w+|\d+))?$"
+)
+
+
+_DEFAULT_INDEXING_POLICY = {"indexingMode": "consistent", "automatic": True, "includedPaths": [{"path": "/*"}]}
+
+
+def _where_to_python(where: str) -> str:
+    expression = re.sub(r"c\.(\w+)", r"doc.get('\1')", where)
+    expression = re.sub(r"@(\w+)", r"params['@\1']", expression)
+    expression = re.sub(r"(?<![<>=!])=(?!=)", "==", expression)
+    return expression.replace(" AND ", " and ").replace(" OR ", " or ")
+
+
+ResponseHook = Callable[[dict[str, str], Any], None]
+
+
+def _charge(response_hook: ResponseHook | None, request_charge: float, result: Any) -> None:
+    # Only the call's own hook sees its charge; there are no shared last-response headers to race on.
+    if response_hook is not None:
+        response_hook({"x-ms-request-charge": str(request_charge)}, result)
+
+
+class FakeQueryIterable:
+    """Mimics ``ItemPaged``: iterate items or walk ``by_page()``."""
+
+    def __init__(self, rows: list[Any], page_size: int, response_hook: ResponseHook | None = None):
+        self._rows = rows
+        self._page_size = page_size
+        self._response_hook = response_hook
+
+    def by_page(self) -> Iterator[list[Any]]:
+        for offset in range(0, max(len(self._rows), 1), self._page_size):
+            page = self._rows[offset : offset + self._page_size]
+            _charge(self._response_hook, 1.0 + 0.1 * len(page), page)
+            yield page
+
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.by_page():
+            yield from page
+
+
+class FakeContainer:
+    """Documents grouped by partition key value, with a tiny SQL evaluator.
+
+    Supports the query shapes the data store emits. Records every query as
+    ``(sql, partition_key)`` so tests can assert which partitions were read.
+    Like Cosmos, an ORDER BY on several properties needs a composite index.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        partition_path: str,
+        *,
+        page_size: int = 100,
+        indexing_policy: dict[str, Any] | None = None,
+    ):
+        self.id = name
+        self.partition_path = partition_path
+        self.indexing_policy = indexing_policy or dict(_DEFAULT_INDEXING_POLICY)
+        self.page_size = page_size
+        self.partitions: dict[Any, dict[str, dict[str, Any]]] = {}
+        self.queries: list[tuple[str, Any]] = []
+        self.batches: list[tuple[Any, int]] = []
+
+    def _partition_of(self, doc: dict[str, Any]) -> Any:
+        return doc[self.partition_path.lstrip("/")]
+
+    def read(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "partitionKey": {"paths": [self.partition_path], "kind": "Hash"},
+            "indexingPolicy": self.indexing_policy,
+        }
+
+    def _check_composite_index(self, order: str) -> None:
+        terms = [term.strip().partition(" ") for term in order.split(",")]
+        if len(terms) < 2:
+            return
+        wanted = [
+            {"path": "/" + field[2:], "order": "descending" if direction.upper() == "DESC" else "ascending"}
+            for field, _, direction in terms
+        ]
+        flipped = [
+            {"path": term["path"], "order": "ascending" if term["order"] == "descending" else "descending"}
+            for term in wanted
+        ]
+        composites = self.indexing_policy.get("compositeIndexes", [])
+        if wanted not in composites and flipped not in composites:
+            raise ValueError("The order by query does not have a corresponding composite index")
+
+    def upsert_item(self, body: dict[str, Any], *, response_hook: ResponseHook | None = None, **_: Any) -> dict[str, Any]:
+        self.partitions.setdefault(self._partition_of(body), {})[body["id"]] = dict(body)
+        _charge(response_hook, 10.0, body)
+        return body
+
+    def execute_item_batch(
+        self,
+        batch_operations: list[tuple[str, tuple[Any, ...]]],
+        partition_key: Any,
+        *,
+        response_hook: ResponseHook | None = None,
+        **_: Any,
+    ):
+        if len(batch_operations) > 100:
+            raise ValueError("Transactional batches are limited to 100 operations")
+        for operation, (body,) in batch_operations:
+            assert operation == "upsert"
+            if self._partition_of(body) != partition_key:
+                raise ValueError("Batch operations must target the batch's partition key")
+            self.partitions.setdefault(partition_key, {})[body["id"]] = dict(body)
+        self.batches.append((partition_key, len(batch_operations)))
+        results = [{"statusCode": 200} for _ in batch_operations]
+        _charge(response_hook, 5.0 * len(batch_operations), results)
+        return results
+
+    def query_items(
+        self,
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        *,
+        partition_key: Any = None,
+        enable_cross_partition_query: bool = False,
+        response_hook: ResponseHook | None = None,
+        **_: Any,
+    ) -> FakeQueryIterable:
+        if partition_key is None and not enable_cross_partition_query and len(self.partitions) > 1:
+            raise ValueError("Cross-partition query requires enable_cross_partition_query=True")
+        self.queries.append((query, partition_key))
+        match = _QUERY.match(query)
+        if match is None:
+            raise ValueError(f"Unsupported query in fake: {query}")
+
+        params = {item["name"]: item["value"] for item in parameters or []}
+        if partition_key is not None:
+            docs = list(self.partitions.get(partition_key, {}).values())
+        else:
+            docs = [doc for partition in self.partitions.values() for doc in partition.values()]
+        if match["where"]:
+            expression = _where_to_python(match["where"])
+            docs = [doc for doc in docs if eval(expression, {}, {"doc": doc, "params": params})]  # noqa: S307
+        if match["select"].startswith("VALUE COUNT"):
+            return FakeQueryIterable([len(docs)], self.page_size, response_hook)
+        if match["order"]:
+            self._check_composite_index(match["order"])
+            for term in reversed(match["order"].split(",")):
+                field, _, direction = term.strip().partition(" ")
+                docs.sort(key=lambda doc: doc.get(field[2:]), reverse=direction.upper() == "DESC")
+        if match["limit"]:
+            limit = params[match["limit"]] if match["limit"].startswith("@") else int(match["limit"])
+            docs = docs[int(match["offset"]) : int(match["offset"]) + limit]
+        return FakeQueryIterable(docs, self.page_size, response_hook)
+
+
+class FakeDatabase:
+    def __init__(self) -> None:
+        self.containers: dict[str, FakeContainer] = {}
+        self.create_calls = 0
+
+    def create_container_if_not_exists(
+        self, id: str, partition_key: Any, indexing_policy: dict[str, Any] | None = None, **_: Any
+    ) -> FakeContainer:
+        self.create_calls += 1
+        assert indexing_policy and indexing_policy.get("compositeIndexes"), "list queries need composite indexes"
+        if id not in self.containers:
+            self.containers[id] = FakeContainer(id, partition_key["paths"][0], indexing_policy=indexing_policy)
+        return self.containers[id]
+
+    def replace_container(
+        self, container: FakeContainer, partition_key: Any, indexing_policy: dict[str, Any] | None = None, **_: Any
+    ) -> FakeContainer:
+        assert partition_key["paths"] == [container.partition_path], "the partition key cannot change"
+        container.indexing_policy = indexing_policy or dict(_DEFAULT_INDEXING_POLICY)
+        return container
+
+    def get_container_client(self, name: str) -> FakeContainer:
+        return self.containers[name]
+
+
+class AsyncFakeDatabase:
+    """``azure.cosmos.aio`` flavour of :class:`FakeDatabase` for container setup."""
+
+    def __init__(self, database: FakeDatabase | None = None) -> None:
+        self.sync = database or FakeDatabase()
+
+    async def create_container_if_not_exists(self, **kwargs: Any) -> AsyncFakeContainer:
+        return AsyncFakeContainer(self.sync.create_container_if_not_exists(**kwargs))
+
+    async def replace_container(self, container: AsyncFakeContainer, **kwargs: Any) -> AsyncFakeContainer:
+        return AsyncFakeContainer(self.sync.replace_container(container.sync, **kwargs))
+
+    def get_container_client(self, name: str) -> AsyncFakeContainer:
+        return AsyncFakeContainer(self.sync.get_container_client(name))
+
+
+class AsyncFakeContainer:
+    def __init__(self, container: FakeContainer) -> None:
+        self.sync = container
+
+    async def read(self) -> dict[str, Any]:
+        return self.sync.read()
@@ -52,3 +52,25 @@ def test_tail_log_flow(client: TestClient):
     assert len(history_data) == 2
     assert history_data[0]["message"].startswith("deck")
     assert history_data[1]["message"].startswith("boot")
+
+
+def test_tail_log_pages_with_next_cursor(client: TestClient):
+    """Full pages hand back ``X-Next-Cursor``; following it walks older entries."""
+
+    for index in range(5):
+        client.post("/api/tail-log", json={"message": f"entry {index}", "source": "test"})
+
+    first = client.get("/api/tail-log", params={"limit": 2}, headers={"Origin": "http://ui.example"})
+    assert [entry["message"] for entry in first.json()] == ["entry 4", "entry 3"]
+    # A UI served from another origin may read the header.
+    assert "X-Next-Cursor" in first.headers["Access-Control-Expose-Headers"]
+
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get("/api/tail-log", params={"limit": 2, "cursor": cursor})
+    assert [entry["message"] for entry in second.json()] == ["entry 2", "entry 1"]
+
+    last = client.get("/api/tail-log", params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]})
+    assert [entry["message"] for entry in last.json()] == ["entry 0"]
+    assert "X-Next-Cursor" not in last.headers
+
+    assert client.get("/api/tail-log", params={"cursor": "not-a-cursor"}).status_code == 400
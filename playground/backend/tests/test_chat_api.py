@@ -4,12 +4,20 @@
 
 from __future__ import annotations
 
+import json
+
+import httpx
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import sessionmaker
 
+from app.config import get_settings
 from app.database import get_engine
 from app.models import Interaction
 from app.schemas import ChatPayload
+from app.services import llm_client
+from app.services.interaction_recorder import get_interaction_recorder
+from app.services.llm_cache import LLMResponseCache, MemoryCacheTier
+from app.services.llm_limiter import LLMRateLimiter
 
 
 def test_chat_endpoint_persists_payload(client: TestClient):
@@ -54,3 +62,84 @@ def test_chat_endpoint_requires_prompt_text(client: TestClient):
     response = client.post("/api/chat", json=payload)
 
     assert response.status_code == 422
+
+
+def test_chat_endpoint_write_behind_commits_after_flush(monkeypatch, client: TestClient):
+    """Write-behind mode acknowledges with the final id and persists once the recorder drains."""
+    monkeypatch.setattr(get_settings(), "interaction_write_mode", "write_behind")
+    payload = {"final_prompt_text": "Deferred", "total_duration_ms": 5}
+
+    ids = [client.post("/api/chat", json=payload).json()["interaction_id"] for _ in range(3)]
+    client.portal.call(get_interaction_recorder().flush)
+
+    engine = get_engine()
+    with sessionmaker(bind=engine)() as session:
+        assert sorted(row.id for row in session.query(Interaction).all()) == sorted(ids)
+
+
+def test_chat_stream_forwards_tokens_then_persists(client: TestClient):
+    """NDJSON token frames arrive before the done frame; the stored row carries time-to-first-token."""
+    payload = {"final_prompt_text": "Stream me", "total_duration_ms": 5}
+
+    with client.stream("POST", "/api/chat/stream", json=payload) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        frames = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert [frame["type"] for frame in frames] == ["token", "token", "token", "done"]
+    assert "".join(frame["text"] for frame in frames[:-1]) == "stubbed::Stream me"
+    done = frames[-1]
+    assert done["ai_response_text"] == "stubbed::Stream me"
+    assert done["model_name"] == "stub-model"
+    assert 0 <= done["first_token_ms"] <= done["latency_ms"]
+
+    engine = get_engine()
+    with sessionmaker(bind=engine)() as session:
+        row = session.get(Interaction, done["interaction_id"])
+        assert row.ai_response_text == "stubbed::Stream me"
+        assert row.first_token_ms == done["first_token_ms"]
+
+
+def test_chat_reports_cache_hits(client: TestClient):
+    """Repeated prompts are answered from the response cache and flagged as cached."""
+    llm_client._llm_client = llm_client.CachedLLMClient(  # type: ignore[attr-defined]
+        llm_client._llm_client,  # type: ignore[attr-defined]
+        LLMResponseCache(memory=MemoryCacheTier(16)),
+        provider="stub",
+        model="stub-model",
+        params={},
+    )
+    payload = {"final_prompt_text": "Cache me", "total_duration_ms": 5}
+
+    first = client.post("/api/chat", json=payload).json()
+    second = client.post("/api/chat", json=payload).json()
+
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["ai_response_text"] == first["ai_response_text"]
+    assert second["interaction_id"] != first["interaction_id"]
+    stats = client.get("/api/llm/cache").json()
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"], stats["memory_entries"]) == (1, 1, 1)
+
+
+def test_chat_passes_provider_throttling_on_as_429(client: TestClient):
+    """A 429 that outlasts the limiter's retries reaches the caller with its Retry-After."""
+
+    class ThrottledLLM:
+        async def generate(self, prompt: str):
+            request = httpx.Request("POST", "http://llm.local/v1/chat/completions")
+            response = httpx.Response(429, headers={"Retry-After": "1.5"}, request=request)
+            raise httpx.HTTPStatusError("HTTP 429", request=request, response=response)
+
+    llm_client._llm_client = llm_client.RateLimitedLLMClient(  # type: ignore[attr-defined]
+        ThrottledLLM(),
+        LLMRateLimiter(max_retries=0),
+        max_tokens=16,
+    )
+
+    response = client.post("/api/chat", json={"final_prompt_text": "Busy?", "total_duration_ms": 5})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    stats = client.get("/api/llm/limiter").json()
+    assert (stats["enabled"], stats["throttled"], stats["failures"]) == (True, 1, 1)
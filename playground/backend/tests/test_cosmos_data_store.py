@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+"""Cosmos data store partitioning and RU capture against an in-memory container fake."""
+# @tag:backend,tests,data
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fake_cosmos import AsyncFakeDatabase, FakeContainer, FakeDatabase
+
+from app.config import Settings
+from app.schemas import ArtifactCreate, TailLogEntryCreate
+from app.services import async_data_store, data_store
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(
+        COSMOS_ENDPOINT="https://example.documents.azure.com",
+        COSMOS_DATABASE="playground",
+        **overrides,
+    )
+
+
+def _interactions(count: int, *, start: datetime, step: timedelta):
+    return (
+        {
+            "id": f"{index:03d}",
+            "created_at": start + step * index,
+            "prompt": f"prompt {index}",
+            "metadata": {},
+            "llm_text": "ok",
+            "model_name": "stub",
+        }
+        for index in range(count)
+    )
+
+
+def test_newest_reads_hit_todays_partition_after_a_check_for_later_days() -> None:
+    database = FakeDatabase()
+    store = data_store.CosmosDataStore(database, settings=_settings())
+    for index in range(5):
+        store.create_tail_log_entry(TailLogEntryCreate(message=f"entry {index}", source="test"))
+
+    container = database.containers["playground-tail-log"]
+    today = datetime.now(timezone.utc).date().isoformat()
+    assert list(container.partitions) == [today]
+
+    container.queries.clear()
+    assert [entry.message for entry in store.list_tail_log(3)] == ["entry 4", "entry 3", "entry 2"]
+    assert [partition for _, partition in container.queries] == [None, today]
+
+    stats = store.metrics.snapshot()
+    assert stats["playground-tail-log.upsert"].calls == 5
+    assert stats["playground-tail-log.upsert"].request_charge == pytest.approx(50.0)
+    assert stats["playground-tail-log.query"].calls == 2
+    assert stats["playground-tail-log.query"].elapsed_ms >= 0
+    # Containers are resolved once, on first use.
+    assert database.create_calls == 1
+
+
+def test_pages_walk_day_partitions_then_fall_back_to_one_cross_partition_query() -> None:
+    database = FakeDatabase()
+    store = data_store.CosmosDataStore(database, settings=_settings(COSMOS_PARTITION_LOOKBACK_DAYS=3))
+    start = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=5)
+    store.record_interactions_bulk(_interactions(30, start=start, step=timedelta(hours=4)))
+
+    container = database.containers["playground-interactions"]
+    assert len(container.partitions) == 6
+    assert all(size <= 100 for _, size in container.batches)
+
+    container.queries.clear()
+    pages = list(data_store.iter_pages(store.list_interactions, page_size=7))
+    assert [record.id for page in pages for record in page] == [f"{index:03d}" for index in reversed(range(30))]
+    # Each page reads recent day buckets directly; only older history needs the fan-out query.
+    assert any(partition is None for _, partition in container.queries)
+    assert sum(partition is not None for _, partition in container.queries) > len(pages)
+
+    window = store.list_interactions(
+        100,
+        since=start + timedelta(days=1),
+        until=start + timedelta(days=2),
+    )
+    assert [record.id for record in window] == [f"{index:03d}" for index in reversed(range(6, 12))]
+
+
+def test_documents_stamped_after_today_are_listed_first() -> None:
+    database = FakeDatabase()
+    store = data_store.CosmosDataStore(database, settings=_settings())
+    now = datetime.now(timezone.utc)
+    store.record_interactions_bulk(_interactions(3, start=now - timedelta(days=1), step=timedelta(days=1)))
+
+    container = database.containers["playground-interactions"]
+    assert len(container.partitions) == 3
+    assert [record.id for record in store.list_interactions(10)] == ["002", "001", "000"]
+    page = store.list_interactions(1)
+    assert [record.id for record in store.list_interactions(5, cursor=data_store.PageCursor.after(page[-1]))] == [
+        "001",
+        "000",
+    ]
+
+
+def test_tenant_partitioning_reads_a_single_partition() -> None:
+    database = FakeDatabase()
+    store = data_store.CosmosDataStore(
+        database,
+        settings=_settings(COSMOS_PARTITION_STRATEGY="tenant", COSMOS_TENANT="lab-a"),
+    )
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    store.record_interactions_bulk(_interactions(10, start=start, step=timedelta(days=1)))
+
+    container = database.containers["playground-interactions"]
+    container.queries.clear()
+    assert [record.id for record in store.list_interactions(4)] == ["009", "008", "007", "006"]
+    assert [partition for _, partition in container.queries] == ["lab-a"]
+    assert store.count_interactions() == 10
+
+
+def test_containers_partitioned_on_id_keep_cross_partition_queries() -> None:
+    database = FakeDatabase()
+    database.containers["playground-tail-log"] = FakeContainer("playground-tail-log", "/id")
+    store = data_store.CosmosDataStore(database, settings=_settings())
+
+    store.create_tail_log_entries_bulk([TailLogEntryCreate(message=f"m{index}", source="t") for index in range(3)])
+    container = database.containers["playground-tail-log"]
+
+    assert len(container.partitions) == 3
+    assert container.batches == []
+    assert [entry.message for entry in store.list_tail_log(2)] == ["m2", "m1"]
+    assert [partition for _, partition in container.queries] == [None]
+
+
+def test_request_charges_come_from_each_calls_own_response() -> None:
+    database = FakeDatabase()
+    database.containers["playground-tail-log"] = FakeContainer("playground-tail-log", "/id")
+    store = data_store.CosmosDataStore(database, settings=_settings())
+
+    # Concurrent upserts on the thread pool; each one's charge reaches only its own hook.
+    store.create_tail_log_entries_bulk([TailLogEntryCreate(message=f"m{index}", source="t") for index in range(40)])
+    store.record_interactions_bulk(_interactions(30, start=datetime.now(timezone.utc), step=timedelta(0)))
+    store.list_interactions(10)
+
+    stats = store.metrics.snapshot()
+    assert stats["playground-tail-log.upsert"].calls == 40
+    assert stats["playground-tail-log.upsert"].request_charge == pytest.approx(400.0)
+    assert stats["playground-interactions.batch"].request_charge == pytest.approx(150.0)
+    assert stats["playground-interactions.query"].request_charge == pytest.approx(1.0 + 2.0)
+
+
+def test_containers_get_the_composite_index_list_queries_order_by() -> None:
+    database = FakeDatabase()
+    legacy_policy = {"indexingMode": "consistent", "excludedPaths": [{"path": "/body/?"}]}
+    database.containers["playground-tail-log"] = FakeContainer(
+        "playground-tail-log", "/pk", indexing_policy=legacy_policy
+    )
+    store = data_store.CosmosDataStore(database, settings=_settings())
+    store.create_artifact(ArtifactCreate(title="note", body="body", owner="user", category="insight"))
+    store.create_tail_log_entry(TailLogEntryCreate(message="entry", source="t"))
+
+    def composites(name: str) -> list:
+        return database.containers[name].indexing_policy["compositeIndexes"]
+
+    assert composites("playground-artifacts") == [
+        [{"path": "/updated_at", "order": "descending"}, {"path": "/id", "order": "descending"}]
+    ]
+    # Existing containers gain the index and keep the rest of their policy.
+    assert composites("playground-tail-log") == [
+        [{"path": "/created_at", "order": "descending"}, {"path": "/id", "order": "descending"}]
+    ]
+    assert database.containers["playground-tail-log"].indexing_policy["excludedPaths"] == [{"path": "/body/?"}]
+    assert [artifact.title for artifact in store.list_artifacts(5)] == ["note"]
+    assert [entry.message for entry in store.list_tail_log(5)] == ["entry"]
+
+    with pytest.raises(ValueError, match="composite index"):
+        FakeContainer("bare", "/pk").query_items("SELECT * FROM c ORDER BY c.created_at DESC, c.id DESC")
+
+
+def test_async_store_creates_and_upgrades_containers_with_the_same_policy() -> None:
+    database = AsyncFakeDatabase()
+    database.sync.containers["playground-interactions"] = FakeContainer("playground-interactions", "/id")
+    store = async_data_store.AsyncCosmosDataStore(database, settings=_settings())
+
+    async def scenario() -> None:
+        for name in ("playground-artifacts", "playground-interactions"):
+            await store._container(name)
+
+    asyncio.run(scenario())
+    sync_options = data_store._cosmos_container_options(_settings(), "playground-artifacts")
+    containers = database.sync.containers
+    assert containers["playground-artifacts"].indexing_policy == sync_options["indexing_policy"]
+    assert containers["playground-interactions"].indexing_policy["compositeIndexes"] == [
+        [{"path": "/created_at", "order": "descending"}, {"path": "/id", "order": "descending"}]
+    ]
+
+
+def test_cosmos_provider_reuses_one_store_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    database = FakeDatabase()
+    connects: list[Settings] = []
+
+    class FakeClient:
+        def get_database_client(self, name: str) -> FakeDatabase:
+            return database
+
+    def fake_connect(settings: Settings) -> FakeClient:
+        connects.append(settings)
+        return FakeClient()
+
+    monkeypatch.setattr(data_store.CosmosDataStore, "_connect", staticmethod(fake_connect))
+    settings = _settings(DATABASE_PROVIDER="cosmos")
+    data_store.reset_data_stores()
+    try:
+        first = data_store._build_data_store(settings, None)
+        second = data_store._build_data_store(settings, None)
+    finally:
+        data_store.reset_data_stores()
+
+    assert first is second
+    assert len(connects) == 1
+    assert database.create_calls == 0
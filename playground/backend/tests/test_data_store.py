@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+"""Unit tests for the file-backed data store providers."""
+# @tag:backend,tests,data
+
+# --- Imports -----------------------------------------------------------------
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import models  # noqa: F401 - registers tables on Base.metadata
+from app.database import Base
+from app.schemas import ArtifactCreate, ArtifactImport, TailLogEntryCreate, TailLogEntryImport
+from app.services import async_data_store, data_store
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stores():
+    data_store.reset_data_stores()
+    yield
+    data_store.reset_data_stores()
+
+
+# --- JSON snapshot --------------------------------------------------------------
+def test_json_store_serves_reads_from_memory_and_flushes_behind(tmp_path: Path) -> None:
+    path = tmp_path / "playground_store.json"
+    store = data_store.JsonDataStore(path, flush_delay=60)
+    store.create_tail_log_entry(TailLogEntryCreate(message="queued", source="test"))
+
+    # A second instance shares the in-memory snapshot; the file is untouched until flush.
+    assert data_store.JsonDataStore(path).list_tail_log(5)[0].message == "queued"
+    assert json.loads(path.read_text(encoding="utf-8"))["tail_log"] == []
+
+    store.flush()
+    assert json.loads(path.read_text(encoding="utf-8"))["tail_log"][0]["message"] == "queued"
+
+
+def test_json_store_merges_writes_from_other_processes(tmp_path: Path) -> None:
+    path = tmp_path / "playground_store.json"
+    store = data_store.JsonDataStore(path, flush_delay=60, check_interval=0)
+    store.create_tail_log_entry(TailLogEntryCreate(message="ours", source="test"))
+
+    external_entry = {"id": "ext", "message": "theirs", "source": "cli", "created_at": "2025-11-01T00:00:00+00:00"}
+    external = {"interactions": [], "artifacts": [], "tail_log": [external_entry]}
+    path.write_text(json.dumps(external), encoding="utf-8")
+
+    assert [entry.message for entry in store.list_tail_log(5)] == ["ours", "theirs"]
+    store.flush()
+    assert [entry["message"] for entry in json.loads(path.read_text(encoding="utf-8"))["tail_log"]] == [
+        "ours",
+        "theirs",
+    ]
+
+
+def test_json_store_flush_uses_its_own_temp_file(tmp_path: Path) -> None:
+    path = tmp_path / "playground_store.json"
+    # Another process halfway through its own flush.
+    peers = [tmp_path / "playground_store.tmp", tmp_path / "playground_store.json.peer.tmp"]
+    for peer in peers:
+        peer.write_text('{"tail_log": [', encoding="utf-8")
+    store = data_store.JsonDataStore(path, flush_delay=60)
+    store.create_tail_log_entry(TailLogEntryCreate(message="ours", source="test"))
+
+    store.flush()
+
+    assert json.loads(path.read_text(encoding="utf-8"))["tail_log"][0]["message"] == "ours"
+    assert sorted(tmp_path.glob("*.tmp")) == sorted(peers)
+    assert all(peer.read_text(encoding="utf-8") == '{"tail_log": [' for peer in peers)
+
+
+# --- JSONL segments -------------------------------------------------------------
+def test_segment_store_reads_newest_first_across_rolled_segments(tmp_path: Path) -> None:
+    root = tmp_path / "segments"
+    store = data_store.JsonSegmentDataStore(root, max_segment_bytes=1024, compact_after=50)
+    for index in range(40):
+        store.create_tail_log_entry(TailLogEntryCreate(message=f"event {index:02d}", source="test"))
+
+    assert len(list((root / "tail_log").glob("*.jsonl"))) > 1
+    assert [entry.message for entry in store.list_tail_log(3)] == ["event 39", "event 38", "event 37"]
+
+    # A second process starts from an empty index and sees the same history.
+    data_store.reset_json_segment_logs()
+    other = data_store.JsonSegmentDataStore(root, max_segment_bytes=1024, compact_after=50)
+    other.create_tail_log_entry(TailLogEntryCreate(message="from other", source="test"))
+    assert store.list_tail_log(1)[0].message == "from other"
+    assert len(store.list_tail_log(100)) == 41
+
+
+def test_segment_store_compacts_sealed_segments(tmp_path: Path) -> None:
+    root = tmp_path / "segments"
+    store = data_store.JsonSegmentDataStore(root, max_segment_bytes=1024, compact_after=2)
+    for index in range(60):
+        store.record_interaction(
+            prompt=f"prompt {index}",
+            metadata={"keys": index},
+            llm_text="ok",
+            model_name="stub",
+            latency_ms=index,
+        )
+
+    assert len(list((root / "interactions").glob("*.jsonl"))) <= 3
+    assert store.count_interactions() == 60
+    assert [record.latency_ms for record in store.list_interactions(2)] == [59, 58]
+
+
+def test_segment_store_imports_existing_snapshot(tmp_path: Path) -> None:
+    snapshot_path = tmp_path / "playground_store.json"
+    legacy = data_store.JsonDataStore(snapshot_path)
+    for title in ("first", "second"):
+        legacy.create_artifact(ArtifactCreate(title=title, body="body", owner="user", category="insight"))
+
+    store = data_store.JsonSegmentDataStore(tmp_path / "segments", snapshot_path=snapshot_path)
+
+    assert [artifact.title for artifact in store.list_artifacts(5)] == ["second", "first"]
+    assert json.loads(snapshot_path.read_text(encoding="utf-8"))["artifacts"][0]["title"] == "second"
+
+
+# --- Bulk inserts ---------------------------------------------------------------
+@pytest.fixture(params=["sqlite", "json", "segments"])
+def bulk_store(request, tmp_path: Path):
+    if request.param == "sqlite":
+        engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield data_store.SqliteDataStore(session)
+        engine.dispose()
+    elif request.param == "json":
+        yield data_store.JsonDataStore(tmp_path / "playground_store.json")
+    else:
+        yield data_store.JsonSegmentDataStore(tmp_path / "segments", max_segment_bytes=4096)
+
+
+def test_bulk_inserts_keep_input_order(bulk_store) -> None:
+    interactions = bulk_store.record_interactions_bulk(
+        {"prompt": f"prompt {index}", "metadata": {"i": index}, "llm_text": "ok", "model_name": "stub"}
+        for index in range(500)
+    )
+    bulk_store.create_artifacts_bulk(
+        ArtifactCreate(title=f"note {index}", body="body", owner="user", category="insight") for index in range(3)
+    )
+    bulk_store.create_tail_log_entries_bulk(
+        [TailLogEntryCreate(message=f"backfill {index}", source="test") for index in range(300)]
+    )
+
+    assert bulk_store.count_interactions() == 500
+    assert [record.id for record in bulk_store.list_interactions(2)] == [interactions[-1].id, interactions[-2].id]
+    assert [artifact.title for artifact in bulk_store.list_artifacts(5)] == ["note 2", "note 1", "note 0"]
+    assert [entry.message for entry in bulk_store.list_tail_log(2)] == ["backfill 299", "backfill 298"]
+
+
+def test_keyset_pages_walk_ties_and_time_window(bulk_store) -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    # Five records per second so the id tie-break decides order within a second.
+    bulk_store.record_interactions_bulk(
+        {
+            "id": f"{index:03d}",
+            "created_at": base + timedelta(seconds=index // 5),
+            "prompt": f"prompt {index}",
+            "metadata": {},
+            "llm_text": "ok",
+            "model_name": "stub",
+        }
+        for index in range(50)
+    )
+
+    pages = list(data_store.iter_pages(bulk_store.list_interactions, page_size=7))
+    assert [len(page) for page in pages] == [7, 7, 7, 7, 7, 7, 7, 1]
+    assert [record.id for page in pages for record in page] == [f"{index:03d}" for index in reversed(range(50))]
+
+    window = bulk_store.list_interactions(
+        100, since=base + timedelta(seconds=2), until=base + timedelta(seconds=4)
+    )
+    assert [record.id for record in window] == [f"{index:03d}" for index in reversed(range(10, 20))]
+
+    cursor = data_store.PageCursor.decode(data_store.PageCursor(base + timedelta(seconds=3), "017").encode())
+    after = bulk_store.list_interactions(3, cursor=cursor, since=base + timedelta(seconds=2))
+    assert [record.id for record in after] == ["016", "015", "014"]
+
+
+def test_keyset_pages_follow_timestamps_not_insertion_order(bulk_store) -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    shuffled = [7, 2, 9, 0, 5, 1, 8, 3, 6, 4]
+    for batch in (shuffled[:6], shuffled[6:]):
+        bulk_store.record_interactions_bulk(
+            {
+                "id": f"{index:02d}",
+                "created_at": base + timedelta(seconds=index),
+                "prompt": f"prompt {index}",
+                "metadata": {},
+                "llm_text": "ok",
+                "model_name": "stub",
+            }
+            for index in batch
+        )
+
+    newest_first = [f"{index:02d}" for index in reversed(range(10))]
+    assert [record.id for record in bulk_store.list_interactions(10)] == newest_first
+    pages = list(data_store.iter_pages(bulk_store.list_interactions, page_size=3))
+    assert [record.id for page in pages for record in page] == newest_first
+
+    window = bulk_store.list_interactions(10, since=base + timedelta(seconds=2), until=base + timedelta(seconds=7))
+    assert [record.id for record in window] == ["06", "05", "04", "03", "02"]
+
+
+def test_bulk_backfill_accepts_naive_and_string_timestamps(bulk_store) -> None:
+    def item(record_id: str, created_at) -> dict:
+        return {"id": record_id, "created_at": created_at, "prompt": "p", "llm_text": "ok", "model_name": "stub"}
+
+    records = bulk_store.record_interactions_bulk(
+        [
+            item("late", "2025-03-01T12:00:00"),
+            item("early", datetime(2025, 1, 1)),
+            item("middle", "2025-02-01T00:00:00+00:00"),
+        ]
+    )
+
+    assert all(record.created_at.tzinfo is not None for record in records)
+    listed = bulk_store.list_interactions(10, until=datetime(2025, 3, 1, 12, tzinfo=timezone.utc))
+    assert [record.id for record in listed] == ["middle", "early"]
+
+
+def test_cli_import_round_trips_json_listings(tmp_path: Path) -> None:
+    """``import`` keeps the ids, timestamps and ``first_token_ms`` its ``--json`` listings carry."""
+
+    source = data_store.JsonDataStore(tmp_path / "source.json")
+    stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    source.record_interactions_bulk(
+        [{"created_at": stamp, "prompt": "p", "llm_text": "ok", "model_name": "m", "first_token_ms": 12}]
+    )
+    artifact = ArtifactCreate(title="t", body="b", owner="user", category="insight")
+    source.create_artifacts_bulk([ArtifactImport(**artifact.model_dump(), created_at=stamp)])
+    source.create_tail_log_entries_bulk([TailLogEntryImport(message="old entry", source="test", created_at=stamp)])
+    source.flush()
+
+    def cli(store: Path, *args: str) -> str:
+        env = {**os.environ, "DATABASE_PROVIDER": "json", "JSON_STORE_PATH": str(store), "JSON_STORE_MODE": "snapshot"}
+        command = [sys.executable, str(REPO_ROOT / "scripts" / "playground_store.py"), *args]
+        return subprocess.run(command, capture_output=True, text=True, env=env, check=True).stdout
+
+    for kind in ("interactions", "artifacts", "tail-log"):
+        exported = cli(tmp_path / "source.json", kind, "--json")
+        (tmp_path / f"{kind}.json").write_text(exported, encoding="utf-8")
+        cli(tmp_path / "target.json", "import", kind, str(tmp_path / f"{kind}.json"))
+        assert json.loads(cli(tmp_path / "target.json", kind, "--json")) == json.loads(exported)
+
+
+def test_segment_bulk_append_rolls_segments(tmp_path: Path) -> None:
+    root = tmp_path / "segments"
+    store = data_store.JsonSegmentDataStore(root, max_segment_bytes=2048, compact_after=100)
+    store.create_tail_log_entries_bulk([TailLogEntryCreate(message=f"m{index}", source="t") for index in range(200)])
+
+    segments = sorted((root / "tail_log").glob("*.jsonl"))
+    assert len(segments) > 5
+    assert all(path.stat().st_size <= 2048 for path in segments)
+    assert len(store.list_tail_log(500)) == 200
+
+
+def test_sqlite_unit_of_work_commits_once_and_rolls_back(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        store = data_store.SqliteDataStore(session)
+        with store.unit_of_work():
+            first = store.create_tail_log_entry(TailLogEntryCreate(message="first", source="test"))
+            store.create_tail_log_entry(TailLogEntryCreate(message="second", source="test"))
+            assert session.in_transaction()
+
+        with pytest.raises(RuntimeError), store.unit_of_work():
+            store.create_tail_log_entry(TailLogEntryCreate(message="discarded", source="test"))
+            raise RuntimeError("abort batch")
+
+    with Session(engine) as session:
+        messages = [entry.message for entry in data_store.SqliteDataStore(session).list_tail_log(5)]
+    assert sorted(messages) == ["first", "second"]
+    assert first.created_at.tzinfo is not None
+    engine.dispose()
+
+
+# --- Async facade ---------------------------------------------------------------
+def test_threaded_store_offloads_json_calls(tmp_path: Path) -> None:
+    sync_store = data_store.JsonDataStore(tmp_path / "playground_store.json")
+    store = async_data_store.ThreadedDataStore(lambda: nullcontext(sync_store))
+
+    async def scenario() -> list[str]:
+        await asyncio.gather(
+            *(store.create_tail_log_entry(TailLogEntryCreate(message=f"m{i}", source="test")) for i in range(5))
+        )
+        return [entry.message for entry in await store.list_tail_log(10)]
+
+    assert sorted(asyncio.run(scenario())) == [f"m{i}" for i in range(5)]
+    assert sync_store.count_interactions() == 0
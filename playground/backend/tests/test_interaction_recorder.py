@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+"""Unit tests for the write-behind interaction recorder."""
+# @tag:backend,tests,data
+
+# --- Imports -----------------------------------------------------------------
+import asyncio
+import threading
+
+from app.services.interaction_recorder import InteractionRecorder
+
+
+def _record(recorder: InteractionRecorder, index: int):
+    return recorder.record(prompt=f"p{index}", metadata={}, llm_text="ok", model_name="stub", latency_ms=index)
+
+
+def test_recorder_batches_writes_and_flushes() -> None:
+    batches: list[list[str]] = []
+    recorder = InteractionRecorder(
+        lambda records: batches.append([record.id for record in records]),
+        batch_size=4,
+        flush_interval=0.01,
+    )
+
+    async def scenario() -> list[str]:
+        records = await asyncio.gather(*(_record(recorder, index) for index in range(10)))
+        await recorder.aclose()
+        return [record.id for record in records]
+
+    ids = asyncio.run(scenario())
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [record_id for batch in batches for record_id in batch] == ids
+    assert recorder.written == 10 and recorder.pending == 0
+
+
+def test_recorder_applies_backpressure_at_durability_bound() -> None:
+    release = threading.Event()
+    recorder = InteractionRecorder(lambda records: release.wait(5), max_unflushed=2, batch_size=1)
+
+    async def scenario() -> tuple[int, int]:
+        await _record(recorder, 0)
+        await _record(recorder, 1)
+        blocked = asyncio.create_task(_record(recorder, 2))
+        await asyncio.sleep(0.05)
+        pending_while_blocked = recorder.pending
+        assert not blocked.done()
+        release.set()
+        await blocked
+        await recorder.aclose()
+        return pending_while_blocked, recorder.written
+
+    assert asyncio.run(scenario()) == (2, 3)
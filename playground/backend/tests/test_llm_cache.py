@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+"""LLM response cache keys, tiers, eviction and the caching client wrapper."""
+# @tag:backend,tests,llm
+
+import asyncio
+from pathlib import Path
+
+from app.services import llm_client
+from app.services.llm_cache import (
+    CachedCompletion,
+    LLMResponseCache,
+    MemoryCacheTier,
+    SqliteCacheTier,
+    cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> llm_client.LLMResult:
+        self.calls += 1
+        return llm_client.LLMResult(text=f"answer {self.calls}", model_name="stub", latency_ms=5)
+
+    async def generate_stream(self, prompt: str):
+        self.calls += 1
+        for text in ("ans", "wer"):
+            yield llm_client.LLMChunk(text=text, model_name="stub")
+
+
+def test_cache_key_normalizes_prompt_but_not_params() -> None:
+    params = {"temperature": 0.2, "max_tokens": 64}
+    base = cache_key("openai", "gpt-4o-mini", "Explain pauses", params)
+
+    assert cache_key("OpenAI", "gpt-4o-mini", "  Explain pauses\r\n", dict(reversed(params.items()))) == base
+    assert cache_key("openai", "gpt-4o-mini", "Explain  pauses", params) != base
+    assert cache_key("openai", "gpt-4o-mini", "Explain pauses", {**params, "temperature": 0.7}) != base
+    assert cache_key("openai", "gpt-4o", "Explain pauses", params) != base
+
+
+def test_memory_tier_evicts_least_recently_used_and_expired() -> None:
+    clock = FakeClock()
+    tier = MemoryCacheTier(2, clock=clock)
+    for key in ("a", "b"):
+        tier.put(key, CachedCompletion(text=key, model_name="m", expires_at=clock.now + 10))
+    assert tier.get("a") is not None  # "b" is now least recently used
+    tier.put("c", CachedCompletion(text="c", model_name="m", expires_at=clock.now + 10))
+
+    assert tier.get("b") is None
+    assert tier.evictions == 1
+    clock.now += 11
+    assert tier.get("a") is None
+    assert len(tier) == 1
+
+
+def test_disk_tier_survives_restart_and_trims_to_size(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "cache" / "llm_cache.sqlite3"
+    tier = SqliteCacheTier(path, 3, clock=clock)
+    for index in range(3):
+        clock.now += 1
+        tier.put(f"k{index}", CachedCompletion(text=f"v{index}", model_name="m", expires_at=clock.now + 100))
+    clock.now += 1
+    assert tier.get("k0") is not None  # k1 becomes the oldest
+    tier.put("k3", CachedCompletion(text="v3", model_name="m", expires_at=clock.now + 100))
+    tier.close()
+
+    reopened = SqliteCacheTier(path, 3, clock=clock)
+    assert reopened.get("k1") is None
+    assert [reopened.get(key).text for key in ("k0", "k2", "k3")] == ["v0", "v2", "v3"]
+    clock.now += 200
+    assert reopened.get("k0") is None
+    reopened.close()
+
+
+def test_cached_client_counts_hits_and_promotes_disk_entries(tmp_path: Path) -> None:
+    inner = CountingLLM()
+
+    def build() -> llm_client.CachedLLMClient:
+        cache = LLMResponseCache(
+            memory=MemoryCacheTier(8),
+            disk=SqliteCacheTier(tmp_path / "llm_cache.sqlite3", 8),
+        )
+        return llm_client.CachedLLMClient(inner, cache, provider="openai", model="stub", params={"temperature": 0})
+
+    async def scenario():
+        client = build()
+        first = await client.generate("hello")
+        second = await client.generate(" hello ")
+        streamed = [chunk async for chunk in client.generate_stream("stream me")]
+        replayed = [chunk async for chunk in client.generate_stream("stream me")]
+        stats = client.cache.snapshot()
+        await client.aclose()
+
+        restarted = build()
+        from_disk = await restarted.generate("hello")
+        again = await restarted.generate("hello")
+        restarted_stats = restarted.cache.snapshot()
+        await restarted.aclose()
+        return first, second, streamed, replayed, stats, from_disk, again, restarted_stats
+
+    first, second, streamed, replayed, stats, from_disk, again, restarted_stats = asyncio.run(scenario())
+
+    assert (first.cached, second.cached) == (False, True)
+    assert second.text == first.text == "answer 1"
+    assert [chunk.text for chunk in streamed] == ["ans", "wer"]
+    assert [(chunk.text, chunk.cached) for chunk in replayed] == [("answer", True)]
+    assert inner.calls == 2
+    assert stats["hits"] == 2 and stats["misses"] == 2 and stats["stores"] == 2
+
+    assert from_disk.cached and again.cached and from_disk.text == "answer 1"
+    assert restarted_stats["disk_hits"] == 1
+    assert restarted_stats["memory_hits"] == 1
+    assert inner.calls == 2
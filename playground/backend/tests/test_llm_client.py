@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+"""OpenAI client adapter behaviour against an in-process transport."""
+# @tag:backend,tests,llm
+
+import asyncio
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.services import llm_client
+
+
+def _completion_transport(seen: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        prompt = json.loads(request.content)["messages"][0]["content"]
+        return httpx.Response(
+            200,
+            json={"model": "stub-4o", "choices": [{"message": {"content": f" reply to {prompt} "}}]},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_openai_client_reuses_one_pooled_http_client() -> None:
+    seen: list[httpx.Request] = []
+    client = llm_client.OpenAILLMClient(
+        api_key="sk-test",
+        model="gpt-test",
+        max_tokens=16,
+        base_url="http://llm.local/v1/",
+        transport=_completion_transport(seen),
+    )
+
+    async def scenario():
+        pool = client._http
+        results = await asyncio.gather(*(client.generate(f"p{index}") for index in range(3)))
+        assert client._http is pool
+        await client.aclose()
+        return results, pool.is_closed
+
+    results, closed = asyncio.run(scenario())
+    assert [result.text for result in results] == ["reply to p0", "reply to p1", "reply to p2"]
+    assert results[0].model_name == "stub-4o"
+    assert [str(request.url) for request in seen] == ["http://llm.local/v1/chat/completions"] * 3
+    assert seen[0].headers["Authorization"] == "Bearer sk-test"
+    assert closed is True
+
+
+def test_close_llm_client_closes_and_forgets_the_singleton() -> None:
+    client = llm_client.OpenAILLMClient(
+        api_key="sk-test",
+        model="gpt-test",
+        max_tokens=16,
+        transport=_completion_transport([]),
+    )
+    llm_client._llm_client = client
+    asyncio.run(llm_client.close_llm_client())
+
+    assert client._http.is_closed
+    assert llm_client._llm_client is None
+
+
+def test_openai_stream_yields_content_deltas_until_done() -> None:
+    events = [
+        {"model": "stub-4o", "choices": [{"delta": {"role": "assistant"}}]},
+        {"model": "stub-4o", "choices": [{"delta": {"content": "Hel"}}]},
+        {"model": "stub-4o", "choices": [{"delta": {"content": "lo"}}]},
+        {"model": "stub-4o", "choices": [{"delta": {}, "finish_reason": "stop"}]},
+    ]
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+
+    client = llm_client.OpenAILLMClient(
+        api_key="sk-test",
+        model="gpt-test",
+        max_tokens=16,
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario():
+        chunks = [chunk async for chunk in client.generate_stream("hi")]
+        await client.aclose()
+        return chunks
+
+    chunks = asyncio.run(scenario())
+    assert [chunk.text for chunk in chunks] == ["Hel", "lo"]
+    assert {chunk.model_name for chunk in chunks} == {"stub-4o"}
+    assert json.loads(seen[0].content)["stream"] is True
+
+
+def test_get_llm_client_layers_single_flight_over_the_cache(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache.sqlite3"))
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+    llm_client.reset_llm_client()
+    try:
+        client = llm_client.get_llm_client()
+        assert isinstance(client, llm_client.CoalescingLLMClient)
+        assert isinstance(client.client, llm_client.CachedLLMClient)
+        assert isinstance(client.client.client, llm_client.RateLimitedLLMClient)
+        assert isinstance(client.client.client.client, llm_client.OpenAILLMClient)
+        asyncio.run(llm_client.close_llm_client())
+    finally:
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+        llm_client.reset_llm_client()
+
+
+def test_reset_closes_the_pooled_http_client_and_the_cache(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache.sqlite3"))
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+    llm_client.reset_llm_client()
+    try:
+        client = llm_client.get_llm_client()
+        openai = llm_client._find_layer(client, llm_client.OpenAILLMClient)
+        cached = llm_client._find_layer(client, llm_client.CachedLLMClient)
+        llm_client.reset_llm_client()
+        assert openai._http.is_closed
+        with pytest.raises(sqlite3.ProgrammingError):
+            cached.cache._disk._conn.execute("SELECT 1")
+
+        async def reset_inside_a_loop():
+            client = llm_client.get_llm_client()
+            llm_client.reset_llm_client()
+            await asyncio.sleep(0.01)
+            return llm_client._find_layer(client, llm_client.OpenAILLMClient)
+
+        assert asyncio.run(reset_inside_a_loop())._http.is_closed
+    finally:
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+        llm_client.reset_llm_client()
+
+
+def test_reset_logs_a_client_that_cannot_be_closed_on_this_loop(caplog) -> None:
+    class LoopBoundClient:
+        async def aclose(self) -> None:
+            raise RuntimeError("Event loop is closed")
+
+    llm_client._llm_client = LoopBoundClient()  # type: ignore[attr-defined]
+    llm_client.reset_llm_client()
+
+    assert llm_client._llm_client is None  # type: ignore[attr-defined]
+    assert "Closing the previous LLM client failed" in caplog.text
+
+
+def test_response_cache_is_opt_in_and_never_wraps_echo(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("LLM_PROVIDER", "echo")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache.sqlite3"))
+    monkeypatch.delenv("LLM_CACHE_ENABLED", raising=False)
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+    llm_client.reset_llm_client()
+    try:
+        assert get_settings().llm_cache_enabled is False
+        client = llm_client.get_llm_client()
+        assert isinstance(client, llm_client.CoalescingLLMClient)
+        assert isinstance(client.client, llm_client.EchoLLMClient)
+
+        async def scenario():
+            return await asyncio.gather(client.generate("hi"), client.generate("hi"))
+
+        results = asyncio.run(scenario())
+        assert [result.text for result in results] == ["[echo] hi"] * 2
+        assert llm_client.llm_single_flight_stats()["coalesced"] == 1
+        assert llm_client.llm_cache_stats() is None
+        asyncio.run(llm_client.close_llm_client())
+
+        monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+        assert llm_client._find_layer(llm_client.get_llm_client(), llm_client.CachedLLMClient) is None
+        assert not (tmp_path / "llm_cache.sqlite3").exists()
+    finally:
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+        llm_client.reset_llm_client()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+"""Token buckets, concurrency cap and retry policy of the LLM rate limiter."""
+# @tag:backend,tests,llm
+
+import asyncio
+import random
+
+import httpx
+import pytest
+
+from app.services import llm_client
+from app.services.llm_limiter import LLMRateLimitedError, LLMRateLimiter, TokenBucket, retry_after_seconds
+
+
+class FakeTime:
+    """Virtual clock; ``sleep`` advances it instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _status_error(code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://llm.local/v1/chat/completions")
+    response = httpx.Response(code, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"HTTP {code}", request=request, response=response)
+
+
+def _limiter(fake: FakeTime, **kwargs) -> LLMRateLimiter:
+    return LLMRateLimiter(clock=fake.clock, sleep=fake.sleep, rng=random.Random(7), **kwargs)
+
+
+def test_token_bucket_allows_a_burst_then_paces_at_the_rate() -> None:
+    fake = FakeTime()
+    bucket = TokenBucket(120, burst_s=1.0, clock=fake.clock, sleep=fake.sleep)  # 2 per second
+
+    async def scenario():
+        for _ in range(12):
+            await bucket.acquire()
+        paced_until = fake.now
+        await bucket.acquire(10)  # larger than the bucket: waits for it to fill, then owes the rest
+        return paced_until
+
+    assert asyncio.run(scenario()) == pytest.approx(5.0)
+    assert fake.now == pytest.approx(6.0)
+    assert bucket.available == pytest.approx(-8.0)
+    bucket.adjust(3)
+    assert bucket.available == pytest.approx(-5.0)
+
+
+def test_retry_after_is_honored_and_pauses_other_callers() -> None:
+    fake = FakeTime()
+    limiter = _limiter(fake, backoff_base=0.1)
+    attempts: list[float] = []
+
+    async def throttled_once() -> str:
+        attempts.append(fake.now)
+        if len(attempts) == 1:
+            raise _status_error(429, {"Retry-After": "2"})
+        return "ok"
+
+    async def other() -> str:
+        await asyncio.sleep(0)  # arrive after the 429
+        attempts.append(fake.now)
+        return "other"
+
+    async def scenario():
+        return await asyncio.gather(limiter.run(throttled_once), limiter.run(other))
+
+    assert asyncio.run(scenario()) == ["ok", "other"]
+    assert attempts[0] == 0.0
+    assert all(2.0 <= started <= 2.1 for started in attempts[1:])
+    assert (limiter.stats.retries, limiter.stats.throttled, limiter.stats.failures) == (1, 1, 0)
+
+
+def test_exhausted_retries_raise_rate_limited_and_client_errors_fail_fast() -> None:
+    fake = FakeTime()
+    limiter = _limiter(fake, max_retries=2)
+    calls = {"429": 0, "400": 0}
+
+    async def always_429():
+        calls["429"] += 1
+        raise _status_error(429, {"Retry-After": "1"})
+
+    async def bad_request():
+        calls["400"] += 1
+        raise _status_error(400)
+
+    with pytest.raises(LLMRateLimitedError) as excinfo:
+        asyncio.run(limiter.run(always_429))
+    assert excinfo.value.retry_after == 1.0
+    assert calls["429"] == 3
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(limiter.run(bad_request))
+    assert calls["400"] == 1
+    assert limiter.stats.failures == 2
+
+
+def test_backoff_is_jittered_exponential_and_capped() -> None:
+    limiter = LLMRateLimiter(backoff_base=0.5, backoff_max=4.0, rng=random.Random(1))
+    delays = [[limiter.backoff(attempt) for _ in range(200)] for attempt in range(6)]
+
+    for attempt, samples in enumerate(delays):
+        cap = min(4.0, 0.5 * 2**attempt)
+        assert all(0 <= delay <= cap for delay in samples)
+        assert max(samples) > cap * 0.9 and min(samples) < cap * 0.1
+
+
+def test_concurrency_cap_queues_callers_and_reports_depth() -> None:
+    limiter = LLMRateLimiter(max_concurrency=2)
+    active = peak = 0
+
+    async def call() -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def scenario():
+        await asyncio.gather(*(limiter.run(call) for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peak == 2
+    assert limiter.stats.peak_queue_depth == 4  # the first two never wait
+    assert (limiter.stats.queue_depth, limiter.stats.in_flight) == (0, 0)
+
+
+def test_rate_limited_client_retries_streams_before_the_first_chunk_and_settles_tokens() -> None:
+    fake = FakeTime()
+
+    class FlakyLLM:
+        def __init__(self) -> None:
+            self.streams = 0
+
+        async def generate(self, prompt: str) -> llm_client.LLMResult:
+            return llm_client.LLMResult(text="done", model_name="stub", latency_ms=1, total_tokens=30)
+
+        async def generate_stream(self, prompt: str):
+            self.streams += 1
+            if self.streams == 1:
+                raise _status_error(503)
+            yield llm_client.LLMChunk(text="a", model_name="stub")
+            yield llm_client.LLMChunk(text="b", model_name="stub")
+
+    inner = FlakyLLM()
+    limiter = _limiter(fake, tokens_per_minute=1000, burst_s=60)
+    client = llm_client.RateLimitedLLMClient(inner, limiter, max_tokens=100)
+
+    async def scenario():
+        chunks = [chunk.text async for chunk in client.generate_stream("x" * 40)]
+        result = await client.generate("x" * 40)
+        return chunks, result
+
+    chunks, result = asyncio.run(scenario())
+    assert chunks == ["a", "b"]
+    assert inner.streams == 2
+    assert result.text == "done"
+    # Two stream attempts and the call reserved 110 tokens each; the call gave back 110 - 30,
+    # and the bucket refilled during the backoff.
+    assert limiter._tokens.available == pytest.approx(1000 - 3 * 110 + 80 + fake.now * 1000 / 60)
+
+
+def test_retry_after_accepts_http_dates() -> None:
+    response = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:10 GMT"})
+    assert retry_after_seconds(response, now=1445412480.0) == pytest.approx(10.0)
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+"""Tests for the SQLite profile and schema migrations."""
+# @tag:backend,tests,models
+
+# --- Imports -----------------------------------------------------------------
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.config import Settings
+from app.database import Base, apply_sqlite_pragmas
+from app.migrations import MIGRATIONS, apply_migrations, schema_version
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def test_apply_migrations_indexes_legacy_database(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(connection)
+
+    assert apply_migrations(engine) == [version for version, *_ in MIGRATIONS]
+    assert apply_migrations(engine) == []
+
+    assert "ix_interactions_created_at" in {index["name"] for index in inspect(engine).get_indexes("interactions")}
+    with engine.connect() as connection:
+        assert schema_version(connection) == MIGRATIONS[-1][0]
+        plan = connection.execute(
+            text("EXPLAIN QUERY PLAN SELECT * FROM tail_log_entries ORDER BY created_at DESC LIMIT 5")
+        ).all()
+    assert "ix_tail_log_entries_created_at" in " ".join(row[-1] for row in plan)
+    engine.dispose()
+
+
+def test_sqlite_profile_pragmas_apply_on_connect(tmp_path: Path) -> None:
+    settings = Settings(SQLITE_MMAP_SIZE_MB=8, SQLITE_CACHE_SIZE_MB=16)
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    apply_sqlite_pragmas(engine, settings)
+
+    with engine.connect() as connection:
+        values = {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ("journal_mode", "synchronous", "mmap_size", "cache_size")
+        }
+    assert values == {"journal_mode": "wal", "synchronous": 1, "mmap_size": 8 * 1024 * 1024, "cache_size": -16 * 1024}
+    engine.dispose()
+
+
+def test_apply_migrations_adds_first_token_column(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE interactions DROP COLUMN first_token_ms"))
+
+    apply_migrations(engine)
+
+    assert "first_token_ms" in {column["name"] for column in inspect(engine).get_columns("interactions")}
+    engine.dispose()
+
+
+def test_cli_migrates_a_pre_migration_database(tmp_path: Path) -> None:
+    database = tmp_path / "legacy.db"
+    engine = create_engine(f"sqlite:///{database}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE interactions DROP COLUMN first_token_ms"))
+        connection.execute(
+            text(
+                "INSERT INTO interactions (id, user_prompt_text, typing_metadata_json, ai_response_text,"
+                " model_name, latency_ms, created_at) VALUES ('old', 'hi', '{}', 'hello', 'm', 5,"
+                " '2025-11-01 00:00:00.000000')"
+            )
+        )
+    engine.dispose()
+
+    env = {**os.environ, "DATABASE_PROVIDER": "sqlite", "DATABASE_PATH": str(database)}
+    result = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "scripts" / "playground_store.py"), "interactions", "--json"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    [record] = json.loads(result.stdout)
+    assert (record["id"], record["first_token_ms"]) == ("old", None)
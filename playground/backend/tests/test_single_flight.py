@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""Single-flight coalescing: sharing, errors, timeouts and cancellation."""
+# @tag:backend,tests,llm
+
+import asyncio
+
+import pytest
+
+from app.services import llm_client
+from app.services.single_flight import SingleFlight
+
+
+class SlowLLM:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, prompt: str) -> llm_client.LLMResult:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return llm_client.LLMResult(text=f"re: {prompt}", model_name="stub", latency_ms=50)
+
+
+def _coalescing(inner: SlowLLM, **kwargs) -> llm_client.CoalescingLLMClient:
+    return llm_client.CoalescingLLMClient(
+        inner,
+        SingleFlight(**kwargs),
+        provider="openai",
+        model="stub",
+        params={"temperature": 0.2},
+    )
+
+
+def test_concurrent_identical_prompts_share_one_provider_call() -> None:
+    inner = SlowLLM()
+    client = _coalescing(inner)
+
+    async def scenario():
+        burst = await asyncio.gather(*(client.generate(prompt) for prompt in ["same"] * 8 + [" same\n", "other"]))
+        later = await client.generate("same")
+        return burst, later
+
+    burst, later = asyncio.run(scenario())
+    assert {result.text for result in burst[:9]} == {"re: same"}
+    assert burst[9].text == "re: other"
+    # One call for the burst of "same", one for "other", and a fresh one after the flight ended.
+    assert inner.calls == 3
+    stats = client.flights.stats
+    assert (stats.calls, stats.coalesced) == (11, 8)
+    assert client.flights.in_flight == 0
+    assert later.text == "re: same"
+
+
+def test_errors_reach_every_waiter_and_the_next_call_retries() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    attempts = 0
+
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise RuntimeError("upstream 500")
+        return "ok"
+
+    async def scenario():
+        results = await asyncio.gather(*(flights.do("k", flaky) for _ in range(3)), return_exceptions=True)
+        return results, await flights.do("k", flaky)
+
+    results, retried = asyncio.run(scenario())
+    assert [type(result) for result in results] == [RuntimeError] * 3
+    assert retried == "ok"
+    assert attempts == 2
+
+
+def test_timeout_cancels_the_flight_for_all_waiters() -> None:
+    inner = SlowLLM(delay=1.0)
+    client = _coalescing(inner, timeout=0.05)
+
+    async def scenario():
+        return await asyncio.gather(*(client.generate("slow") for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+    assert (inner.calls, inner.cancelled) == (1, 1)
+    assert client.flights.stats.timeouts == 1
+
+
+def test_cancelled_waiter_leaves_the_flight_running_until_the_last_one_goes() -> None:
+    inner = SlowLLM(delay=0.1)
+    client = _coalescing(inner)
+
+    async def scenario():
+        first = asyncio.create_task(client.generate("shared"))
+        second = asyncio.create_task(client.generate("shared"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        survivor = await second
+
+        lone = asyncio.create_task(client.generate("abandoned"))
+        await asyncio.sleep(0.01)
+        lone.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lone
+        await asyncio.sleep(0)
+        return survivor
+
+    survivor = asyncio.run(scenario())
+    assert survivor.text == "re: shared"
+    assert (inner.calls, inner.cancelled) == (2, 1)
+    assert client.flights.stats.abandoned == 1
+    assert client.flights.in_flight == 0
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+"""Tail-log pub/sub and SSE framing without a live HTTP stream."""
+# @tag:backend,tests,data
+
+import asyncio
+import json
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from app.schemas import TailLogEntryCreate
+from app.services import data_store
+from app.services.async_data_store import ThreadedDataStore
+from app.services.tail_log_broker import TailLogBroker, get_tail_log_broker
+from app.services.tail_log_stream import tail_log_events
+
+
+def _messages(frames: list[str]) -> list[str]:
+    return [json.loads(frame.split("data: ", 1)[1])["message"] for frame in frames if "\ndata: " in frame]
+
+
+def test_broker_delivers_across_threads_and_flags_overflow() -> None:
+    async def scenario():
+        broker = TailLogBroker(max_pending=2)
+        subscription = broker.subscribe()
+        record = data_store.TailLogRecord(id="1", message="hi", source="t", created_at=datetime.now(timezone.utc))
+        await asyncio.to_thread(broker.publish, [record])
+        received = await subscription.get(1.0)
+
+        await asyncio.to_thread(broker.publish, [record, record, record])
+        await asyncio.sleep(0)
+        overflowed = subscription.overflowed
+        subscription.close()
+        return received, overflowed, broker.subscriber_count
+
+    received, overflowed, subscribers = asyncio.run(scenario())
+    assert received.message == "hi"
+    assert overflowed is True
+    assert subscribers == 0
+
+
+def test_stream_resumes_after_cursor_then_follows_live_writes(tmp_path: Path) -> None:
+    store = data_store.JsonDataStore(tmp_path / "playground_store.json")
+    first, *_ = store.create_tail_log_entries_bulk(
+        [TailLogEntryCreate(message=f"old {index}", source="test") for index in range(3)]
+    )
+    async_store = ThreadedDataStore(lambda: nullcontext(store))
+
+    async def scenario() -> list[str]:
+        events = tail_log_events(
+            async_store,
+            get_tail_log_broker(),
+            cursor=data_store.PageCursor.after(first),
+            heartbeat=0.2,
+            resync=0,
+        )
+        frames = [await anext(events) for _ in range(3)]
+        # The generator subscribed before the resume read; a write now is pushed.
+        await asyncio.to_thread(store.create_tail_log_entry, TailLogEntryCreate(message="live", source="test"))
+        frames.append(await asyncio.wait_for(anext(events), 1.0))
+        frames.append(await asyncio.wait_for(anext(events), 1.0))
+        await events.aclose()
+        return frames
+
+    frames = asyncio.run(scenario())
+    assert frames[0].startswith("retry: ")
+    assert _messages(frames) == ["old 1", "old 2", "live"]
+    assert frames[1].startswith("id: ")
+    assert frames[-1] == ": keep-alive\n\n"
+
+
+class ListTailLog:
+    """In-memory ``list_tail_log`` whose rows become visible when appended, like commits."""
+
+    def __init__(self) -> None:
+        self.rows: list[data_store.TailLogRecord] = []
+
+    def add(self, message: str, created_at: datetime) -> None:
+        self.rows.append(data_store.TailLogRecord(id=str(uuid4()), message=message, source="t", created_at=created_at))
+
+    async def list_tail_log(self, limit, *, cursor=None, since=None):
+        rows = sorted(self.rows, key=lambda row: (row.created_at, row.id), reverse=True)
+        if since is not None:
+            rows = [row for row in rows if row.created_at >= since]
+        if cursor is not None:
+            rows = [row for row in rows if (row.created_at, row.id) < (cursor.timestamp, cursor.id)]
+        return rows[:limit]
+
+
+def test_resync_delivers_entries_committed_after_newer_ones() -> None:
+    now = datetime.now(timezone.utc)
+    store = ListTailLog()
+    store.add("history", now - timedelta(seconds=5))
+
+    async def scenario() -> list[str]:
+        events = tail_log_events(store, TailLogBroker(), heartbeat=5.0, resync=0.05, lag=10.0)
+        frames = [await anext(events)]
+        store.add("newer", now)
+        frames.append(await asyncio.wait_for(anext(events), 1.0))
+        # Stamped before "newer" but committed after it had been sent.
+        store.add("late", now - timedelta(seconds=1))
+        frames.append(await asyncio.wait_for(anext(events), 1.0))
+        store.add("next", now + timedelta(seconds=1))
+        frames.append(await asyncio.wait_for(anext(events), 1.0))
+        await events.aclose()
+        return frames
+
+    frames = asyncio.run(scenario())
+    assert _messages(frames) == ["newer", "late", "next"]
+    # The late entry carries the newest position, so a reconnect does not replay "newer".
+    assert frames[1].split("\n", 1)[0] == frames[2].split("\n", 1)[0]
@@ -13,7 +13,7 @@ import TailLogCell from "./components/TailLogCell";
 import SearchTelemetryCard from "./components/SearchTelemetryCard";
 import OpsDeck from "./components/OpsDeck";
 import WidgetShowcase from "./components/design-system/WidgetShowcase";
-import { createArtifact, createTailLogEntry, fetchArtifacts, fetchOpsStatus, fetchTailLog, sendOpsCommand } from "./lib/api";
+import { createArtifact, createTailLogEntry, fetchArtifacts, fetchOpsStatus, fetchTailLog, sendOpsCommand, subscribeTailLog } from "./lib/api";
 import { estimateTokens } from "./lib/text";
 const initialMessages = [
     {
@@ -62,6 +62,8 @@ const initialCanvas = [
     }
 ];
 const OPS_POLL_INTERVAL_MS = 25000;
+const TAIL_LOG_LIMIT = 18;
+const mergeTailLogEntry = (prev, entry) => prev.some((item) => item.id === entry.id) ? prev : [entry, ...prev].slice(0, TAIL_LOG_LIMIT);
 const THEME_VARIANTS = [
     {
         key: "midnight",
@@ -129,6 +131,7 @@ function App() {
             cancelled = true;
         };
     }, []);
+    useEffect(() => subscribeTailLog((entry) => setTailLog((prev) => mergeTailLogEntry(prev, entry))), []);
     const refreshOpsStatus = useCallback(async () => {
         try {
             const snapshot = await fetchOpsStatus();
@@ -157,14 +160,15 @@ function App() {
     const appendTailLog = useCallback(async (message, source = "system") => {
         try {
             const entry = await createTailLogEntry({ message, source });
-            setTailLog((prev) => [entry, ...prev].slice(0, 18));
+            // The stream may have delivered this entry already.
+            setTailLog((prev) => mergeTailLogEntry(prev, entry));
         }
         catch (error) {
             console.warn("Failed to persist tail log", error);
             setTailLog((prev) => [
                 { id: crypto.randomUUID(), message, source, createdAt: Date.now() },
                 ...prev
-            ].slice(0, 18));
+            ].slice(0, TAIL_LOG_LIMIT));
         }
     }, []);
     const handleThemeSelect = useCallback((key) => {
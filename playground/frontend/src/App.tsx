@@ -21,7 +21,8 @@ import {
   fetchArtifacts,
   fetchOpsStatus,
   fetchTailLog,
-  sendOpsCommand
+  sendOpsCommand,
+  subscribeTailLog
 } from "./lib/api";
 import { useManifest } from "./context/ManifestContext";
 import { estimateTokens } from "./lib/text";
@@ -83,6 +84,10 @@ const initialCanvas: CanvasItem[] = [
 ];
 
 const OPS_POLL_INTERVAL_MS = 25000;
+const TAIL_LOG_LIMIT = 18;
+
+const mergeTailLogEntry = (prev: TailLogEntry[], entry: TailLogEntry) =>
+  prev.some((item) => item.id === entry.id) ? prev : [entry, ...prev].slice(0, TAIL_LOG_LIMIT);
 
 type ThemeVariant = {
   key: string;
@@ -174,6 +179,8 @@ function App() {
     };
   }, []);
 
+  useEffect(() => subscribeTailLog((entry) => setTailLog((prev) => mergeTailLogEntry(prev, entry))), []);
+
   const refreshOpsStatus = useCallback(async () => {
     try {
       const snapshot = await fetchOpsStatus();
@@ -205,13 +212,14 @@ function App() {
     async (message: string, source = "system") => {
       try {
         const entry = await createTailLogEntry({ message, source });
-        setTailLog((prev) => [entry, ...prev].slice(0, 18));
+        // The stream may have delivered this entry already.
+        setTailLog((prev) => mergeTailLogEntry(prev, entry));
       } catch (error) {
         console.warn("Failed to persist tail log", error);
         setTailLog((prev) => [
           { id: crypto.randomUUID(), message, source, createdAt: Date.now() },
           ...prev
-        ].slice(0, 18));
+        ].slice(0, TAIL_LOG_LIMIT));
       }
     },
     []
@@ -5,7 +5,7 @@ import { jsx as _jsx, jsxs as _jsxs } from "react/jsx-runtime";
  */
 // @tag: frontend,component,prompt
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
-import { postChat } from "../lib/api";
+import { streamChat } from "../lib/api";
 import { estimateTokens } from "../lib/text";
 const INACTIVITY_THRESHOLD_MS = 700;
 const SNAPSHOT_INTERVAL_MS = 1500;
@@ -96,6 +96,7 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
     const [isSubmitting, setIsSubmitting] = useState(false);
     const [error, setError] = useState(null);
     const [statusMessage, setStatusMessage] = useState(null);
+    const [streamingText, setStreamingText] = useState("");
     const tokenEstimate = useMemo(() => estimateTokens(prompt), [prompt]);
     const handleSubmit = useCallback(async () => {
         if (!prompt.trim()) {
@@ -119,7 +120,8 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
             setIsSubmitting(true);
             setError(null);
             setStatusMessage("Streaming response…");
-            const result = await postChat(payload);
+            setStreamingText("");
+            const result = await streamChat(payload, (text) => setStreamingText((prev) => prev + text));
             const responseText = result.ai_response_text ?? "No response returned.";
             onInteractionComplete?.({
                 payload,
@@ -137,6 +139,7 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
         }
         finally {
             setIsSubmitting(false);
+            setStreamingText("");
             setTimeout(() => setStatusMessage(null), 1500);
         }
     }, [prompt, finalizePause, startedAt, tokenEstimate, keystrokes, pauseEvents, editHistory, reset, onInteractionComplete]);
@@ -145,5 +148,5 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
         setStatusMessage(`Inserted · ${artifact.title}`);
         setTimeout(() => setStatusMessage(null), 1800);
     }, [setPrompt]);
-    return (_jsxs("section", { className: "panel", children: [_jsxs("div", { className: "panel-header", children: [_jsx("h2", { children: "Prompt composer" }), _jsx("button", { type: "button", className: "primary", onClick: handleSubmit, disabled: isSubmitting, children: isSubmitting ? "Sending…" : "Send to ChatAI" })] }), _jsxs("div", { className: "prompt-recorder-grid", children: [_jsx("textarea", { className: "prompt-input", placeholder: "Describe the task you want help with\u2026", value: prompt, onChange: handleChange, onKeyDown: handleKeyDown, rows: 8 }), artifactSuggestions.length > 0 && (_jsxs("aside", { className: "prompt-artifacts", children: [_jsx("p", { className: "eyebrow", children: "Artifact rail" }), _jsx("h3", { children: "Recent deposits" }), _jsx("div", { className: "artifact-chip-grid", children: artifactSuggestions.map((artifact) => (_jsxs("article", { className: `artifact-chip accent-${artifact.accent ?? "violet"}`, children: [_jsxs("header", { children: [_jsx("strong", { children: artifact.title }), _jsx("span", { children: new Date(artifact.createdAt).toLocaleTimeString([], { hour: "2-digit", minute: "2-digit" }) })] }), _jsx("p", { children: artifact.body.length > 140 ? `${artifact.body.slice(0, 140)}…` : artifact.body }), _jsx("div", { className: "artifact-chip-actions", children: _jsx("button", { type: "button", className: "ghost", onClick: () => handleArtifactInsert(artifact), children: "Insert into prompt" }) })] }, artifact.id))) })] }))] }), _jsxs("div", { className: "metrics", children: [_jsxs("span", { children: ["Token est: ", tokenEstimate] }), _jsxs("span", { children: ["Keystrokes: ", keystrokes.current.length] }), _jsxs("span", { children: ["Pauses: ", pauseEvents.current.length] }), statusMessage && _jsx("span", { className: "status-dot", children: statusMessage })] }), error && _jsx("p", { className: "error", children: error })] }));
+    return (_jsxs("section", { className: "panel", children: [_jsxs("div", { className: "panel-header", children: [_jsx("h2", { children: "Prompt composer" }), _jsx("button", { type: "button", className: "primary", onClick: handleSubmit, disabled: isSubmitting, children: isSubmitting ? "Sending…" : "Send to ChatAI" })] }), _jsxs("div", { className: "prompt-recorder-grid", children: [_jsx("textarea", { className: "prompt-input", placeholder: "Describe the task you want help with\u2026", value: prompt, onChange: handleChange, onKeyDown: handleKeyDown, rows: 8 }), artifactSuggestions.length > 0 && (_jsxs("aside", { className: "prompt-artifacts", children: [_jsx("p", { className: "eyebrow", children: "Artifact rail" }), _jsx("h3", { children: "Recent deposits" }), _jsx("div", { className: "artifact-chip-grid", children: artifactSuggestions.map((artifact) => (_jsxs("article", { className: `artifact-chip accent-${artifact.accent ?? "violet"}`, children: [_jsxs("header", { children: [_jsx("strong", { children: artifact.title }), _jsx("span", { children: new Date(artifact.createdAt).toLocaleTimeString([], { hour: "2-digit", minute: "2-digit" }) })] }), _jsx("p", { children: artifact.body.length > 140 ? `${artifact.body.slice(0, 140)}…` : artifact.body }), _jsx("div", { className: "artifact-chip-actions", children: _jsx("button", { type: "button", className: "ghost", onClick: () => handleArtifactInsert(artifact), children: "Insert into prompt" }) })] }, artifact.id))) })] }))] }), _jsxs("div", { className: "metrics", children: [_jsxs("span", { children: ["Token est: ", tokenEstimate] }), _jsxs("span", { children: ["Keystrokes: ", keystrokes.current.length] }), _jsxs("span", { children: ["Pauses: ", pauseEvents.current.length] }), statusMessage && _jsx("span", { className: "status-dot", children: statusMessage })] }), streamingText && _jsx("p", { className: "prompt-stream", children: streamingText }), error && _jsx("p", { className: "error", children: error })] }));
 }
@@ -13,7 +13,7 @@ import {
   type ChangeEvent,
   type KeyboardEvent
 } from "react";
-import { postChat } from "../lib/api";
+import { streamChat } from "../lib/api";
 import { estimateTokens } from "../lib/text";
 import type {
   ArtifactRecord,
@@ -145,6 +145,7 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [statusMessage, setStatusMessage] = useState<string | null>(null);
+  const [streamingText, setStreamingText] = useState("");
 
   const tokenEstimate = useMemo(() => estimateTokens(prompt), [prompt]);
 
@@ -171,7 +172,8 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
       setIsSubmitting(true);
       setError(null);
       setStatusMessage("Streaming response…");
-      const result = await postChat(payload);
+      setStreamingText("");
+      const result = await streamChat(payload, (text) => setStreamingText((prev) => prev + text));
       const responseText: string = result.ai_response_text ?? "No response returned.";
       onInteractionComplete?.({
         payload,
@@ -187,6 +189,7 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
       setStatusMessage(null);
     } finally {
       setIsSubmitting(false);
+      setStreamingText("");
       setTimeout(() => setStatusMessage(null), 1500);
     }
   }, [prompt, finalizePause, startedAt, tokenEstimate, keystrokes, pauseEvents, editHistory, reset, onInteractionComplete]);
@@ -251,6 +254,7 @@ export default function PromptRecorder({ onInteractionComplete, artifactSuggesti
         {statusMessage && <span className="status-dot">{statusMessage}</span>}
       </div>
 
+      {streamingText && <p className="prompt-stream">{streamingText}</p>}
       {error && <p className="error">{error}</p>}
     </section>
   );
@@ -80,6 +80,46 @@ export async function postChat(payload) {
         body: JSON.stringify(payload)
     });
 }
+/**
+ * POST to the NDJSON chat stream, handing each token to `onToken` as it
+ * arrives. Resolves with the same payload `/api/chat` returns once the
+ * backend has stored the interaction.
+ */
+export async function streamChat(payload, onToken) {
+    const response = await apiRequest(`/api/chat/stream`, {
+        method: "POST",
+        body: JSON.stringify(payload)
+    });
+    if (!response.ok || !response.body) {
+        const detail = await response.text();
+        throw new Error(`Request failed (${response.status}): ${detail || response.statusText}`);
+    }
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffered = "";
+    for (;;) {
+        const { value, done } = await reader.read();
+        if (done)
+            break;
+        buffered += value;
+        const lines = buffered.split("\n");
+        buffered = lines.pop() ?? "";
+        for (const line of lines) {
+            if (!line)
+                continue;
+            const frame = JSON.parse(line);
+            if (frame.type === "token") {
+                onToken(frame.text);
+            }
+            else if (frame.type === "done") {
+                return frame;
+            }
+            else if (frame.type === "error") {
+                throw new Error(frame.detail);
+            }
+        }
+    }
+    throw new Error("Chat stream ended before the response was stored");
+}
 export async function fetchArtifacts(limit = 8) {
     const data = await apiFetch(`/api/artifacts?limit=${limit}`);
     return data.map(mapArtifactRecord);
@@ -95,6 +135,20 @@ export async function fetchTailLog(limit = 18) {
     const data = await apiFetch(`/api/tail-log?limit=${limit}`);
     return data.map(mapTailLogEntry);
 }
+/**
+ * Push new tail-log entries from the SSE stream. EventSource reconnects on its
+ * own and resumes from the last event id, so no entries are skipped.
+ */
+export function subscribeTailLog(onEntry) {
+    if (typeof EventSource === "undefined") {
+        return () => undefined;
+    }
+    const source = new EventSource(`${API_BASE_URL}/api/tail-log/stream`);
+    source.addEventListener("tail-log", (event) => {
+        onEntry(mapTailLogEntry(JSON.parse(event.data)));
+    });
+    return () => source.close();
+}
 export async function createTailLogEntry(payload) {
     const data = await apiFetch(`/api/tail-log`, {
         method: "POST",
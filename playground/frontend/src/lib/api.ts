@@ -113,6 +113,47 @@ export async function postChat(payload: ChatPayload): Promise<ChatResponsePayloa
   });
 }
 
+/**
+ * POST to the NDJSON chat stream, handing each token to `onToken` as it
+ * arrives. Resolves with the same payload `/api/chat` returns once the
+ * backend has stored the interaction.
+ */
+export async function streamChat(
+  payload: ChatPayload,
+  onToken: (text: string) => void
+): Promise<ChatResponsePayload> {
+  const response = await apiRequest(`/api/chat/stream`, {
+    method: "POST",
+    body: JSON.stringify(payload)
+  });
+  if (!response.ok || !response.body) {
+    const detail = await response.text();
+    throw new Error(`Request failed (${response.status}): ${detail || response.statusText}`);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffered = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffered += value;
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    for (const line of lines) {
+      if (!line) continue;
+      const frame = JSON.parse(line);
+      if (frame.type === "token") {
+        onToken(frame.text);
+      } else if (frame.type === "done") {
+        return frame as ChatResponsePayload;
+      } else if (frame.type === "error") {
+        throw new Error(frame.detail);
+      }
+    }
+  }
+  throw new Error("Chat stream ended before the response was stored");
+}
+
 export async function fetchArtifacts(limit = 8): Promise<ArtifactRecord[]> {
   const data = await apiFetch<any[]>(`/api/artifacts?limit=${limit}`);
   return data.map(mapArtifactRecord);
@@ -131,6 +172,21 @@ export async function fetchTailLog(limit = 18): Promise<TailLogEntry[]> {
   return data.map(mapTailLogEntry);
 }
 
+/**
+ * Push new tail-log entries from the SSE stream. EventSource reconnects on its
+ * own and resumes from the last event id, so no entries are skipped.
+ */
+export function subscribeTailLog(onEntry: (entry: TailLogEntry) => void): () => void {
+  if (typeof EventSource === "undefined") {
+    return () => undefined;
+  }
+  const source = new EventSource(`${API_BASE_URL}/api/tail-log/stream`);
+  source.addEventListener("tail-log", (event) => {
+    onEntry(mapTailLogEntry(JSON.parse((event as MessageEvent<string>).data)));
+  });
+  return () => source.close();
+}
+
 export async function createTailLogEntry(payload: TailLogEntryCreate): Promise<TailLogEntry> {
   const data = await apiFetch<any>(`/api/tail-log`, {
     method: "POST",
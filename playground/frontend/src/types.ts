@@ -81,6 +81,8 @@ export interface ChatResponsePayload {
   interaction_id: string;
   ai_response_text: string;
   model_name?: string;
+  latency_ms?: number;
+  first_token_ms?: number | null;
 }
 
 export type OpsAction = "start" | "stop" | "restart" | "status" | "logs" | "kill" | "kill-all";
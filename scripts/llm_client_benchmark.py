@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+"""Measure per-request latency of the OpenAI client against a local stub server.
+
+Compares the pooled ``OpenAILLMClient`` (one long-lived ``httpx.AsyncClient``)
+with the previous behaviour of opening a fresh client for every prompt. The
+stub speaks just enough of ``/v1/chat/completions`` over HTTP/1.1 keep-alive
+and counts the TCP connections it accepts.
+
+With ``--quota-rps`` the stub throttles like a provider (429 + Retry-After
+past its quota) and the run compares naive immediate retries with the
+``LLMRateLimiter`` in front of the client.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from playground.backend.app.services.llm_client import OpenAILLMClient, RateLimitedLLMClient
+from playground.backend.app.services.llm_limiter import LLMRateLimiter
+
+COMPLETION = json.dumps(
+    {"model": "stub", "choices": [{"message": {"role": "assistant", "content": "ok"}}]}
+).encode("utf-8")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive unless the client closes
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    connections = 0
+    delay_s = 0.0
+    quota_rps = 0.0  # 0 = unlimited
+    throttled = 0
+    _allowance = 0.0
+    _checked = time.monotonic()
+    _quota_lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        type(self).connections += 1
+
+    @classmethod
+    def _over_quota(cls) -> bool:
+        # Provider-style bucket with a one-second burst.
+        with cls._quota_lock:
+            now = time.monotonic()
+            cls._allowance = min(cls.quota_rps, cls._allowance + (now - cls._checked) * cls.quota_rps)
+            cls._checked = now
+            if cls._allowance < 1:
+                cls.throttled += 1
+                return True
+            cls._allowance -= 1
+            return False
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.quota_rps and self._over_quota():
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+
+def start_stub_server(delay_ms: float) -> ThreadingHTTPServer:
+    _StubHandler.delay_s = delay_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _per_request_client(base_url: str) -> None:
+    # What OpenAILLMClient.generate did before it owned a pooled client.
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        resp = await client.post(
+            f"{base_url}/chat/completions",
+            headers={"Authorization": "Bearer stub"},
+            json={"model": "stub", "messages": [{"role": "user", "content": "ping"}]},
+        )
+    resp.raise_for_status()
+
+
+async def _run(label: str, call, requests: int, concurrency: int) -> dict[str, float | str]:
+    gate = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with gate:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await call()  # warm-up (imports, first connection)
+    _StubHandler.connections = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "client": label,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "req_per_s": requests / elapsed,
+        "connections": _StubHandler.connections,
+    }
+
+
+async def benchmark(requests: int, concurrency: int, delay_ms: float) -> list[dict[str, float | str]]:
+    server = start_stub_server(delay_ms)
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    pooled = OpenAILLMClient(api_key="stub", model="stub", max_tokens=16, base_url=base_url, http2=False)
+    try:
+        return [
+            await _run("per-request", lambda: _per_request_client(base_url), requests, concurrency),
+            await _run("pooled", lambda: pooled.generate("ping"), requests, concurrency),
+        ]
+    finally:
+        await pooled.aclose()
+        server.shutdown()
+
+
+async def _naive_retry(client: OpenAILLMClient, attempts: int = 20) -> None:
+    # Retry 429s immediately, as a client without a limiter tends to.
+    for attempt in range(attempts):
+        try:
+            await client.generate("ping")
+            return
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != 429 or attempt == attempts - 1:
+                raise
+
+
+async def _run_throttled(label: str, call, requests: int, concurrency: int) -> dict[str, float | str]:
+    gate = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def one() -> None:
+        nonlocal failures
+        async with gate:
+            try:
+                await call()
+            except Exception:
+                failures += 1
+
+    _StubHandler.throttled = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "client": label,
+        "ok_per_s": (requests - failures) / elapsed,
+        "failed": failures,
+        "provider_429s": _StubHandler.throttled,
+        "elapsed_s": elapsed,
+    }
+
+
+async def benchmark_throttled(
+    requests: int, concurrency: int, delay_ms: float, quota_rps: float
+) -> list[dict[str, float | str]]:
+    server = start_stub_server(delay_ms)
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    client = OpenAILLMClient(api_key="stub", model="stub", max_tokens=16, base_url=base_url, http2=False)
+    limited = RateLimitedLLMClient(
+        client,
+        LLMRateLimiter(requests_per_minute=quota_rps * 60 * 0.95, max_concurrency=concurrency),
+        max_tokens=16,
+    )
+    rows = []
+    try:
+        for label, call in (("naive-retry", lambda: _naive_retry(client)), ("limiter", lambda: limited.generate("ping"))):
+            await asyncio.sleep(1.1)  # let the stub's quota refill between runs
+            _StubHandler.quota_rps = quota_rps
+            rows.append(await _run_throttled(label, call, requests, concurrency))
+            _StubHandler.quota_rps = 0
+        return rows
+    finally:
+        await client.aclose()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Simulated model time per request")
+    parser.add_argument("--quota-rps", type=float, default=0.0, help="Throttle the stub to this many requests/s")
+    parser.add_argument("--json", action="store_true", help="Emit JSON output")
+    args = parser.parse_args()
+
+    if args.quota_rps:
+        rows = asyncio.run(benchmark_throttled(args.requests, args.concurrency, args.delay_ms, args.quota_rps))
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return
+        print(f"{'client':<12} {'ok/s':>8} {'failed':>7} {'429s':>7} {'secs':>6}")
+        for row in rows:
+            print(
+                f"{row['client']:<12} {row['ok_per_s']:>8.1f} {row['failed']:>7} "
+                f"{row['provider_429s']:>7} {row['elapsed_s']:>6.1f}"
+            )
+        return
+
+    rows = asyncio.run(benchmark(args.requests, args.concurrency, args.delay_ms))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'client':<12} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'req/s':>8} {'conns':>6}")
+    for row in rows:
+        print(
+            f"{row['client']:<12} {row['mean_ms']:>8.2f} {row['p50_ms']:>8.2f} "
+            f"{row['p95_ms']:>8.2f} {row['req_per_s']:>8.0f} {row['connections']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,12 @@ import json
 import os
 import sys
 import time
+import urllib.request
 from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
 from textwrap import shorten
-from typing import Any
+from typing import Any, Iterator
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 os.environ.setdefault("LAB_ROOT", str(REPO_ROOT))
@@ -20,8 +22,10 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from playground.backend.app.config import get_settings
-from playground.backend.app.schemas import ArtifactCreate, TailLogEntryCreate
-from playground.backend.app.services.data_store import data_store_context
+from playground.backend.app.schemas import ArtifactCreate, ArtifactImport, TailLogEntryCreate, TailLogEntryImport
+from playground.backend.app.services.data_store import PageCursor, TailLogRecord, data_store_context
+
+DEFAULT_API_URL = os.environ.get("PLAYGROUND_API_URL", "http://localhost:8000")
 
 
 # -----------------------------------------------------------------------------
@@ -101,6 +105,62 @@ def _format_tail_entry(entry) -> str:
     return f"{entry.created_at.isoformat()} · {entry.source:<10} · {message}"
 
 
+def _stream_tail_log(api_url: str, last_event_id: str | None) -> Iterator[TailLogRecord]:
+    """Yield entries from ``/api/tail-log/stream``, resuming after dropped connections.
+
+    Raises ``OSError`` if the first connection fails so callers can fall back
+    to polling the store directly.
+    """
+
+    url = f"{api_url.rstrip('/')}/api/tail-log/stream"
+    connected = False
+    while True:
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            # The server sends a keep-alive comment well inside this timeout.
+            with urllib.request.urlopen(request, timeout=60) as response:
+                connected = True
+                event_id = data = None
+                for raw in response:
+                    line = raw.decode("utf-8").rstrip("\r\n")
+                    if line.startswith("id: "):
+                        event_id = line[4:]
+                    elif line.startswith("data: "):
+                        data = line[6:]
+                    elif not line and data is not None:
+                        last_event_id = event_id or last_event_id
+                        payload = json.loads(data)
+                        payload["created_at"] = datetime.fromisoformat(payload["created_at"])
+                        yield TailLogRecord(**payload)
+                        event_id = data = None
+        except OSError:  # URLError, HTTPError and socket timeouts included
+            if not connected:
+                raise
+        time.sleep(2)
+
+
+def _poll_tail_log(args: argparse.Namespace, printed: list[str]) -> None:
+    buffer_size = max(args.limit * 4, 50)
+    seen_order = deque(printed, maxlen=buffer_size)
+    seen = set(seen_order)
+    while True:
+        with data_store_context() as store:
+            entries = store.list_tail_log(limit=args.limit)
+        for entry in reversed(entries):
+            if entry.id in seen:
+                continue
+            print(_format_tail_entry(entry), flush=True)
+            seen.add(entry.id)
+            seen_order.append(entry.id)
+        while len(seen) > len(seen_order):
+            expired = seen_order.popleft()
+            seen.discard(expired)
+        time.sleep(args.interval)
+
+
 def cmd_tail_log(args: argparse.Namespace) -> None:
     def _emit(entries):
         payload = [_tail_log_to_dict(item) for item in entries]
@@ -113,30 +173,25 @@ def cmd_tail_log(args: argparse.Namespace) -> None:
     if args.follow and args.json:
         raise SystemExit("--follow cannot be combined with --json")
 
-    if args.follow:
-        buffer_size = max(args.limit * 4, 50)
-        seen_order = deque(maxlen=buffer_size)
-        seen = set()
-        try:
-            while True:
-                with data_store_context() as store:
-                    entries = store.list_tail_log(limit=args.limit)
-                for entry in reversed(entries):
-                    if entry.id in seen:
-                        continue
-                    print(_format_tail_entry(entry), flush=True)
-                    seen.add(entry.id)
-                    seen_order.append(entry.id)
-                while len(seen) > len(seen_order):
-                    expired = seen_order.popleft()
-                    seen.discard(expired)
-                time.sleep(args.interval)
-        except KeyboardInterrupt:
-            return
-    else:
-        with data_store_context() as store:
-            entries = store.list_tail_log(limit=args.limit)
+    with data_store_context() as store:
+        entries = store.list_tail_log(limit=args.limit)
+    if not args.follow:
         _emit(entries)
+        return
+
+    for entry in reversed(entries):
+        print(_format_tail_entry(entry), flush=True)
+    # Resume the stream right after the newest line printed, so nothing is missed in between.
+    last_event_id = PageCursor.after(entries[0]).encode() if entries else None
+    try:
+        try:
+            for entry in _stream_tail_log(args.api_url, last_event_id):
+                print(_format_tail_entry(entry), flush=True)
+        except OSError as exc:
+            print(f"Tail-log stream unavailable at {args.api_url} ({exc}); polling every {args.interval}s", file=sys.stderr)
+            _poll_tail_log(args, [entry.id for entry in reversed(entries)])
+    except KeyboardInterrupt:
+        return
 
 
 def cmd_tail_log_add(args: argparse.Namespace) -> None:
@@ -150,6 +205,44 @@ def cmd_tail_log_add(args: argparse.Namespace) -> None:
         print(f"Logged '{entry.message}' from {entry.source}")
 
 
+def _read_rows(path: Path) -> list[dict[str, Any]]:
+    text = path.read_text(encoding="utf-8")
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def _interaction_kwargs(row: dict[str, Any]) -> dict[str, Any]:
+    # Accept both ``record_interaction`` kwargs and the ``interactions --json`` export shape.
+    return {
+        "id": row.get("id"),
+        "prompt": row.get("prompt", row.get("user_prompt_text")),
+        "metadata": row.get("metadata", row.get("typing_metadata_json")),
+        "llm_text": row.get("llm_text", row.get("ai_response_text")),
+        "model_name": row.get("model_name", "unknown"),
+        "latency_ms": row.get("latency_ms", 0),
+        "first_token_ms": row.get("first_token_ms"),
+        "created_at": row.get("created_at"),
+    }
+
+
+def cmd_import(args: argparse.Namespace) -> None:
+    rows = _read_rows(Path(args.path))
+    imported = 0
+    with data_store_context() as store:
+        for start in range(0, len(rows), args.batch_size):
+            batch = rows[start : start + args.batch_size]
+            if args.kind == "interactions":
+                imported += len(store.record_interactions_bulk(_interaction_kwargs(row) for row in batch))
+            elif args.kind == "artifacts":
+                payloads = [ArtifactImport.model_validate(row) for row in batch]
+                imported += len(store.create_artifacts_bulk(payloads))
+            else:
+                payloads = [TailLogEntryImport.model_validate(row) for row in batch]
+                imported += len(store.create_tail_log_entries_bulk(payloads))
+    print(f"Imported {imported} {args.kind} from {args.path}")
+
+
 def cmd_summary(_: argparse.Namespace) -> None:
     with data_store_context() as store:
         interactions = store.count_interactions()
@@ -198,13 +291,18 @@ def build_parser() -> argparse.ArgumentParser:
     tail_log_cmd.add_argument(
         "--follow",
         action="store_true",
-        help="Continuously poll for new entries and stream them to stdout",
+        help="Stream new entries from the API's tail-log SSE endpoint to stdout",
+    )
+    tail_log_cmd.add_argument(
+        "--api-url",
+        default=DEFAULT_API_URL,
+        help="Backend serving /api/tail-log/stream (default: $PLAYGROUND_API_URL or http://localhost:8000)",
     )
     tail_log_cmd.add_argument(
         "--interval",
         type=float,
         default=5.0,
-        help="Polling interval in seconds when using --follow",
+        help="Polling interval in seconds if --follow cannot reach the API",
     )
     tail_log_cmd.set_defaults(func=cmd_tail_log)
 
@@ -214,6 +312,12 @@ def build_parser() -> argparse.ArgumentParser:
     tail_log_add_cmd.add_argument("--json", action="store_true")
     tail_log_add_cmd.set_defaults(func=cmd_tail_log_add)
 
+    import_cmd = sub.add_parser("import", help="Bulk-load records from a JSON array or JSONL file")
+    import_cmd.add_argument("kind", choices=("interactions", "artifacts", "tail-log"))
+    import_cmd.add_argument("path", help="File produced by the matching --json listing, or JSONL")
+    import_cmd.add_argument("--batch-size", type=int, default=5000, help="Records written per bulk call")
+    import_cmd.set_defaults(func=cmd_import)
+
     summary_cmd = sub.add_parser("summary", help="Show provider + basic counts")
     summary_cmd.set_defaults(func=cmd_summary)
 
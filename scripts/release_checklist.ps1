@@ -25,7 +25,7 @@ try {
     if (-not $SkipTelemetry) {
         Write-Host "[release] Hydrating search telemetry ledger" -ForegroundColor Cyan
         python -m scripts.search_telemetry ingest --log-path logs/search-history.jsonl --output data/search_telemetry.json `
-            --runs-parquet data/search_telemetry-runs.parquet `
+            --runs-parquet data/search_telemetry-runs-parquet `
             --daily-parquet data/search_telemetry-daily.parquet
         if ($LASTEXITCODE -ne 0) {
             throw "Search telemetry ingestion failed with exit code $LASTEXITCODE"
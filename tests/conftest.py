@@ -0,0 +1,5 @@
+"""Repository-level fixtures shared by the root test suite."""
+
+from __future__ import annotations
+
+from tests.utils.tail_log import isolated_tail_log  # noqa: F401
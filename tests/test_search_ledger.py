@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import gzip
 import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -55,7 +60,357 @@ def test_ingest_search_history_writes_parquet(tmp_path: Path) -> None:
     assert daily_parquet.exists()
 
     runs_table = pq.read_table(runs_parquet)
-    assert runs_table.num_rows == len(summary.get("runs", []))
+    assert runs_table.num_rows == summary["total_runs"]
 
     daily_table = pq.read_table(daily_parquet)
     assert daily_table.num_rows == len(summary.get("daily_metrics", []))
+
+
+@pytest.mark.skipif(pq is None, reason="pyarrow not installed")
+def test_runs_parquet_dataset_only_rewrites_changed_days(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    summary_path = tmp_path / "summary.json"
+    dataset = tmp_path / "runs-dataset"
+    _append_entries(log_path, [_sample_entry(day) for day in (1, 1, 2)])
+    search_ledger.ingest_search_history(
+        log_path, summary_path, runs_parquet_path=dataset, emit_tail_log=False, incremental=True
+    )
+    first_day = dataset / "event_date=2025-11-01" / "runs.parquet"
+    first_written = first_day.stat().st_mtime_ns
+
+    _append_entries(log_path, [_sample_entry(2, preset="fixme-scan"), _sample_entry(3)])
+    summary = search_ledger.ingest_search_history(
+        log_path,
+        summary_path,
+        runs_parquet_path=dataset,
+        parquet_batch_size=1,
+        emit_tail_log=False,
+        incremental=True,
+    )
+
+    assert first_day.stat().st_mtime_ns == first_written
+    assert pq.ParquetFile(dataset / "event_date=2025-11-02" / "runs.parquet").metadata.num_row_groups == 2
+    table = pq.read_table(dataset)
+    assert table.num_rows == summary["total_runs"]
+    assert str(table.schema.field("timestamp").type) == "timestamp[ms, tz=UTC]"
+    assert table.schema.field("preset").type.value_type == "string"
+
+    # A full rebuild whose day partition keeps its byte size still re-exports that day.
+    log_path.write_text("", encoding="utf-8")
+    _append_entries(log_path, [_sample_entry(1, preset="odot-scan") for _ in range(2)])
+    search_ledger.ingest_search_history(log_path, summary_path, runs_parquet_path=dataset, emit_tail_log=False)
+    assert pq.read_table(first_day).column("preset").to_pylist() == ["odot-scan", "odot-scan"]
+
+
+def test_runs_parquet_flag_defaults_to_the_incremental_dataset() -> None:
+    parser = search_ledger._build_parser()
+
+    bare = parser.parse_args(["ingest", "--runs-parquet"])
+    assert bare.runs_parquet == search_ledger.DEFAULT_RUNS_PARQUET_PATH
+    assert search_ledger.DEFAULT_RUNS_PARQUET_PATH.suffix != ".parquet"
+    assert parser.parse_args(["ingest"]).runs_parquet is None
+
+
+def _sample_entry(day: int, *, preset: str = "todo-scan", matches: int = 1) -> dict:
+    return {
+        "timestamp": f"2025-11-{day:02d}T12:00:00Z",
+        "pattern": "TODO",
+        "preset": preset,
+        "filesScanned": 10,
+        "matches": matches,
+        "durationMs": 100 + day,
+    }
+
+
+def _append_entries(path: Path, entries: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        for entry in entries:
+            handle.write(json.dumps(entry) + "\n")
+
+
+def _comparable(summary: dict) -> dict:
+    return {key: value for key, value in summary.items() if key not in {"generated_at", "metadata", "runs_last_24h"}}
+
+
+def test_incremental_ingest_folds_appended_tail(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    summary_path = tmp_path / "summary.json"
+    _append_entries(log_path, [_sample_entry(day) for day in range(1, 6)])
+
+    first = search_ledger.ingest_search_history(
+        log_path, summary_path, lookback=4, emit_tail_log=False, incremental=True
+    )
+    assert first["metadata"]["ingest"]["mode"] == "rebuild"
+
+    _append_entries(log_path, [_sample_entry(day, matches=0) for day in range(6, 10)])
+    second = search_ledger.ingest_search_history(
+        log_path, summary_path, lookback=4, emit_tail_log=False, incremental=True
+    )
+    assert second["metadata"]["ingest"] == {
+        "mode": "incremental",
+        "appended_runs": 4,
+        "offset": log_path.stat().st_size,
+    }
+
+    full = search_ledger.ingest_search_history(
+        log_path, tmp_path / "full.json", lookback=4, emit_tail_log=False
+    )
+    assert _comparable(second) == _comparable(full)
+
+
+def test_incremental_ingest_rebuilds_after_truncation(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    summary_path = tmp_path / "summary.json"
+    _append_entries(log_path, [_sample_entry(day) for day in range(1, 6)])
+    search_ledger.ingest_search_history(log_path, summary_path, emit_tail_log=False, incremental=True)
+
+    log_path.unlink()
+    _append_entries(log_path, [_sample_entry(day, preset="fixme-scan") for day in range(10, 12)])
+    summary = search_ledger.ingest_search_history(
+        log_path, summary_path, emit_tail_log=False, incremental=True
+    )
+
+    assert summary["metadata"]["ingest"]["mode"] == "rebuild"
+    assert summary["total_runs"] == 2
+    assert [entry["preset"] for entry in summary["preset_drift"]] == ["fixme-scan"]
+
+
+def test_sharded_ingest_merges_rotated_logs_in_order(tmp_path: Path) -> None:
+    logs = tmp_path / "logs"
+    rotations = {
+        "history.jsonl.2.gz": [_sample_entry(day, preset="fixme-scan") for day in range(1, 6)],
+        "history.jsonl.1": [_sample_entry(day, matches=day % 2) for day in range(5, 12)],
+        "history.jsonl": [_sample_entry(day, matches=0) for day in range(11, 15)],
+    }
+    logs.mkdir()
+    for name, entries in rotations.items():
+        payload = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+        (logs / name).write_bytes(gzip.compress(payload) if name.endswith(".gz") else payload)
+    _append_entries(tmp_path / "serial.jsonl", [entry for entries in rotations.values() for entry in entries])
+
+    sharded = search_ledger.ingest_search_history(
+        logs / "history.jsonl*", tmp_path / "sharded.json", lookback=4, workers=2, emit_tail_log=False
+    )
+    serial = search_ledger.ingest_search_history(
+        tmp_path / "serial.jsonl", tmp_path / "serial.json", lookback=4, emit_tail_log=False
+    )
+
+    assert [Path(shard).name for shard in sharded["metadata"]["ingest"]["shards"]] == list(rotations)
+    for key in ("total_runs", "runs_with_matches", "top_patterns", "preset_drift", "preset_drift_windows"):
+        assert sharded[key] == serial[key]
+    assert search_ledger.load_runs(tmp_path / "sharded.json") == search_ledger.load_runs(tmp_path / "serial.json")
+
+    with pytest.raises(ValueError):
+        search_ledger.ingest_search_history(
+            logs / "history.jsonl*", tmp_path / "sharded.json", incremental=True, emit_tail_log=False
+        )
+
+
+def test_log_reader_streams_and_defers_partial_tail(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    _append_entries(log_path, [_sample_entry(1), _sample_entry(2)])
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("not json\n")
+        handle.write('{"timestamp": "2025-11-03T12:00:00Z", "matc')
+    complete_size = log_path.stat().st_size - len('{"timestamp": "2025-11-03T12:00:00Z", "matc')
+
+    reader = search_ledger._LogReader(log_path)
+    stream = iter(reader)
+    assert next(stream)["timestamp"] == "2025-11-01T12:00:00Z"
+    assert reader.entries == 1
+    assert len(list(stream)) == 1
+    assert reader.offset == complete_size
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write('hes": 2}\n')
+    resumed = search_ledger._LogReader(log_path, reader.offset)
+    assert [entry["matches"] for entry in resumed] == [2]
+    assert resumed.offset == log_path.stat().st_size
+
+
+def test_run_table_matches_record_aggregations() -> None:
+    runs = [
+        search_ledger._normalize_run(_sample_entry(day, preset=preset, matches=day % 3))
+        for day in range(1, 20)
+        for preset in ("todo-scan", "fixme-scan", "")
+    ]
+    table = search_ledger.RunTable.from_runs(runs)
+
+    assert len(table) == len(runs)
+    assert table.row(0) == runs[0]
+    assert search_ledger._aggregate_daily_metrics(table) == search_ledger._aggregate_daily_metrics(runs)
+    assert search_ledger._compute_preset_drift(
+        table, lookback=5, preset_tags={}
+    ) == search_ledger._compute_preset_drift(runs, lookback=5, preset_tags={})
+
+
+def test_preset_drift_windows_cover_counts_and_spans(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    summary_path = tmp_path / "summary.json"
+    _append_entries(
+        log_path,
+        [_sample_entry(day, matches=1) for day in range(1, 21)]
+        + [_sample_entry(day, matches=0) for day in range(21, 29)],
+    )
+
+    summary = search_ledger.ingest_search_history(
+        log_path, summary_path, lookback=10, drift_windows=("5", "10", "3d"), emit_tail_log=False
+    )
+    windows = summary["preset_drift_windows"]
+    assert list(windows) == ["5", "10", "3d"]
+    assert windows["10"] == summary["preset_drift"]
+    assert windows["5"][0]["recent_runs"] == 5
+    assert windows["5"][0]["status"] == "regressing"
+
+    generated_at = search_ledger._normalize_timestamp(summary["generated_at"])
+    assert search_ledger.compute_preset_drift_windows(summary_path, windows=("5", "3d"), now=generated_at) == {
+        "5": windows["5"],
+        "3d": windows["3d"],
+    }
+
+    now = search_ledger._normalize_timestamp("2025-11-28T13:00:00Z")
+    saved = search_ledger.compute_preset_drift_windows(summary_path, windows=("5", "3d"), now=now)
+    assert saved["3d"][0]["recent_runs"] == 3
+    # "40" exceeds the kept samples, so every window is recomputed from the partitions.
+    rebuilt = search_ledger.compute_preset_drift_windows(summary_path, windows=("5", "3d", "40"), now=now)
+    assert rebuilt["5"] == saved["5"] and rebuilt["3d"] == saved["3d"]
+    assert rebuilt["40"][0]["recent_runs"] == 28
+
+    with pytest.raises(ValueError):
+        search_ledger._parse_drift_window("soon")
+
+
+def test_ingest_writes_small_summary_and_day_partitions(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    summary_path = tmp_path / "summary.json"
+    _append_entries(log_path, [_sample_entry(day) for day in (1, 1, 2, 3)])
+
+    summary = search_ledger.ingest_search_history(log_path, summary_path, emit_tail_log=False)
+
+    assert "runs" not in search_ledger.read_summary(summary_path)
+    store = search_ledger.RunStore.for_summary(summary_path)
+    assert summary["metadata"]["run_store"] == str(store.root)
+    assert store.partitions() == ["2025-11-01", "2025-11-02", "2025-11-03"]
+    assert len(search_ledger.load_runs(summary_path)) == 4
+
+    since = search_ledger._normalize_timestamp("2025-11-02T00:00:00Z")
+    recent = search_ledger.load_runs(summary_path, since=since)
+    assert [entry["timestamp"][:10] for entry in recent] == ["2025-11-02", "2025-11-03"]
+
+
+def test_incremental_ingest_discards_partition_appends_without_state(tmp_path: Path) -> None:
+    log_path = tmp_path / "history.jsonl"
+    summary_path = tmp_path / "summary.json"
+    _append_entries(log_path, [_sample_entry(1), _sample_entry(2)])
+    search_ledger.ingest_search_history(log_path, summary_path, emit_tail_log=False, incremental=True)
+
+    # Simulate an ingest that appended to a partition but crashed before saving state.
+    store = search_ledger.RunStore.for_summary(summary_path)
+    with store.partition_path("2025-11-02").open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"timestamp": "2025-11-02T13:00:00+00:00"}) + "\n")
+
+    _append_entries(log_path, [_sample_entry(3)])
+    summary = search_ledger.ingest_search_history(
+        log_path, summary_path, emit_tail_log=False, incremental=True
+    )
+
+    assert summary["metadata"]["ingest"]["mode"] == "incremental"
+    assert len(search_ledger.load_runs(summary_path)) == summary["total_runs"] == 3
+
+
+def test_load_runs_reads_legacy_embedded_summary(tmp_path: Path) -> None:
+    summary_path = tmp_path / "summary.json"
+    search_ledger.write_summary(
+        {"total_runs": 1, "runs": [{"timestamp": "2025-11-01T12:00:00+00:00", "matches": 2}]},
+        summary_path,
+    )
+
+    runs = search_ledger.load_runs(summary_path)
+
+    assert runs[0]["matches"] == 2
+    assert len(search_ledger.load_run_table(summary_path)) == 1
+
+
+def _legacy_db(path: Path, days: range) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS search_runs (timestamp TEXT, pattern TEXT, preset TEXT, "
+        "files_scanned INTEGER, matches INTEGER, duration_ms INTEGER)"
+    )
+    conn.executemany(
+        "INSERT INTO search_runs VALUES (?, ?, ?, ?, ?, ?)",
+        [(f"2025-11-{day:02d}T12:00:00Z", "TODO", "todo-scan", 10, day % 2, 100 + day) for day in days],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_migrate_from_sqlite_pages_and_resumes(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    summary_path = tmp_path / "summary.json"
+    _legacy_db(db_path, range(1, 8))
+    progress: list[tuple[int, int, int]] = []
+
+    first = search_ledger.migrate_from_sqlite(
+        db_path, summary_path, chunk_size=3, progress=lambda *args: progress.append(args), emit_tail_log=False
+    )
+    assert progress == [(3, 3, 7), (6, 6, 7), (7, 7, 7)]
+    assert first["metadata"]["ingest"] == {"mode": "migrate", "appended_runs": 7, "last_rowid": 7}
+
+    _legacy_db(db_path, range(8, 11))
+    resumed = search_ledger.migrate_from_sqlite(
+        db_path, summary_path, chunk_size=3, resume=True, emit_tail_log=False
+    )
+    assert resumed["metadata"]["ingest"] == {"mode": "resume", "appended_runs": 3, "last_rowid": 10}
+
+    full = search_ledger.migrate_from_sqlite(db_path, tmp_path / "full.json", emit_tail_log=False)
+    assert _comparable(resumed) == _comparable(full)
+    assert len(search_ledger.load_runs(summary_path)) == 10
+
+
+def test_tail_log_emitter_batches_through_one_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    opened: list[list[str]] = []
+
+    class _Store:
+        def __init__(self) -> None:
+            self.messages: list[str] = []
+            opened.append(self.messages)
+
+        def create_tail_log_entry(self, payload):
+            self.messages.append(payload.message)
+
+    @contextmanager
+    def fake_context():
+        yield _Store()
+
+    monkeypatch.setattr(search_ledger, "data_store_context", fake_context)
+    emitter = search_ledger._TailLogEmitter(batch_size=2)
+    for index in range(5):
+        emitter.emit(f"message {index}")
+    assert emitter.flush(timeout=5)
+    emitter.close()
+
+    assert opened == [[f"message {index}" for index in range(5)]]
+
+
+
+def test_tail_log_emitter_close_returns_when_the_backend_is_stuck(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    @contextmanager
+    def stuck_context():
+        release.wait()
+        yield None
+
+    monkeypatch.setattr(search_ledger, "data_store_context", stuck_context)
+    emitter = search_ledger._TailLogEmitter(max_pending=1)
+    emitter.emit("taken by the worker")
+    while emitter._queue.qsize():
+        time.sleep(0.01)
+    emitter.emit("fills the queue")
+
+    started = time.monotonic()
+    emitter.close(timeout=0.1)
+    assert time.monotonic() - started < 1.0
+    release.set()
@@ -78,4 +78,32 @@ def test_summary_includes_preset_drift(tmp_path: Path) -> None:
 
     fixme_entry = next(item for item in summary["preset_drift"] if item["preset"] == "fixme-scan")
     assert fixme_entry["status"] == "stable"
-    assert fixme_entry["match_rate_recent"] == fixme_entry["match_rate_lifetime"]
\ No newline at end of file
+    assert fixme_entry["match_rate_recent"] == fixme_entry["match_rate_lifetime"]
+
+def test_summary_is_cached_until_ledger_changes(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "logs" / "history.jsonl"
+    ledger_path = tmp_path / "telemetry.json"
+    tags_path = tmp_path / "tags.json"
+    tags_path.write_text(json.dumps({"preset_tags": {"todo-scan": ["docs"]}}))
+    entries = _build_sample_entries()
+    _write_entries(log_path, entries[:6])
+    telemetry.ingest_search_history(log_path, ledger_path, emit_tail_log=False)
+
+    first = get_search_telemetry_summary(db_path=ledger_path, preset_tags_path=tags_path)
+    assert first["total_runs"] == 6
+
+    from kitchen.telemetry import search_ledger
+
+    calls: list[Path] = []
+    original = search_ledger.read_summary
+    monkeypatch.setattr(search_ledger, "read_summary", lambda path: calls.append(path) or original(path))
+
+    assert get_search_telemetry_summary(db_path=ledger_path, preset_tags_path=tags_path) == first
+    assert calls == []
+
+    _write_entries(log_path, entries)
+    telemetry.ingest_search_history(log_path, ledger_path, emit_tail_log=False)
+
+    refreshed = get_search_telemetry_summary(db_path=ledger_path, preset_tags_path=tags_path)
+    assert refreshed["total_runs"] == 10
+    assert calls
@@ -0,0 +1,32 @@
+"""Keep search-ledger tail-log writes out of the tracked database during tests."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from kitchen.telemetry import search_ledger
+from playground.backend.app.services.data_store import JsonDataStore
+
+
+@pytest.fixture(autouse=True)
+def isolated_tail_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[JsonDataStore]:
+    """Give each test a fresh emitter writing into a JSON store under ``tmp_path``.
+
+    Import this fixture into a suite's ``conftest.py`` to apply it to every test there.
+    """
+
+    store = JsonDataStore(tmp_path / "tail_log_store.json")
+
+    @contextmanager
+    def tmp_data_store_context():
+        yield store
+
+    emitter = search_ledger._TailLogEmitter()
+    monkeypatch.setattr(search_ledger, "data_store_context", tmp_data_store_context)
+    monkeypatch.setattr(search_ledger, "_tail_log_emitter", emitter)
+    yield store
+    emitter.close()